@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Latency benchmark for notification sounds.
+
+Times rendering the tones with NumPy, loading them back from the WAV
+cache, scaling them to a new volume level, and the playback start latency: from a play_* call until the
+playback thread hands the cached buffer to the backend (the null
+backend, so the sound card is not part of the measurement).
+
+Usage:
+    python benchmarks/bench_audio.py [--runs 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Playback should start within this many milliseconds of being requested
+TARGET_MS = 10.0
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["HOME"] = tmp
+        from src.audio import SOUNDS, get_audio_manager
+        from src.config import get_config
+        from src.tones import ToneCache, synthesize
+
+        for name, tones in SOUNDS.items():
+            started = time.perf_counter()
+            synthesize(tones)
+            rendered = (time.perf_counter() - started) * 1000
+            cache_dir = Path(tmp) / "bench-sounds"
+            ToneCache(cache_dir).get(name, tones)
+            started = time.perf_counter()
+            ToneCache(cache_dir).get(name, tones)
+            loaded = (time.perf_counter() - started) * 1000
+            cache = ToneCache(cache_dir)
+            cache.get(name, tones)
+            started = time.perf_counter()
+            cache.get(name, tones, 0.35)
+            scaled = (time.perf_counter() - started) * 1000
+            print(f"{name}: render {rendered:.2f} ms, load from WAV cache {loaded:.2f} ms, "
+                  f"new volume {scaled:.2f} ms")
+
+        get_config().set("audio", "backend", "null")
+        audio = get_audio_manager()
+        audio.prepare()
+        latencies = []
+        for _ in range(args.runs):
+            audio.play_work_complete()
+            audio.drain()
+            latencies.append(audio.last_latency * 1000)
+        median = statistics.median(latencies)
+        print(f"Playback start latency: median {median:.3f} ms, max {max(latencies):.3f} ms "
+              f"({'within' if median < TARGET_MS else 'over'} the {TARGET_MS:.0f} ms target)")
+        # Write the config before the temporary home is removed
+        get_config().flush()
+
+
+if __name__ == "__main__":
+    main()
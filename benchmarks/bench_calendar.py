@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Replanning benchmark for calendar-aware pomodoro planning.
+
+Writes a synthetic calendar of recurring meetings, then times parsing it,
+expanding a day into an interval tree, the conflict check run when a
+session starts and the full replan run after every completed session.
+
+Usage:
+    python benchmarks/bench_calendar.py [--events 5000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.planner import Calendar, day_bounds, fit_work, plan_day  # noqa: E402
+
+RULES = (
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=MONTHLY;BYDAY=1TH",
+    "FREQ=MONTHLY;BYMONTHDAY=15",
+)
+
+
+def write_calendar(path: Path, events: int) -> None:
+    """Write a calendar of recurring meetings starting over the past years."""
+    rng = random.Random(42)
+    first = date.today() - timedelta(days=3 * 365)
+    lines = ["BEGIN:VCALENDAR"]
+    for number in range(events):
+        day = first + timedelta(days=rng.randrange(3 * 365))
+        hour, minute = rng.randint(8, 17), rng.choice((0, 15, 30, 45))
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:event-{number}",
+            f"DTSTART;TZID=Europe/Berlin:{day:%Y%m%d}T{hour:02d}{minute:02d}00",
+            f"DURATION:PT{rng.choice((15, 30, 45, 60))}M",
+            f"RRULE:{rng.choice(RULES)}",
+            f"SUMMARY:Meeting {number}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    path.write_text("\r\n".join(lines), encoding="utf-8")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "calendar.ics"
+        write_calendar(path, args.events)
+        calendar = Calendar(path)
+        today = date.today()
+
+        started = time.perf_counter()
+        tree = calendar.busy(today)
+        print(f"Parsed {args.events} recurring events, {len(tree)} meetings today: "
+              f"{(time.perf_counter() - started) * 1000:.0f} ms")
+
+        start, end = day_bounds(today)
+        checks = []
+        for minute in range(0, 24 * 60, 5):
+            moment = start + minute * 60
+            began = time.perf_counter()
+            tree = calendar.cached(today)
+            fit_work(tree, moment, 1500)
+            checks.append((time.perf_counter() - began) * 1e6)
+        print(f"Session start check (UI thread): median {statistics.median(checks):.1f} us, max {max(checks):.1f} us")
+
+        began = time.perf_counter()
+        blocks = plan_day(tree, start + 8 * 3600, start + 18 * 3600, 1500, 300, 900, 4)
+        print(f"Full day replan: {(time.perf_counter() - began) * 1e6:.0f} us, {len(blocks)} blocks")
+
+
+if __name__ == "__main__":
+    main()
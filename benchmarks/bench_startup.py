@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+Startup benchmark for the command line subcommands.
+
+Builds a synthetic history in a temporary home directory, then times cold
+runs of `main.py stats` (a fresh interpreter each time) against the bare
+interpreter startup, and the time a fresh interpreter takes to load the
+configuration with and without the parsed-config snapshot.
+
+Usage:
+    python benchmarks/bench_startup.py [--days 365] [--per-day 12] [--runs 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def build_history(home: Path, days: int, per_day: int) -> int:
+    """Create a synthetic history and fresh rollups under a home directory."""
+    os.environ["HOME"] = str(home)
+    from src.history import HistoryStore, make_session_record, month_key
+    from src.stats import Rollups
+
+    store = HistoryStore(home / ".pomodoro-tui" / "history")
+    months = defaultdict(list)
+    now = time.time()
+    for day in range(days):
+        for slot in range(per_day):
+            start = now - day * 86400 - slot * 1800
+            kind = "WORK" if slot % 2 == 0 else "SHORT_BREAK"
+            months[month_key(start)].append(make_session_record(kind, start, 1500, 1500, True))
+    for key, records in months.items():
+        store.bulk_load(key, records)
+    Rollups(store).ensure_fresh()
+    return sum(len(records) for records in months.values())
+
+
+def time_command(args: list, env: dict, runs: int) -> list:
+    """Time cold runs of a command in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+CONFIG_LOAD = (
+    "import time; started = time.perf_counter(); "
+    "from src.config import get_config; get_config(); "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def time_config_load(home: Path, env: dict, runs: int, cached: bool) -> list:
+    """Time loading the configuration in fresh interpreters, in milliseconds."""
+    from src.utils.constants import CONFIG_CACHE_FILE
+
+    timings = []
+    for _ in range(runs):
+        if not cached:
+            (home / ".pomodoro-tui" / CONFIG_CACHE_FILE).unlink(missing_ok=True)
+        output = subprocess.run(
+            [sys.executable, "-c", CONFIG_LOAD], env=env, cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.split()[-1]))
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--per-day", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        sessions = build_history(home, args.days, args.per_day)
+        env = dict(os.environ, HOME=str(home))
+        commands = {
+            "python (baseline)": [sys.executable, "-c", "pass"],
+            "main.py stats": [sys.executable, "main.py", "stats"],
+            "main.py stats --week": [sys.executable, "main.py", "stats", "--week"],
+        }
+        print(f"{sessions} sessions over {args.days} days, {args.runs} cold runs each")
+        for name, command in commands.items():
+            timings = time_command(command, env, args.runs)
+            print(
+                f"  {name:<24} min {min(timings):6.1f} ms  "
+                f"median {statistics.median(timings):6.1f} ms"
+            )
+
+        # Write the config file once so both runs below find it
+        subprocess.run([sys.executable, "-c", CONFIG_LOAD], env=env, cwd=ROOT, capture_output=True, check=True)
+        print("Config load (import + get_config) in a fresh interpreter")
+        for name, cached in (("TOML parse", False), ("cached snapshot", True)):
+            timings = time_config_load(home, env, args.runs, cached)
+            print(
+                f"  {name:<24} min {min(timings):6.1f} ms  "
+                f"median {statistics.median(timings):6.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Keystroke latency benchmark for the task picker's fuzzy search.
+
+Indexes synthetic task titles, then types a few queries one character at
+a time (and backspaces them away again), timing every search the picker
+would run.
+
+Usage:
+    python benchmarks/bench_task_search.py [--tasks 50000]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.task_index import TaskIndex  # noqa: E402
+
+WORDS = (
+    "fix update review write refactor test deploy draft plan research api client server "
+    "login page docs report budget invoice meeting notes email design database migration "
+    "cache search index parser config release bug issue feature backend frontend mobile "
+    "onboarding payment export import sync chart dashboard profile settings audit"
+).split()
+
+QUERIES = ("fix login", "rvw docs", "dbmig", "e", "payment export bug", "zzq")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    index = TaskIndex()
+    started = time.perf_counter()
+    for number in range(args.tasks):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+        index.add(f"task-{number}", f"{title} #{number}")
+    print(f"Indexed {args.tasks} tasks in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    timings = []
+    for query in QUERIES:
+        keystrokes = [query[:end] for end in range(1, len(query) + 1)]
+        for typed in keystrokes + keystrokes[-2::-1]:
+            started = time.perf_counter()
+            index.search(typed, limit=50)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    print(
+        f"{len(timings)} keystrokes: median {statistics.median(timings):.2f} ms, "
+        f"p95 {timings[int(len(timings) * 0.95)]:.2f} ms, max {timings[-1]:.2f} ms"
+    )
+
+    started = time.perf_counter()
+    index.add("task-0", "renamed task")
+    index.remove("task-1")
+    print(f"Rename + delete: {(time.perf_counter() - started) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,12 +11,15 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from src.app import run
+from src.cli import main
 
 
 if __name__ == "__main__":
     try:
-        run()
+        sys.exit(main())
+    except BrokenPipeError:
+        # Output piped into a command that exited early (e.g. head)
+        sys.exit(0)
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
         print("\n\nGoodbye! 👋")
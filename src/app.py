@@ -1,24 +1,37 @@
 """
 Main Textual application for the Pomodoro TUI.
 """
+import time
 from pathlib import Path
+from typing import Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal, Center
-from textual.widgets import Header, Static, Button
-from datetime import datetime
+from textual.widgets import Header, Static, Button, Input
+from datetime import date, datetime, timedelta
 from textual.binding import Binding
+from rich.markup import escape
 
 from src.config import get_config
+from src.config_schema import PROFILE_TIMER_KEYS, Settings
 from src.timer import PomodoroTimer, TimerState
-from src.utils.helpers import minutes_to_seconds
 from src.audio import get_audio_manager
+from src.history import get_history_store, make_session_record
+from src.stats import get_rollups
 from src.components.timer_display import TimerDisplay
 from src.components.theme_picker import ThemePicker
 from src.components.settings_panel import SettingsPanel
 from src.components.help_screen import HelpScreen
+from src.components.history_browser import HistoryBrowser
+from src.components.stats_screen import StatsScreen
+from src.components.task_picker import TaskPicker
+from src.interval_tree import IntervalTree
+from src.tasks import get_task_store
+from src.planner import Calendar, Meeting, clock_time, day_bounds, fit_work, plan_day
 from src.theme_manager import get_theme_manager
 from src.utils.constants import (
     APP_NAME,
+    CALENDAR_POLL_INTERVAL,
+    CONFIG_POLL_INTERVAL,
     STATE_IDLE,
     STATE_WORK,
     STATE_PAUSED,
@@ -50,6 +63,38 @@ class SessionCounter(Static):
             self.update(f"[bold]Session {current} of {total}[/bold] before long break")
 
 
+class GoalStatus(Static):
+    """Widget displaying progress towards the pomodoro goals and the streak."""
+
+    def update_goals(
+        self,
+        today: int,
+        daily_goal: int,
+        week: int,
+        weekly_goal: int,
+        streak: int,
+        longest: int,
+    ) -> None:
+        """
+        Update the goal display.
+
+        Args:
+            today: Pomodoros completed today
+            daily_goal: Daily pomodoro goal
+            week: Pomodoros completed this week
+            weekly_goal: Weekly pomodoro goal
+            streak: Current streak in days
+            longest: Longest streak in days
+        """
+        day_mark = "✓" if today >= daily_goal else ""
+        week_mark = "✓" if week >= weekly_goal else ""
+        self.update(
+            f"Today [bold]{today}/{daily_goal}[/bold]{day_mark}  •  "
+            f"Week [bold]{week}/{weekly_goal}[/bold]{week_mark}  •  "
+            f"🔥 [bold]{streak}[/bold] day streak (best {longest})"
+        )
+
+
 class PomodoroApp(App):
     """Main Pomodoro TUI application."""
 
@@ -100,12 +145,31 @@ class PomodoroApp(App):
         margin-top: 1;
     }
 
-    SessionCounter {
+    #counter-row {
         width: 100%;
-        text-align: center;
+        height: auto;
         margin: 1 0;
     }
 
+    SessionCounter {
+        width: 1fr;
+    }
+
+    GoalStatus {
+        width: auto;
+        color: $text-muted;
+    }
+
+    #tag-input {
+        width: 100%;
+    }
+
+    #task-label {
+        width: 100%;
+        color: $text-muted;
+        padding: 0 1;
+    }
+
     #control-buttons {
         width: 100%;
         height: auto;
@@ -153,29 +217,52 @@ class PomodoroApp(App):
         Binding("q", "quit", "Quit", priority=True),
         Binding("question_mark", "help", "Help"),
         Binding("c", "config", "Settings"),
+        Binding("h", "history", "History"),
+        Binding("i", "stats", "Stats"),
+        Binding("g", "focus_tag", "Tag"),
+        Binding("a", "pick_task", "Task"),
+        Binding("p", "next_profile", "Profile"),
     ]
 
+    # Priority actions bound to printable keys, disabled while typing a tag
+    TEXT_ENTRY_BLOCKED_ACTIONS = {"toggle_timer", "toggle_theme_picker", "quit"}
+
     TITLE = APP_NAME
 
+    # Keep keyboard shortcuts working at startup instead of typing a tag
+    AUTO_FOCUS = "#btn-start"
+
     def __init__(self):
         """Initialize the application."""
         super().__init__()
         self.config = get_config()
         self.theme_manager = get_theme_manager()
         self.audio_manager = get_audio_manager()
+        self.history = get_history_store()
+        self.rollups = get_rollups()
+        self.tasks = get_task_store()
+        settings = self.config.settings
+        ics_path = settings.calendar.ics_path
+        self.calendar: Optional[Calendar] = Calendar(Path(ics_path)) if ics_path else None
         self._initial_theme_loaded = False
 
-        # Initialize timer with config values
-        work_duration = self.config.get("timer", "work_duration", 25)
-        short_break = self.config.get("timer", "short_break_duration", 5)
-        long_break = self.config.get("timer", "long_break_duration", 15)
-        pomodoros_until_long = self.config.get("timer", "pomodoros_until_long_break", 4)
+        # Session history tracking
+        self._session_started_at: Optional[float] = None
+        self._session_pauses = 0
+        self._session_paused_seconds = 0.0
+        self._paused_at: Optional[float] = None
+        self._session_tag: Optional[str] = None
+        self._session_task: Optional[str] = None
 
+        # Task the next work sessions are attached to
+        self._task_id: Optional[str] = None
+
+        # Initialize timer with config values
         self.timer = PomodoroTimer(
-            work_duration=work_duration,
-            short_break_duration=short_break,
-            long_break_duration=long_break,
-            pomodoros_until_long_break=pomodoros_until_long,
+            work_duration=settings.timer.work_duration,
+            short_break_duration=settings.timer.short_break_duration,
+            long_break_duration=settings.timer.long_break_duration,
+            pomodoros_until_long_break=settings.timer.pomodoros_until_long_break,
         )
 
         # Register timer callbacks
@@ -195,7 +282,7 @@ class PomodoroApp(App):
         }
 
         # Load initial theme using Textual's built-in system
-        theme_id = self.config.get("appearance", "theme", "pomodoro-default")
+        theme_id = settings.appearance.theme
         textual_theme = self.theme_map.get(theme_id, "textual-dark")
         self.theme = textual_theme
         self.theme_manager.set_current_theme(theme_id)
@@ -206,7 +293,13 @@ class PomodoroApp(App):
         yield Header()
         yield Container(
             TimerDisplay(id="timer-display"),
-            SessionCounter(id="session-counter"),
+            Horizontal(
+                SessionCounter(id="session-counter"),
+                GoalStatus(id="goal-status"),
+                id="counter-row",
+            ),
+            Input(placeholder="Project or task tag (optional)", id="tag-input"),
+            Static("", id="task-label"),
             Horizontal(
                 Button("Start", id="btn-start", variant="success"),
                 Button("Pause", id="btn-pause", variant="primary"),
@@ -216,7 +309,8 @@ class PomodoroApp(App):
             ),
             Static(
                 "[dim]Space[/dim] Start/Pause  •  [dim]S[/dim] Stop  •  "
-                "[dim]N[/dim] Skip  •  [dim]T[/dim] Theme  •  [dim]Q[/dim] Quit",
+                "[dim]N[/dim] Skip  •  [dim]G[/dim] Tag  •  [dim]A[/dim] Task  •  [dim]P[/dim] Profile  •  [dim]H[/dim] History  •  "
+                "[dim]T[/dim] Theme  •  [dim]Q[/dim] Quit",
                 id="help-text"
             ),
             id="main-container"
@@ -227,15 +321,72 @@ class PomodoroApp(App):
         """Called when app is mounted."""
         # Load configuration
         self.config.load()
+        # Failed background writes are shown instead of printed over the UI
+        self.config.on_write_error = self._on_config_write_error
 
         # Initialize display
         self._update_timer_display()
         self._update_session_counter()
+        self._update_goal_status()
+        self._update_task_label()
         self._update_buttons()
         self._update_status_bar()
 
-        # Update status bar every minute
+        # Update status bar every minute (the goals follow day rollover)
         self.set_interval(60, self._update_status_bar)
+        self.set_interval(60, self._update_goal_status)
+
+        # Apply edits made to the config file while the app runs
+        self.set_interval(CONFIG_POLL_INTERVAL, self._poll_config)
+
+        # Check the history for damage without delaying the first frame
+        self.run_worker(self._verify_history, thread=True, exit_on_error=False)
+
+        # Build the task search index before the picker is first opened
+        self.run_worker(self.tasks.load, thread=True, exit_on_error=False)
+
+        # Render the notification tones before the first one is due
+        if self.audio_manager.enabled:
+            self.audio_manager.prepare()
+
+        # Parse the calendar before the first session is planned around it,
+        # then pick up edits to the file and the next day's meetings
+        self._refresh_calendar()
+        self.set_interval(CALENDAR_POLL_INTERVAL, self._refresh_calendar)
+
+    def _on_config_write_error(self, message: str) -> None:
+        """Show a failed config write (may be called from the writer thread)."""
+        self.notify(escape(message), severity="error", timeout=10)
+
+    def _refresh_calendar(self) -> None:
+        """Re-read the calendar and expand today's meetings in a worker."""
+        if self.calendar is not None:
+            self.run_worker(self._load_calendar, thread=True, exit_on_error=False, group="calendar")
+
+    def _load_calendar(self) -> None:
+        """Parse today's meetings in a background thread."""
+        calendar = self.calendar
+        if calendar is None:
+            return
+        calendar.busy(date.today())
+        self.call_from_thread(self._update_status_bar)
+
+    def _todays_meetings(self) -> Optional[IntervalTree]:
+        """Get today's meetings if the calendar worker has expanded them, without waiting."""
+        if self.calendar is None:
+            return None
+        return self.calendar.cached(date.today())
+
+    def _verify_history(self) -> None:
+        """Validate the session history in a background thread."""
+        report = self.history.verify()
+        if report["repaired"]:
+            self.call_from_thread(
+                self.notify,
+                f"Recovered {report['repaired']} damaged history segment(s); "
+                "damaged data was moved to the quarantine folder",
+                severity="warning",
+            )
 
     def _update_timer_display(self) -> None:
         """Update the timer display with current time and phase."""
@@ -252,12 +403,36 @@ class PomodoroApp(App):
             info["pomodoros_until_long_break"]
         )
 
+    def _update_goal_status(self) -> None:
+        """Update the goal progress and streak display."""
+        today = date.today()
+        week_start = today - timedelta(days=today.weekday())
+        streaks = self.rollups.streaks(today)
+        try:
+            goal_status = self.query_one("#goal-status", GoalStatus)
+        except Exception:
+            # Goal display might not be mounted yet
+            return
+        goal_status.update_goals(
+            today=self.rollups.day(today)["pomodoros"],
+            daily_goal=self.rollups.daily_goal,
+            week=self.rollups.totals(week_start, today)["pomodoros"],
+            weekly_goal=self.config.settings.goals.weekly_pomodoros,
+            streak=streaks["current"],
+            longest=streaks["longest"],
+        )
+
     def _update_status_bar(self) -> None:
         """Update the status bar with current local time."""
         try:
             status_bar = self.query_one("#status-bar", Static)
             current_time = datetime.now().strftime("%I:%M %p")
-            status_bar.update(f"Local Time: {current_time}")
+            meeting = self._next_meeting()
+            if meeting is None:
+                status_bar.update(f"Local Time: {current_time}")
+            else:
+                starts = datetime.fromtimestamp(meeting[0]).strftime("%I:%M %p")
+                status_bar.update(f"Local Time: {current_time}  •  Next meeting: {escape(meeting[2])} at {starts}")
         except Exception:
             # Status bar might not be mounted yet
             pass
@@ -300,6 +475,19 @@ class PomodoroApp(App):
 
     def _on_state_change(self, old_state: TimerState, new_state: TimerState) -> None:
         """Called when timer state changes."""
+        # Track session start and pauses for the history
+        if new_state == TimerState.PAUSED:
+            self._session_pauses += 1
+            self._paused_at = time.time()
+        elif old_state == TimerState.PAUSED:
+            self._end_pause()
+        elif new_state != TimerState.IDLE:
+            self._session_started_at = time.time()
+            self._session_pauses = 0
+            self._session_paused_seconds = 0.0
+            self._session_tag = self._current_tag() if new_state == TimerState.WORK else None
+            self._session_task = self._task_id if new_state == TimerState.WORK else None
+
         self._update_timer_display()
         self._update_buttons()
 
@@ -312,6 +500,8 @@ class PomodoroApp(App):
 
     def _on_session_complete(self, pomodoro_num: int) -> None:
         """Called when a work session completes."""
+        self._record_session(TimerState.WORK, completed=True)
+        self._update_goal_status()
         self.audio_manager.play_work_complete()
         self.notify(
             f"✅ Pomodoro #{pomodoro_num} completed!",
@@ -319,13 +509,119 @@ class PomodoroApp(App):
             timeout=5
         )
         self._update_session_counter()
+        self._announce_next_session(pomodoro_num)
+
+    def _next_meeting(self) -> Optional[Meeting]:
+        """Get today's next (or current) meeting, once the calendar is loaded."""
+        tree = self._todays_meetings()
+        if tree is None:
+            return None
+        return tree.first_overlap(time.time(), day_bounds(date.today())[1])
+
+    def _planned_work_seconds(self) -> Optional[int]:
+        """
+        Shorten the next work session to end before a meeting.
+
+        Returns:
+            Session length in seconds, or None to use the configured duration
+            (also while the calendar is still being read)
+        """
+        tree = self._todays_meetings()
+        if tree is None:
+            return None
+        seconds, meeting = fit_work(tree, time.time(), self.timer.work_duration)
+        if meeting is None:
+            return None
+        starts = datetime.fromtimestamp(meeting[0]).strftime("%I:%M %p")
+        if seconds:
+            self.notify(f"📅 Shortened to {seconds // 60} min before {escape(meeting[2])} at {starts}")
+            return seconds
+        self.notify(f"📅 {escape(meeting[2])} at {starts} overlaps this session", severity="warning")
+        return None
+
+    def _announce_next_session(self, pomodoro_num: int) -> None:
+        """
+        Replan the rest of the day and point out meetings in the next session's way.
+
+        Args:
+            pomodoro_num: Pomodoros completed in the current cycle
+        """
+        tree = self._todays_meetings()
+        if tree is None:
+            return
+        today = date.today()
+        per_cycle = self.timer.pomodoros_until_long_break
+        long_break = pomodoro_num >= per_cycle
+        after_break = time.time() + (self.timer.long_break_duration if long_break else self.timer.short_break_duration)
+        day_end = clock_time(today, self.config.settings.calendar.day_end)
+        plan = plan_day(
+            tree,
+            after_break,
+            day_end,
+            self.timer.work_duration,
+            self.timer.short_break_duration,
+            self.timer.long_break_duration,
+            per_cycle,
+            completed_in_cycle=0 if long_break else pomodoro_num,
+        )
+        if not plan:
+            return
+        block = plan[0]
+        starts = datetime.fromtimestamp(block["start"]).strftime("%I:%M %p")
+        if block["shortened"]:
+            minutes = int(block["end"] - block["start"]) // 60
+            self.notify(f"📅 Next session: {minutes} min at {starts}, before {escape(block['before'])}", timeout=8)
+        elif block["start"] > after_break + 60:
+            self.notify(f"📅 Next session after your meetings, at {starts}", timeout=8)
 
     def _on_break_complete(self, break_type: TimerState) -> None:
         """Called when a break completes."""
+        self._record_session(break_type, completed=True)
         self.audio_manager.play_break_complete()
         self.notify("✨ Break finished! Ready for another session?", severity="information")
         self._update_timer_display()
 
+    def _end_pause(self) -> None:
+        """Add the time since the session was paused to its pause total."""
+        if self._paused_at is not None:
+            self._session_paused_seconds += time.time() - self._paused_at
+            self._paused_at = None
+
+    def _record_session(self, kind: TimerState, completed: bool) -> None:
+        """
+        Append the current session to the history.
+
+        Args:
+            kind: Session kind (WORK, SHORT_BREAK or LONG_BREAK)
+            completed: True if the session ran to completion
+        """
+        if self._session_started_at is None:
+            return
+        if not self.config.settings.statistics.save_history:
+            return
+
+        self._end_pause()
+        info = self.timer.get_session_info()
+        record = make_session_record(
+            kind=kind.value,
+            start=self._session_started_at,
+            duration=info["elapsed_seconds"],
+            planned=info["total_seconds"],
+            completed=completed,
+            pauses=self._session_pauses,
+            tag=self._session_tag,
+            pause_seconds=int(self._session_paused_seconds),
+            task=self._session_task,
+        )
+        self._session_started_at = None
+        try:
+            self.history.append(record)
+        except OSError as e:
+            print(f"Error saving session history: {e}")
+        if kind == TimerState.WORK and completed and self._session_task:
+            self.tasks.add_pomodoro(self._session_task)
+            self._update_task_label()
+
     def _on_cycle_complete(self, pomodoro_num: int) -> None:
         """Called when a full cycle completes."""
         self.notify(
@@ -340,8 +636,8 @@ class PomodoroApp(App):
         state = self.timer.get_state()
 
         if state == TimerState.IDLE:
-            # Start new work session
-            self.timer.start()
+            # Start new work session, ending before the next meeting
+            self.timer.start(self._planned_work_seconds())
         elif state == TimerState.PAUSED:
             # Resume
             self.timer.resume()
@@ -351,7 +647,11 @@ class PomodoroApp(App):
 
     def action_stop_timer(self) -> None:
         """Stop the timer and reset."""
-        if self.timer.get_state() != TimerState.IDLE:
+        state = self.timer.get_state()
+        if state != TimerState.IDLE:
+            kind = self.timer.previous_state if state == TimerState.PAUSED else state
+            if kind is not None:
+                self._record_session(kind, completed=False)
             self.timer.stop()
             self._update_timer_display()
             self._update_session_counter()
@@ -363,10 +663,66 @@ class PomodoroApp(App):
             self.timer.skip()
             self.notify("Skipped to next phase", severity="information")
 
+    def _current_tag(self) -> Optional[str]:
+        """Get the tag entered on the main screen, or None if empty."""
+        try:
+            tag = self.query_one("#tag-input", Input).value.strip()
+        except Exception:
+            # Input might not be mounted yet
+            return None
+        return tag or None
+
+    def check_action(self, action: str, parameters: tuple) -> Optional[bool]:
+        """Let a focused text input receive keys bound to priority actions."""
+        if action in self.TEXT_ENTRY_BLOCKED_ACTIONS and isinstance(self.focused, Input):
+            return False
+        return True
+
+    def action_focus_tag(self) -> None:
+        """Focus the tag input on the main screen."""
+        self.query_one("#tag-input", Input).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Return focus to the app after entering a tag."""
+        if event.input.id == "tag-input":
+            self.set_focus(None)
+
+    def _update_task_label(self) -> None:
+        """Show the task the next work sessions are attached to."""
+        task = self.tasks.get(self._task_id) if self._task_id else None
+        label = self.query_one("#task-label", Static)
+        if task is None:
+            label.update("[dim]No task attached ([bold]A[/bold] to pick one)[/dim]")
+        else:
+            count = task.get("pomodoros", 0)
+            label.update(f"Task: [bold]{escape(task['title'])}[/bold]  [dim]{count} 🍅[/dim]")
+
+    def action_pick_task(self) -> None:
+        """Open the task picker."""
+
+        def handle_task_selection(task_id: Optional[str]) -> None:
+            if task_id is not None:
+                self._task_id = task_id or None
+            task = self.tasks.get(self._task_id) if self._task_id else None
+            if task is None or task.get("done"):
+                # Detached, or marked done in the picker
+                self._task_id = None
+            self._update_task_label()
+
+        self.push_screen(TaskPicker(self._task_id, self.tasks), handle_task_selection)
+
     def action_help(self) -> None:
         """Show help screen."""
         self.push_screen(HelpScreen())
 
+    def action_history(self) -> None:
+        """Show the session history browser."""
+        self.push_screen(HistoryBrowser(self.history))
+
+    def action_stats(self) -> None:
+        """Show the statistics screen."""
+        self.push_screen(StatsScreen(self.rollups))
+
     def action_config(self) -> None:
         """Open configuration/settings."""
         def handle_settings_result(saved: bool) -> None:
@@ -381,21 +737,90 @@ class PomodoroApp(App):
 
     def _reload_timer_settings(self) -> None:
         """Reload timer settings from config."""
-        work_duration = self.config.get("timer", "work_duration", 25)
-        short_break = self.config.get("timer", "short_break_duration", 5)
-        long_break = self.config.get("timer", "long_break_duration", 15)
-        pomodoros_until_long = self.config.get("timer", "pomodoros_until_long_break", 4)
+        # One snapshot, so all durations come from the same version of the config
+        settings = self.config.settings
+        self.timer.update_durations(
+            work_duration=settings.timer.work_duration,
+            short_break_duration=settings.timer.short_break_duration,
+            long_break_duration=settings.timer.long_break_duration,
+            pomodoros_until_long_break=settings.timer.pomodoros_until_long_break,
+        )
 
-        # Update timer with new settings (convert minutes to seconds)
-        self.timer.work_duration = minutes_to_seconds(work_duration)
-        self.timer.short_break_duration = minutes_to_seconds(short_break)
-        self.timer.long_break_duration = minutes_to_seconds(long_break)
-        self.timer.pomodoros_until_long_break = pomodoros_until_long
+        # Goals may have changed too
+        self.rollups.set_daily_goal(settings.goals.daily_pomodoros)
+        self._update_goal_status()
+
+    def _poll_config(self) -> None:
+        """Apply the settings that changed in the config file since it was last read."""
+        changes = self.config.reload_if_changed()
+        if not changes:
+            return
+
+        # Durations and theme come from the active profile, which may have changed too
+        settings = self.config.settings
+        changed_keys = set(changes.get("timer", {}))
+        if "profiles" in changes:
+            changed_keys.update(PROFILE_TIMER_KEYS)
+        durations = {key: getattr(settings.timer, key) for key in PROFILE_TIMER_KEYS if key in changed_keys}
+        if durations:
+            self.timer.update_durations(**durations)
+            self._update_session_counter()
+
+        if "theme" in changes.get("appearance", {}) or "profiles" in changes:
+            if settings.appearance.theme != self.theme_manager.get_current_theme():
+                self._load_theme(settings.appearance.theme, save=False)
+
+        audio = changes.get("audio", {})
+        if "enabled" in audio:
+            self.audio_manager.set_enabled(audio["enabled"], save=False)
+        if "volume" in audio:
+            self.audio_manager.set_volume(audio["volume"], save=False)
+        if "backend" in audio:
+            self.audio_manager.set_backend(audio["backend"])
+
+        goals = changes.get("goals", {})
+        if goals:
+            if "daily_pomodoros" in goals:
+                self.rollups.set_daily_goal(goals["daily_pomodoros"])
+            self._update_goal_status()
+
+        if "ics_path" in changes.get("calendar", {}):
+            ics_path = changes["calendar"]["ics_path"]
+            self.calendar = Calendar(Path(ics_path)) if ics_path else None
+            self._refresh_calendar()
+            self._update_status_bar()
+
+        self.notify("Configuration reloaded", severity="information", timeout=2)
+
+    def action_next_profile(self) -> None:
+        """Switch to the next config profile."""
+        names = self.config.profile_names()
+        current = self.config.settings.active_profile
+        name = names[(names.index(current) + 1) % len(names)] if current in names else names[0]
+        self._apply_profile(self.config.switch_profile(name))
+
+    def _apply_profile(self, settings: Settings) -> None:
+        """
+        Apply a profile's durations and theme to the next sessions.
+
+        Args:
+            settings: Settings with the profile active
+        """
+        self.timer.update_durations(**{key: getattr(settings.timer, key) for key in PROFILE_TIMER_KEYS})
+        self._update_session_counter()
+        if settings.appearance.theme != self.theme_manager.get_current_theme():
+            self._load_theme(settings.appearance.theme, save=False)
+        timer = settings.timer
+        self.notify(
+            f"Profile: {escape(settings.active_profile or 'Default')} "
+            f"({timer.work_duration}/{timer.short_break_duration} min)",
+            severity="information",
+            timeout=3,
+        )
 
     def _reload_audio_settings(self) -> None:
         """Reload audio settings from config."""
-        audio_enabled = self.config.get("audio", "enabled", True)
-        self.audio_manager.set_enabled(audio_enabled)
+        self.audio_manager.set_enabled(self.config.settings.audio.enabled)
 
     def action_quit(self) -> None:
         """Quit the application."""
@@ -405,12 +830,13 @@ class PomodoroApp(App):
         self.exit()
 
     # Theme management methods
-    def _load_theme(self, theme_id: str) -> None:
+    def _load_theme(self, theme_id: str, save: bool = True) -> None:
         """
         Load and apply a theme dynamically using Textual's built-in theme system.
 
         Args:
             theme_id: ID of the theme to load
+            save: False when the theme came from the config file itself
         """
         try:
             # Map to Textual's built-in theme
@@ -426,8 +852,9 @@ class PomodoroApp(App):
             self.theme_manager.set_current_theme(theme_id)
 
             # Save to config
-            self.config.set("appearance", "theme", theme_id)
-            self.config.save()
+            if save:
+                self.config.set("appearance", "theme", theme_id)
+                self.config.save()
 
             # Show notification
             self.notify(
@@ -465,7 +892,8 @@ class PomodoroApp(App):
 
         if button_id == "btn-start":
             if self.timer.get_state() == TimerState.IDLE:
-                self.timer.start()
+                # Same as the keyboard: end before the next meeting
+                self.timer.start(self._planned_work_seconds())
             elif self.timer.get_state() == TimerState.PAUSED:
                 self.timer.resume()
         elif button_id == "btn-pause":
@@ -480,6 +908,10 @@ def run() -> None:
     """Run the Pomodoro TUI application."""
     app = PomodoroApp()
     app.run()
+    # Write settings changed in the last moments before quitting, printing
+    # any error now that the UI is gone
+    app.config.on_write_error = None
+    app.config.flush()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,32 @@
 """
 Audio notification manager for the Pomodoro TUI.
+
+Sounds are queued and played by a background thread, so the play_*
+methods return immediately instead of blocking the timer while a tone
+sounds. Output goes through a backend from src.audio_backends chosen by
+the audio.backend setting. The tones are rendered once by src.tones
+(imported on the playback thread, so NumPy does not slow down startup).
 """
-import winsound
-from typing import Optional
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.audio_backends import AudioBackend, create_backend
 from src.config import get_config
+from src.utils.constants import AUDIO_CACHE_DIR, AUDIO_QUEUE_SIZE, CONFIG_DIR
+
+
+# Notification sounds as (frequency in Hz, duration in ms) tones played in turn
+SOUNDS = {
+    # A pleasant two-tone beep: higher, then lower pitch
+    "work_complete": ((800, 200), (600, 300)),
+    # A single tone beep
+    "break_complete": ((600, 400),),
+    # A quick beep
+    "timer_start": ((700, 100),),
+}
 
 
 class AudioManager:
@@ -12,64 +35,133 @@ class AudioManager:
     def __init__(self):
         """Initialize the audio manager."""
         self.config = get_config()
-        self.enabled = self.config.get("audio", "enabled", True)
-        self.volume = self.config.get("audio", "volume", 0.7)
+        self.enabled = self.config.settings.audio.enabled
+        self.volume = self.config.settings.audio.volume
+        self.backend_name = self.config.settings.audio.backend
+
+        # Playback thread state; the backend is only used by that thread
+        self._queue: "queue.Queue[Tuple[str, float]]" = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
+        self._player: Optional[threading.Thread] = None
+        self._player_lock = threading.Lock()
+        self._backend: Optional[AudioBackend] = None
+        # The backend setting the current backend was created for
+        self._backend_for: Optional[str] = None
+        self._tones = None
+        # Seconds from the last play_* call until its sound reached the backend
+        self.last_latency: Optional[float] = None
 
     def play_work_complete(self) -> None:
         """Play notification sound for completed work session."""
-        if not self.enabled:
-            return
-
-        try:
-            # Play a pleasant two-tone beep (frequency, duration in ms)
-            winsound.Beep(800, 200)  # Higher pitch
-            winsound.Beep(600, 300)  # Lower pitch
-        except Exception as e:
-            print(f"Error playing work complete sound: {e}")
+        self._enqueue("work_complete")
 
     def play_break_complete(self) -> None:
         """Play notification sound for completed break."""
-        if not self.enabled:
-            return
-
-        try:
-            # Play a single tone beep
-            winsound.Beep(600, 400)
-        except Exception as e:
-            print(f"Error playing break complete sound: {e}")
+        self._enqueue("break_complete")
 
     def play_timer_start(self) -> None:
         """Play notification sound when timer starts."""
+        self._enqueue("timer_start")
+
+    def prepare(self) -> None:
+        """Start the playback thread, which opens the backend and renders the tones ahead of time."""
+        with self._player_lock:
+            if self._player is None:
+                self._player = threading.Thread(target=self._play_queued, name="audio-player", daemon=True)
+                self._player.start()
+
+    def _enqueue(self, sound: str) -> None:
+        """
+        Queue a sound for the playback thread, starting it if needed.
+
+        Args:
+            sound: Name of the sound in SOUNDS
+        """
         if not self.enabled:
             return
+        try:
+            self._queue.put_nowait((sound, time.perf_counter()))
+        except queue.Full:
+            # Notifications this far behind are no longer worth playing
+            return
+        self.prepare()
 
+    def _play_queued(self) -> None:
+        """Play queued sounds one after another (background thread)."""
         try:
-            # Play a quick beep
-            winsound.Beep(700, 100)
+            self._get_backend()
+            for sound, tones in SOUNDS.items():
+                self._get_tones().get(sound, tones, self.volume)
         except Exception as e:
-            print(f"Error playing timer start sound: {e}")
+            print(f"Error preparing sounds: {e}")
+
+        while True:
+            sound, queued_at = self._queue.get()
+            try:
+                pcm = self._get_tones().get(sound, SOUNDS[sound], self.volume)
+                backend = self._get_backend()
+                self.last_latency = time.perf_counter() - queued_at
+                backend.play(pcm)
+            except Exception as e:
+                print(f"Error playing {sound.replace('_', ' ')} sound: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _get_backend(self) -> AudioBackend:
+        """Get the backend, reopening it if the setting changed (playback thread)."""
+        backend_name = self.backend_name
+        if self._backend is None or self._backend_for != backend_name:
+            if self._backend is not None:
+                self._backend.close()
+            self._backend = create_backend(backend_name)
+            self._backend_for = backend_name
+        return self._backend
+
+    def _get_tones(self):
+        """Get the tone cache, importing NumPy on first use (playback thread)."""
+        if self._tones is None:
+            from src.tones import ToneCache
+
+            self._tones = ToneCache(Path(CONFIG_DIR).expanduser() / AUDIO_CACHE_DIR)
+        return self._tones
+
+    def drain(self) -> None:
+        """Wait until every queued sound has been played."""
+        self._queue.join()
+
+    def set_backend(self, name: str) -> None:
+        """
+        Switch to another audio backend for the following sounds.
 
-    def set_enabled(self, enabled: bool) -> None:
+        Args:
+            name: One of AUDIO_BACKENDS
+        """
+        self.backend_name = name
+
+    def set_enabled(self, enabled: bool, save: bool = True) -> None:
         """
         Enable or disable audio notifications.
 
         Args:
             enabled: True to enable audio, False to disable
+            save: False when the value came from the config file itself
         """
         self.enabled = enabled
-        self.config.set("audio", "enabled", enabled)
-        self.config.save()
+        if save:
+            self.config.set("audio", "enabled", enabled)
+            self.config.save()
 
-    def set_volume(self, volume: float) -> None:
+    def set_volume(self, volume: float, save: bool = True) -> None:
         """
-        Set audio volume (note: winsound doesn't support volume control).
+        Set audio volume, applied to the following sounds on every backend.
 
         Args:
             volume: Volume level between 0.0 and 1.0
+            save: False when the value came from the config file itself
         """
         self.volume = max(0.0, min(1.0, volume))
-        self.config.set("audio", "volume", self.volume)
-        self.config.save()
+        if save:
+            self.config.set("audio", "volume", self.volume)
+            self.config.save()
 
     def toggle_enabled(self) -> bool:
         """
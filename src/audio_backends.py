@@ -0,0 +1,176 @@
+"""
+Sound output backends for notification tones.
+
+Every backend plays 16-bit mono PCM at AUDIO_SAMPLE_RATE, passed as a
+memoryview of the cached samples so it is never copied, and may block
+until the sound has finished; AudioManager calls them from its playback
+thread only. winsound is imported when its backend is created, so the
+app starts on systems without it.
+"""
+import io
+import os
+import shutil
+import subprocess
+import sys
+import wave
+from pathlib import Path
+from typing import List
+
+from src.utils.constants import AUDIO_SAMPLE_RATE, AUDIO_WAV_FILE, CONFIG_DIR
+
+
+# Seconds a player process may take beyond the length of the sound
+PLAYER_TIMEOUT = 5.0
+
+
+def wav_bytes(pcm: memoryview) -> bytes:
+    """
+    Wrap PCM samples in a WAV file.
+
+    Args:
+        pcm: 16-bit mono samples at AUDIO_SAMPLE_RATE
+
+    Returns:
+        Contents of a WAV file
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(AUDIO_SAMPLE_RATE)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+class AudioBackend:
+    """Plays PCM sounds; the base class discards them."""
+
+    name = "null"
+
+    def play(self, pcm: memoryview) -> None:
+        """
+        Play a sound, returning once it has finished.
+
+        Args:
+            pcm: 16-bit mono samples at AUDIO_SAMPLE_RATE
+        """
+
+    def close(self) -> None:
+        """Release anything held by the backend."""
+
+
+class NullBackend(AudioBackend):
+    """Discards sounds (headless systems and tests)."""
+
+
+class WavFileBackend(AudioBackend):
+    """Writes each sound to a WAV file instead of playing it."""
+
+    name = "wav"
+
+    def __init__(self, path: Path):
+        """
+        Initialize the backend.
+
+        Args:
+            path: WAV file replaced by every sound
+        """
+        self.path = Path(path).expanduser()
+
+    def play(self, pcm: memoryview) -> None:
+        """Atomically replace the WAV file with the sound."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(wav_bytes(pcm))
+        os.replace(tmp_path, self.path)
+
+
+class WinsoundBackend(AudioBackend):
+    """Plays sounds with winsound (Windows)."""
+
+    name = "winsound"
+
+    def __init__(self):
+        """
+        Initialize the backend.
+
+        Raises:
+            ImportError: If winsound is not available
+        """
+        import winsound
+
+        self._winsound = winsound
+
+    def play(self, pcm: memoryview) -> None:
+        """Play the sound from memory."""
+        self._winsound.PlaySound(wav_bytes(pcm), self._winsound.SND_MEMORY)
+
+
+class PipeBackend(AudioBackend):
+    """Streams raw PCM into a player process (PulseAudio or ALSA)."""
+
+    # Backend name -> player command reading raw PCM from stdin
+    COMMANDS = {
+        "pulse": ["paplay", "--raw", "--format=s16le", f"--rate={AUDIO_SAMPLE_RATE}", "--channels=1"],
+        "aplay": ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-r", str(AUDIO_SAMPLE_RATE), "-c", "1"],
+    }
+
+    def __init__(self, name: str):
+        """
+        Initialize the backend.
+
+        Args:
+            name: "pulse" or "aplay"
+
+        Raises:
+            FileNotFoundError: If the player is not installed
+        """
+        self.name = name
+        command = self.COMMANDS[name]
+        executable = shutil.which(command[0])
+        if executable is None:
+            raise FileNotFoundError(f"{command[0]} not found")
+        self.command: List[str] = [executable] + command[1:]
+
+    def play(self, pcm: memoryview) -> None:
+        """Start a player, feed it the sound and wait for it to finish."""
+        process = subprocess.Popen(
+            self.command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            process.stdin.write(pcm)
+            process.stdin.close()
+            process.wait(timeout=len(pcm) / (2 * AUDIO_SAMPLE_RATE) + PLAYER_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+            raise
+
+
+def create_backend(name: str) -> AudioBackend:
+    """
+    Create an audio backend.
+
+    Args:
+        name: One of AUDIO_BACKENDS; "auto" picks winsound on Windows, else
+            the first of PulseAudio and ALSA that is installed
+
+    Returns:
+        The backend, or a NullBackend if it is not available here
+    """
+    if name == "auto":
+        candidates = ["winsound"] if sys.platform == "win32" else ["pulse", "aplay"]
+    else:
+        candidates = [name]
+    for candidate in candidates:
+        try:
+            if candidate == "winsound":
+                return WinsoundBackend()
+            if candidate in PipeBackend.COMMANDS:
+                return PipeBackend(candidate)
+            if candidate == "wav":
+                return WavFileBackend(Path(CONFIG_DIR).expanduser() / AUDIO_WAV_FILE)
+        except (ImportError, FileNotFoundError) as e:
+            if name != "auto":
+                print(f"Error opening audio backend {candidate}: {e}")
+    return NullBackend()
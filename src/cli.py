@@ -0,0 +1,376 @@
+"""
+Command line interface for the Pomodoro TUI.
+
+Running without a subcommand starts the TUI. Subcommands work on the
+session history and never import Textual.
+"""
+import argparse
+import json
+import sys
+from datetime import date, timedelta
+from typing import List, Optional
+
+from src.utils.constants import (
+    APP_NAME,
+    APP_DESCRIPTION,
+    EXPORT_FORMATS,
+    REPORT_FORMATS,
+)
+from src.utils.helpers import format_duration, parse_timestamp, round_to_minute
+
+
+def _timestamp_arg(value: str) -> float:
+    """Argparse type for ISO 8601 dates and datetimes."""
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date or datetime: {value!r}")
+
+
+def _date_arg(value: str) -> date:
+    """Argparse type for ISO 8601 dates."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value!r}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for all subcommands.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(prog="main.py", description=f"{APP_NAME} - {APP_DESCRIPTION}")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser("export", help="Export session history")
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl", dest="fmt")
+    export_parser.add_argument("--since", type=_timestamp_arg, help="Start date/time (inclusive)")
+    export_parser.add_argument("--until", type=_timestamp_arg, help="End date/time (exclusive)")
+    export_parser.add_argument("-o", "--output", help="Output file (defaults to stdout)")
+
+    import_parser = subparsers.add_parser("import", help="Import sessions from other tools")
+    import_parser.add_argument("files", nargs="+", help="CSV/TSV or JSON-lines files")
+    import_parser.add_argument("--workers", type=int, help="Worker processes (defaults to CPU count)")
+
+    merge_parser = subparsers.add_parser("merge", help="Merge history directories from other machines")
+    merge_parser.add_argument("sources", nargs="+", help="History directories to merge in")
+    merge_parser.add_argument(
+        "-o", "--output", help="History directory to merge into (defaults to your history)"
+    )
+
+    report_parser = subparsers.add_parser("report", help="Write an HTML or Markdown focus report")
+    report_period = report_parser.add_mutually_exclusive_group()
+    report_period.add_argument("--week", action="store_true", help="This week, from Monday (default)")
+    report_period.add_argument("--month", action="store_true", help="This month, from the 1st")
+    report_period.add_argument(
+        "--range",
+        nargs=2,
+        type=_date_arg,
+        metavar=("START", "END"),
+        help="Days from START to END (inclusive)",
+    )
+    report_parser.add_argument(
+        "--format", choices=REPORT_FORMATS, dest="fmt", help="Defaults to the output file's extension"
+    )
+    report_parser.add_argument("-o", "--output", help="Output file (defaults to stdout)")
+    report_parser.add_argument("--team", help="Directory with one history directory per member")
+    report_parser.add_argument("--workers", type=int, help="Worker processes for --team (defaults to CPU count)")
+
+    plan_parser = subparsers.add_parser("plan", help="Plan the day's pomodoros around calendar meetings")
+    plan_parser.add_argument("--date", type=_date_arg, help="Day to plan (defaults to today)")
+    plan_parser.add_argument("--ics", help="Calendar file (defaults to calendar.ics_path in the config)")
+
+    stats_parser = subparsers.add_parser("stats", help="Print focus totals")
+    period = stats_parser.add_mutually_exclusive_group()
+    period.add_argument("--today", action="store_true", help="Today (default)")
+    period.add_argument("--week", action="store_true", help="This week, from Monday")
+    period.add_argument(
+        "--range",
+        nargs=2,
+        type=_date_arg,
+        metavar=("START", "END"),
+        help="Days from START to END (inclusive)",
+    )
+    stats_parser.add_argument("--json", action="store_true", help="Print JSON for scripts")
+
+    return parser
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    """
+    Stream session history to stdout or a file.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    from src.export import export_history
+    from src.history import get_history_store
+
+    store = get_history_store()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            export_history(store, args.fmt, out, args.since, args.until)
+    else:
+        sys.stdout.reconfigure(newline="")
+        export_history(store, args.fmt, sys.stdout, args.since, args.until)
+    return 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    """
+    Import session exports from other tools into the history.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    from src.history import get_history_store
+    from src.importer import import_files
+
+    totals = import_files(args.files, get_history_store(), workers=args.workers)
+    print(
+        f"Imported {totals['imported']} sessions "
+        f"({totals['duplicates']} duplicates, {totals['rejected']} unreadable rows skipped)"
+    )
+    return 0
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    """
+    Merge history directories into one store.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    from pathlib import Path
+
+    from src.history import HistoryStore, get_history_store
+    from src.merge import merge_stores
+
+    target = HistoryStore(Path(args.output)) if args.output else get_history_store()
+    seen = {target.history_dir.resolve()}
+    sources = []
+    for source in args.sources:
+        path = Path(source).expanduser()
+        if not path.is_dir():
+            print(f"Error merging history: {source} is not a directory", file=sys.stderr)
+            return 1
+        if path.resolve() not in seen:
+            seen.add(path.resolve())
+            sources.append(HistoryStore(path, read_only=True))
+
+    totals = merge_stores(sources, target)
+    print(
+        f"Merged {totals['sessions']} sessions into {totals['segments']} months "
+        f"at {target.history_dir} ({totals['duplicates']} duplicates skipped)"
+    )
+    return 0
+
+
+def cmd_report(args: argparse.Namespace) -> int:
+    """
+    Write a focus report for a period.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    from pathlib import Path
+
+    from src.config import get_config
+    from src.report import period_bounds, summarize, summarize_team, write_report
+    from src.stats import get_rollups
+
+    if args.range:
+        start, end = args.range
+    else:
+        start, end = period_bounds("month" if args.month else "week")
+    fmt = args.fmt
+    if fmt is None:
+        suffix = Path(args.output).suffix.lower() if args.output else ""
+        fmt = "html" if suffix in (".html", ".htm") else "markdown"
+
+    if args.team:
+        daily_goal = get_config().settings.goals.daily_pomodoros
+        try:
+            summary = summarize_team(Path(args.team), start, end, daily_goal, workers=args.workers)
+        except (OSError, ValueError) as e:
+            print(f"Error building team report: {e}", file=sys.stderr)
+            return 1
+    else:
+        summary = summarize(get_rollups(), start, end)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            write_report(summary, fmt, out)
+    else:
+        write_report(summary, fmt, sys.stdout)
+    return 0
+
+
+def cmd_plan(args: argparse.Namespace) -> int:
+    """
+    Print a day's meetings with work sessions and breaks planned between them.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    import time
+    from datetime import datetime
+    from pathlib import Path
+
+    from src.config import get_config
+    from src.planner import Calendar, clock_time, plan_day
+    from src.utils.helpers import minutes_to_seconds
+
+    settings = get_config().settings
+    ics_path = args.ics or settings.calendar.ics_path
+    if not ics_path:
+        print("Error: no calendar file; pass --ics or set calendar.ics_path", file=sys.stderr)
+        return 1
+    path = Path(ics_path).expanduser()
+    if not path.is_file():
+        print(f"Error: calendar file not found: {path}", file=sys.stderr)
+        return 1
+
+    day = args.date or date.today()
+    start = clock_time(day, settings.calendar.day_start)
+    end = clock_time(day, settings.calendar.day_end)
+    if day == date.today():
+        start = max(start, time.time())
+
+    calendar = Calendar(path)
+    meetings = calendar.meetings(day)
+    blocks = plan_day(
+        calendar.busy(day),
+        start,
+        end,
+        minutes_to_seconds(settings.timer.work_duration),
+        minutes_to_seconds(settings.timer.short_break_duration),
+        minutes_to_seconds(settings.timer.long_break_duration),
+        settings.timer.pomodoros_until_long_break,
+    )
+
+    labels = {"WORK": "Focus", "SHORT_BREAK": "Short break", "LONG_BREAK": "Long break"}
+    rows = [(meeting_start, meeting_end, f"Meeting: {summary}") for meeting_start, meeting_end, summary in meetings]
+    for block in blocks:
+        label = labels[block["kind"]]
+        if block["shortened"]:
+            label += f" (ends for {block['before']})"
+        rows.append((block["start"], block["end"], label))
+    rows.sort()
+
+    work = sum(block["end"] - block["start"] for block in blocks if block["kind"] == "WORK")
+    pomodoros = sum(1 for block in blocks if block["kind"] == "WORK")
+    print(f"Plan for {day} ({len(meetings)} meetings, {pomodoros} pomodoros, {format_duration(int(work))} focus)")
+    for row_start, row_end, label in rows:
+        span = f"{datetime.fromtimestamp(row_start):%H:%M}-{datetime.fromtimestamp(row_end):%H:%M}"
+        print(f"  {span}  {label}")
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    """
+    Print totals from the precomputed rollups.
+
+    Only the rollups file and the history's file metadata are read, so
+    this stays fast enough for shell prompts and cron jobs.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Process exit code
+    """
+    from src.config import get_config
+    from src.stats import get_rollups
+
+    rollups = get_rollups()
+    goals = get_config().settings.goals
+    today = date.today()
+    if args.range:
+        start, end = args.range
+        label, goal = "Range", None
+    elif args.week:
+        start, end = today - timedelta(days=today.weekday()), today
+        label, goal = "This week", goals.weekly_pomodoros
+    else:
+        start = end = today
+        label, goal = "Today", goals.daily_pomodoros
+
+    totals = rollups.totals(start, end)
+    streaks = rollups.streaks(today)
+    focus = rollups.quantiles("focus_length", start, end)
+
+    if args.json:
+        print(json.dumps({
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            **totals,
+            "goal": goal,
+            "focus_p50": focus[0.5],
+            "focus_p90": focus[0.9],
+            "streak": streaks["current"],
+            "longest_streak": streaks["longest"],
+        }))
+        return 0
+
+    goal_text = f" / {goal} goal" if goal else ""
+    print(f"{label} ({start}{'' if start == end else f' - {end}'})")
+    print(f"  Pomodoros:    {totals['pomodoros']}{goal_text}")
+    print(f"  Focus:        {format_duration(totals['focus_seconds'])}")
+    print(f"  Breaks:       {format_duration(totals['break_seconds'])}")
+    print(f"  Sessions:     {totals['sessions']}")
+    if focus[0.5] is not None:
+        print(
+            f"  Focus block:  p50 {format_duration(round_to_minute(focus[0.5]))}, "
+            f"p90 {format_duration(round_to_minute(focus[0.9]))}"
+        )
+    print(f"  Streak:       {streaks['current']} days (best {streaks['longest']})")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Parse arguments and dispatch to a subcommand or the TUI.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+
+    if args.command == "export":
+        return cmd_export(args)
+    if args.command == "import":
+        return cmd_import(args)
+    if args.command == "merge":
+        return cmd_merge(args)
+    if args.command == "report":
+        return cmd_report(args)
+    if args.command == "plan":
+        return cmd_plan(args)
+    if args.command == "stats":
+        return cmd_stats(args)
+
+    from src.app import run
+    run()
+    return 0
@@ -0,0 +1,179 @@
+"""
+Calendar heatmap widget showing a year of daily focus time.
+"""
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.color import Color
+from textual.strip import Strip
+from textual.widget import Widget
+
+from src.stats import HEATMAP_LEVELS, Rollups, focus_level
+
+
+# Weeks shown in the heatmap (a year plus the current partial week)
+HEATMAP_WEEKS = 53
+
+# Cell glyph for a day
+HEATMAP_CELL = "■"
+
+# Weekday labels, Monday first (blank rows keep the grid readable)
+WEEKDAY_LABELS = ["Mon ", "    ", "Wed ", "    ", "Fri ", "    ", "Sun "]
+
+# Rendered heatmaps kept per (theme, today, today's bucket, rollup epoch)
+MAX_CACHED_RENDERS = 8
+
+_render_cache: "OrderedDict[tuple, List[Strip]]" = OrderedDict()
+
+
+def level_styles(background: str, accent: str) -> List[Style]:
+    """
+    Build one style per intensity level by blending two theme colors.
+
+    Args:
+        background: Theme background color
+        accent: Theme color for the most intense level
+
+    Returns:
+        List of styles from level 0 to the highest level
+    """
+    base = Color.parse(background)
+    target = Color.parse(accent)
+    count = len(HEATMAP_LEVELS)
+    styles = [Style(color=base.lighten(0.12).rich_color)]
+    for level in range(1, count + 1):
+        factor = 0.35 + 0.65 * (level - 1) / max(1, count - 1)
+        styles.append(Style(color=base.blend(target, factor).rich_color))
+    return styles
+
+
+def render_heatmap(
+    rollups: Rollups,
+    today: date,
+    background: str,
+    accent: str,
+) -> List[Strip]:
+    """
+    Render the heatmap lines (month labels followed by one row per weekday).
+
+    Args:
+        rollups: Rollups providing per-day focus time
+        today: Last day shown
+        background: Theme background color
+        accent: Theme color for the most intense level
+
+    Returns:
+        List of rendered strips
+    """
+    styles = level_styles(background, accent)
+    first_day = today - timedelta(days=today.weekday() + (HEATMAP_WEEKS - 1) * 7)
+    levels = [focus_level(bucket["focus_seconds"]) for _, bucket in rollups.iter_days(first_day, today)]
+
+    # Month labels above the first week of each month
+    label_cells = [" "] * HEATMAP_WEEKS
+    for week in range(HEATMAP_WEEKS):
+        week_start = first_day + timedelta(weeks=week)
+        if week_start.day <= 7 and week + 3 <= HEATMAP_WEEKS:
+            label = week_start.strftime("%b")
+            if all(cell == " " for cell in label_cells[max(0, week - 1):week + 3]):
+                label_cells[week:week + 3] = list(label)
+    lines = [Strip([Segment("    " + "".join(label_cells))])]
+
+    for weekday in range(7):
+        segments = [Segment(WEEKDAY_LABELS[weekday])]
+        run_style: Optional[Style] = None
+        run_length = 0
+        for week in range(HEATMAP_WEEKS):
+            index = week * 7 + weekday
+            if index < len(levels):
+                style, glyph = styles[levels[index]], HEATMAP_CELL
+            else:
+                style, glyph = None, " "  # Future days this week
+            if style is run_style and glyph == HEATMAP_CELL:
+                run_length += 1
+                continue
+            if run_length:
+                segments.append(Segment(HEATMAP_CELL * run_length, run_style))
+            if glyph == HEATMAP_CELL:
+                run_style, run_length = style, 1
+            else:
+                run_style, run_length = None, 0
+                segments.append(Segment(glyph))
+        if run_length:
+            segments.append(Segment(HEATMAP_CELL * run_length, run_style))
+        lines.append(Strip(segments))
+    return lines
+
+
+class FocusHeatmap(Widget):
+    """
+    GitHub-style heatmap of daily focus minutes over the past year.
+
+    Rendered strips are cached per theme and only recomputed when today's
+    bucket changes (or older buckets are rebuilt), so reopening the stats
+    screen or switching themes back and forth costs a dictionary lookup.
+    """
+
+    DEFAULT_CSS = """
+    FocusHeatmap {
+        width: 57;
+        height: 8;
+    }
+    """
+
+    def __init__(self, rollups: Rollups, *args, **kwargs):
+        """
+        Initialize the heatmap.
+
+        Args:
+            rollups: Rollups providing per-day focus time
+        """
+        super().__init__(*args, **kwargs)
+        self.rollups = rollups
+
+    def on_mount(self) -> None:
+        """Re-render when the app theme changes."""
+        self.app.theme_changed_signal.subscribe(self, lambda theme: self.refresh())
+
+    def _theme_colors(self) -> Tuple[str, str, str]:
+        """Get (theme name, background, accent) for the current theme."""
+        theme = self.app.current_theme
+        background = theme.background or ("#121212" if theme.dark else "#efefef")
+        accent = theme.success or theme.primary
+        return theme.name, background, accent
+
+    def get_lines(self) -> List[Strip]:
+        """
+        Get the rendered heatmap, from the cache when possible.
+
+        Returns:
+            List of rendered strips
+        """
+        today = date.today()
+        theme_name, background, accent = self._theme_colors()
+        key = (
+            theme_name,
+            today,
+            self.rollups.day(today)["focus_seconds"],
+            self.rollups.epoch,
+        )
+        lines = _render_cache.get(key)
+        if lines is None:
+            lines = render_heatmap(self.rollups, today, background, accent)
+            _render_cache[key] = lines
+            while len(_render_cache) > MAX_CACHED_RENDERS:
+                _render_cache.popitem(last=False)
+        else:
+            _render_cache.move_to_end(key)
+        return lines
+
+    def render_line(self, y: int) -> Strip:
+        """Render one line of the heatmap."""
+        lines = self.get_lines()
+        width = self.size.width
+        if y >= len(lines):
+            return Strip.blank(width)
+        return lines[y].crop_extend(0, width, None)
@@ -78,16 +78,21 @@ class HelpScreen(ModalScreen[None]):
                     yield Static("[dim]Space[/dim]  Start/Pause timer", classes="shortcut-row")
                     yield Static("[dim]S[/dim]      Stop and reset timer", classes="shortcut-row")
                     yield Static("[dim]N[/dim]      Skip to next phase", classes="shortcut-row")
+                    yield Static("[dim]G[/dim]      Tag the next work session", classes="shortcut-row")
+                    yield Static("[dim]A[/dim]      Attach a task (fuzzy search)", classes="shortcut-row")
 
                 # Settings & Customization
                 with Vertical(classes="help-section"):
                     yield Static("Settings & Customization", classes="section-title")
                     yield Static("[dim]C[/dim]      Open settings panel", classes="shortcut-row")
                     yield Static("[dim]T[/dim]      Open theme picker", classes="shortcut-row")
+                    yield Static("[dim]P[/dim]      Switch to the next profile", classes="shortcut-row")
 
                 # Application
                 with Vertical(classes="help-section"):
                     yield Static("Application", classes="section-title")
+                    yield Static("[dim]H[/dim]      Browse session history", classes="shortcut-row")
+                    yield Static("[dim]I[/dim]      Show statistics and focus heatmap", classes="shortcut-row")
                     yield Static("[dim]?[/dim]      Show this help screen", classes="shortcut-row")
                     yield Static("[dim]Q[/dim]      Quit application", classes="shortcut-row")
 
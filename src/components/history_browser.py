@@ -0,0 +1,242 @@
+"""
+History browser listing past sessions with sorting and filtering.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from rich.markup import escape
+from rich.segment import Segment
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.geometry import Size
+from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Static
+
+from src.history import HistoryStore, get_history_store
+from src.utils.helpers import format_time
+from src.utils.constants import (
+    PHASE_NAMES,
+    STATE_WORK,
+    STATE_SHORT_BREAK,
+    STATE_LONG_BREAK,
+)
+
+
+# Rows fetched from the history store per query
+PAGE_SIZE = 100
+
+# Pages kept in memory (a few viewports worth)
+MAX_CACHED_PAGES = 8
+
+# Filter cycle: (kind, label)
+FILTERS = [
+    (None, "All sessions"),
+    (STATE_WORK, PHASE_NAMES[STATE_WORK].title()),
+    (STATE_SHORT_BREAK, PHASE_NAMES[STATE_SHORT_BREAK].title()),
+    (STATE_LONG_BREAK, PHASE_NAMES[STATE_LONG_BREAK].title()),
+]
+
+
+def format_session_row(record: Dict[str, Any]) -> str:
+    """
+    Format a session record as a single list row.
+
+    Args:
+        record: Session record
+
+    Returns:
+        Row text
+    """
+    start = datetime.fromtimestamp(record["start"]).strftime("%Y-%m-%d %H:%M")
+    kind = PHASE_NAMES.get(record.get("kind", ""), record.get("kind", "")).title()
+    duration = format_time(int(record.get("duration", 0)))
+    status = "✓" if record.get("completed") else "✗"
+    pauses = record.get("pauses", 0)
+    tag = record.get("tag", "")
+    return f" {start}  {kind:<12} {duration:>6}  {status}  {pauses:>2} pauses  {tag}"
+
+
+class SessionList(ScrollView):
+    """
+    Virtualized list of sessions.
+
+    Only visible rows are rendered, and rows are fetched from the history
+    store one page at a time, so memory scales with the viewport rather
+    than the size of the history.
+    """
+
+    def __init__(self, store: HistoryStore, *args, **kwargs):
+        """
+        Initialize the session list.
+
+        Args:
+            store: History store to page through
+        """
+        super().__init__(*args, **kwargs)
+        self.store = store
+        self.descending = True
+        self.kind: Optional[str] = None
+        self.tag: Optional[str] = None
+        self.total = 0
+        self._pages: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+
+    def reload(self, descending: bool, kind: Optional[str], tag: Optional[str] = None) -> None:
+        """
+        Apply a new sort order and filter.
+
+        Args:
+            descending: True for newest first
+            kind: Only show sessions of this kind, or None for all
+            tag: Only show sessions with this tag, or None for all
+        """
+        self.descending = descending
+        self.kind = kind
+        self.tag = tag
+        self.total = self.store.count(kind, tag)
+        self._pages.clear()
+        self.virtual_size = Size(self.size.width, self.total)
+        self.scroll_to(y=0, animate=False)
+        self.refresh()
+
+    def _get_page(self, page_number: int) -> List[Dict[str, Any]]:
+        """Fetch a page, keeping only the most recently used pages."""
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self.store.page(
+                page_number * PAGE_SIZE,
+                PAGE_SIZE,
+                descending=self.descending,
+                kind=self.kind,
+                tag=self.tag,
+            )
+            self._pages[page_number] = page
+            while len(self._pages) > MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+        return page
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row."""
+        scroll_x, scroll_y = self.scroll_offset
+        row = scroll_y + y
+        width = self.size.width
+        if row >= self.total:
+            return Strip.blank(width, self.rich_style)
+
+        page = self._get_page(row // PAGE_SIZE)
+        index = row % PAGE_SIZE
+        if index >= len(page):
+            return Strip.blank(width, self.rich_style)
+
+        text = format_session_row(page[index])
+        strip = Strip([Segment(text, self.rich_style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+
+class HistoryBrowser(ModalScreen[None]):
+    """Modal screen for browsing past sessions."""
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", priority=True),
+        Binding("h", "close", "Close"),
+        Binding("o", "toggle_sort", "Sort"),
+        Binding("f", "cycle_filter", "Filter"),
+        Binding("g", "cycle_tag", "Tag"),
+    ]
+
+    CSS = """
+    HistoryBrowser {
+        align: center middle;
+    }
+
+    #history-container {
+        width: 80;
+        height: 80%;
+        background: $panel;
+        border: heavy $primary;
+        padding: 1 2;
+    }
+
+    #history-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #history-list {
+        height: 1fr;
+        border: solid $primary;
+    }
+
+    #history-status {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    def __init__(self, store: Optional[HistoryStore] = None):
+        """
+        Initialize the history browser.
+
+        Args:
+            store: History store to browse. If None, uses the global store.
+        """
+        super().__init__()
+        self.store = store or get_history_store()
+        self.descending = True
+        self.filter_index = 0
+        self.tags: List[Optional[str]] = [None]
+        self.tag_index = 0
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets for the history browser."""
+        with Container(id="history-container"):
+            yield Static("Session History", id="history-title")
+            yield SessionList(self.store, id="history-list")
+            yield Static("", id="history-status")
+
+    def on_mount(self) -> None:
+        """Load the first page when mounted."""
+        self.tags = [None] + self.store.tags()
+        self._reload()
+        self.query_one("#history-list", SessionList).focus()
+
+    def _reload(self) -> None:
+        """Reload the list with the current sort and filter."""
+        kind, label = FILTERS[self.filter_index]
+        tag = self.tags[self.tag_index]
+        session_list = self.query_one("#history-list", SessionList)
+        session_list.reload(self.descending, kind, tag)
+
+        order = "newest first" if self.descending else "oldest first"
+        tag_label = escape(f"#{tag}") if tag else "All tags"
+        self.query_one("#history-status", Static).update(
+            f"{session_list.total} sessions • {label} • {tag_label} • {order}\n"
+            "[dim]↑↓ PgUp PgDn[/dim] Scroll  •  [dim]O[/dim] Sort  •  "
+            "[dim]F[/dim] Filter  •  [dim]G[/dim] Tag  •  [dim]Esc[/dim] Close"
+        )
+
+    def action_toggle_sort(self) -> None:
+        """Toggle between newest and oldest first."""
+        self.descending = not self.descending
+        self._reload()
+
+    def action_cycle_filter(self) -> None:
+        """Cycle through session kind filters."""
+        self.filter_index = (self.filter_index + 1) % len(FILTERS)
+        self._reload()
+
+    def action_cycle_tag(self) -> None:
+        """Cycle through the tags used in the history."""
+        self.tag_index = (self.tag_index + 1) % len(self.tags)
+        self._reload()
+
+    def action_close(self) -> None:
+        """Close the history browser."""
+        self.dismiss()
@@ -89,11 +89,12 @@ class SettingsPanel(ModalScreen[bool]):
         self.config = get_config()
 
         # Load current settings
-        self.work_duration = self.config.get("timer", "work_duration", 25)
-        self.short_break = self.config.get("timer", "short_break_duration", 5)
-        self.long_break = self.config.get("timer", "long_break_duration", 15)
-        self.pomodoros_until_long = self.config.get("timer", "pomodoros_until_long_break", 4)
-        self.audio_enabled = self.config.get("audio", "enabled", True)
+        settings = self.config.settings
+        self.work_duration = settings.timer.work_duration
+        self.short_break = settings.timer.short_break_duration
+        self.long_break = settings.timer.long_break_duration
+        self.pomodoros_until_long = settings.timer.pomodoros_until_long_break
+        self.audio_enabled = settings.audio.enabled
 
     def compose(self) -> ComposeResult:
         """Create child widgets for settings panel."""
@@ -209,11 +210,19 @@ class SettingsPanel(ModalScreen[bool]):
             audio_checkbox = self.query_one("#checkbox-audio", Checkbox)
             audio_enabled = audio_checkbox.value
 
-            # Save to config
-            self.config.set("timer", "work_duration", work_duration)
-            self.config.set("timer", "short_break_duration", short_break)
-            self.config.set("timer", "long_break_duration", long_break)
-            self.config.set("timer", "pomodoros_until_long_break", pomodoros)
+            # Save to config (durations go to the active profile, if any)
+            durations = {
+                "work_duration": work_duration,
+                "short_break_duration": short_break,
+                "long_break_duration": long_break,
+                "pomodoros_until_long_break": pomodoros,
+            }
+            profile = self.config.settings.active_profile
+            if profile:
+                self.config.set("profiles", profile, {**self.config.get("profiles", profile, {}), **durations})
+            else:
+                for key, value in durations.items():
+                    self.config.set("timer", key, value)
             self.config.set("audio", "enabled", audio_enabled)
             self.config.save()
 
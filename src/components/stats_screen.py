@@ -0,0 +1,195 @@
+"""
+Statistics screen with focus totals and a calendar heatmap.
+"""
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container, Horizontal
+from textual.screen import ModalScreen
+from textual.widgets import Button, Static
+
+from src.components.heatmap import FocusHeatmap
+from src.stats import Rollups, get_rollups
+from src.utils.helpers import format_duration, round_to_minute
+
+
+# Most used tags listed on the stats screen
+MAX_LISTED_TAGS = 5
+
+
+class StatsScreen(ModalScreen[None]):
+    """Modal screen showing focus statistics."""
+
+    BINDINGS = [
+        Binding("escape", "close", "Close", priority=True),
+        Binding("i", "close", "Close"),
+    ]
+
+    CSS = """
+    StatsScreen {
+        align: center middle;
+    }
+
+    #stats-container {
+        width: 65;
+        height: auto;
+        background: $panel;
+        border: heavy $primary;
+        padding: 1 2;
+    }
+
+    #stats-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #stats-summary {
+        margin-bottom: 1;
+    }
+
+    #stats-tags {
+        margin-bottom: 1;
+    }
+
+    #stats-suggestions {
+        margin-bottom: 1;
+    }
+
+    #stats-heatmap {
+        margin-bottom: 1;
+    }
+
+    #stats-buttons {
+        width: 100%;
+        height: auto;
+        align: center middle;
+    }
+    """
+
+    def __init__(self, rollups: Optional[Rollups] = None):
+        """
+        Initialize the stats screen.
+
+        Args:
+            rollups: Rollups to display. If None, uses the global rollups.
+        """
+        super().__init__()
+        self.rollups = rollups or get_rollups()
+
+    def compose(self) -> ComposeResult:
+        """Create child widgets for the stats screen."""
+        with Container(id="stats-container"):
+            yield Static("Statistics", id="stats-title")
+            yield Static(self._summary(), id="stats-summary")
+            yield Static(self._tag_summary(), id="stats-tags")
+            yield Static("[dim]Analyzing your sessions...[/dim]", id="stats-suggestions")
+            yield FocusHeatmap(self.rollups, id="stats-heatmap")
+            with Horizontal(id="stats-buttons"):
+                yield Button("Close", id="btn-close", variant="primary")
+
+    def on_mount(self) -> None:
+        """Compute the suggestions without blocking the UI."""
+        self.run_worker(self._load_suggestions, thread=True, exclusive=True, exit_on_error=False)
+
+    def _load_suggestions(self) -> None:
+        """Load (or recompute) the suggestions in a worker thread."""
+        from numpy.linalg import LinAlgError
+
+        from src.recommendations import Recommendations
+
+        error: Optional[str] = None
+        try:
+            results: Optional[Dict[str, Any]] = Recommendations(self.rollups.store).get()
+        except (ValueError, OSError, LinAlgError) as e:
+            # E.g. a corrupt recommendations file or a fit on degenerate data
+            results, error = None, str(e)
+        self.app.call_from_thread(self._show_suggestions, results, error)
+
+    def _show_suggestions(self, results: Optional[Dict[str, Any]], error: Optional[str] = None) -> None:
+        """Display the suggestions computed by the worker, or why it failed."""
+        if not self.is_mounted:
+            # Closed while the worker was running
+            return
+        rows = ["[bold]Suggestions:[/bold]"]
+        if results is None:
+            rows.append("  [dim]Suggestions could not be computed[/dim]")
+            self.query_one("#stats-suggestions", Static).update("\n".join(rows))
+            self.app.notify(f"Error computing suggestions: {escape(error or 'unknown error')}", severity="error")
+            return
+        if results["work_duration"]:
+            rows.append(f"  Focus for {results['work_duration']} min (you finish those without pausing)")
+        if results["short_break"]:
+            rows.append(f"  Take {results['short_break']} min short breaks")
+        if results["best_hours"]:
+            hours = ", ".join(f"{hour:02d}:00" for hour in results["best_hours"])
+            rows.append(f"  Your most productive hours: {hours}")
+        if len(rows) == 1:
+            rows.append("  [dim]Complete a few more sessions to get suggestions[/dim]")
+        self.query_one("#stats-suggestions", Static).update("\n".join(rows))
+
+    def _summary(self) -> str:
+        """Build the totals summary text."""
+        today = date.today()
+        periods = [
+            ("Today", today, today),
+            ("This week", today - timedelta(days=today.weekday()), today),
+            ("Last 30 days", today - timedelta(days=29), today),
+        ]
+        rows = []
+        for label, start, end in periods:
+            totals = self.rollups.totals(start, end)
+            rows.append(
+                f"[bold]{label + ':':<14}[/bold]"
+                f"{totals['pomodoros']:>4} pomodoros  "
+                f"{format_duration(totals['focus_seconds']):>8} focus"
+            )
+
+        # Typical values over the last 30 days from the quantile sketches
+        start = today - timedelta(days=29)
+        focus = self.rollups.quantiles("focus_length", start, today)
+        if focus[0.5] is not None:
+            rows.append(
+                f"[bold]{'Focus block:':<14}[/bold]"
+                f"  p50 {format_duration(round_to_minute(focus[0.5]))}"
+                f"  p90 {format_duration(round_to_minute(focus[0.9]))}"
+            )
+            started = self.rollups.quantiles("start_minute", start, today)
+            hour, minute = divmod(round(started[0.5]) % (24 * 60), 60)
+            rows.append(f"[bold]{'Usual start:':<14}[/bold]  around {hour:02d}:{minute:02d}")
+        pauses = self.rollups.quantiles("pause_seconds", start, today)
+        if pauses[0.5] is not None:
+            rows.append(
+                f"[bold]{'Paused for:':<14}[/bold]"
+                f"  p50 {format_duration(round_to_minute(pauses[0.5]))}"
+                f"  p90 {format_duration(round_to_minute(pauses[0.9]))}"
+            )
+        return "\n".join(rows)
+
+    def _tag_summary(self) -> str:
+        """Build the per-tag totals text for the last 30 days."""
+        since = time.mktime((date.today() - timedelta(days=29)).timetuple())
+        totals = self.rollups.store.tag_totals(since=since)
+        if not totals:
+            return "[dim]Tag sessions with G to see per-project totals[/dim]"
+        ranked = sorted(totals.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        rows = ["[bold]Top tags (last 30 days):[/bold]"]
+        for tag, total in ranked[:MAX_LISTED_TAGS]:
+            rows.append(
+                f"  {escape(f'{tag[:20]:<20}')}{total['sessions']:>6} sessions  "
+                f"{format_duration(total['seconds']):>8}"
+            )
+        return "\n".join(rows)
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """Handle button press events."""
+        if event.button.id == "btn-close":
+            self.action_close()
+
+    def action_close(self) -> None:
+        """Close the stats screen."""
+        self.dismiss()
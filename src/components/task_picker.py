@@ -0,0 +1,170 @@
+"""
+Task picker with incremental fuzzy search.
+"""
+from typing import Optional
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widgets import Input, OptionList, Static
+from textual.widgets.option_list import Option
+
+from src.tasks import TaskStore, get_task_store
+
+
+# Tasks listed at once
+MAX_LISTED_TASKS = 50
+
+# Option ids for the entries that are not tasks
+CREATE_OPTION_ID = "__create__"
+DETACH_OPTION_ID = "__detach__"
+
+
+class TaskPicker(ModalScreen[Optional[str]]):
+    """
+    Modal screen for attaching the next pomodoros to a task.
+
+    Dismisses with the chosen task id, an empty string to detach the
+    current task, or None when cancelled.
+    """
+
+    CSS = """
+    TaskPicker {
+        align: center middle;
+    }
+
+    #task-picker-container {
+        width: 70;
+        height: auto;
+        background: $panel;
+        border: thick $primary;
+        padding: 1 2;
+    }
+
+    #task-picker-title {
+        width: 100%;
+        content-align: center middle;
+        text-style: bold;
+        color: $primary;
+        margin-bottom: 1;
+    }
+
+    #task-list {
+        width: 100%;
+        height: 14;
+        border: solid $primary;
+        margin: 1 0;
+    }
+
+    #task-picker-help {
+        width: 100%;
+        text-align: center;
+        color: $text-muted;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel", priority=True),
+        Binding("down", "cursor_down", "Next", priority=True),
+        Binding("up", "cursor_up", "Previous", priority=True),
+        Binding("ctrl+d", "mark_done", "Done", priority=True),
+    ]
+
+    AUTO_FOCUS = "#task-search"
+
+    def __init__(self, current: Optional[str] = None, tasks: Optional[TaskStore] = None):
+        """
+        Initialize the task picker.
+
+        Args:
+            current: Id of the currently attached task, if any
+            tasks: Task store to pick from. If None, uses the global store.
+        """
+        super().__init__()
+        self.current = current
+        self.tasks = tasks or get_task_store()
+
+    def compose(self) -> ComposeResult:
+        """Compose the task picker UI."""
+        with Container(id="task-picker-container"):
+            yield Static("Attach a Task", id="task-picker-title")
+            yield Input(placeholder="Type to search or create a task", id="task-search")
+            yield OptionList(id="task-list")
+            yield Static(
+                "[dim]↑↓[/dim] Navigate  •  [dim]Enter[/dim] Attach  •  "
+                "[dim]Ctrl+D[/dim] Mark done  •  [dim]Esc[/dim] Cancel",
+                id="task-picker-help",
+            )
+
+    def on_mount(self) -> None:
+        """Show the most recent tasks."""
+        self._show_matches("")
+
+    def _show_matches(self, query: str) -> None:
+        """Replace the listed tasks with the matches for a query."""
+        options = []
+        if not query.strip() and self.current:
+            options.append(Option("[dim]No task[/dim]", id=DETACH_OPTION_ID))
+
+        matches = self.tasks.search(query, limit=MAX_LISTED_TASKS)
+        for task in matches:
+            marker = "● " if task["id"] == self.current else "  "
+            count = f"  [dim]{task['pomodoros']} 🍅[/dim]" if task.get("pomodoros") else ""
+            options.append(Option(f"{marker}{escape(task['title'])}{count}", id=task["id"]))
+
+        title = query.strip()
+        if title and not any(task["title"].lower() == title.lower() for task in matches):
+            options.append(Option(f"  [bold]+[/bold] Create “{escape(title)}”", id=CREATE_OPTION_ID))
+
+        option_list = self.query_one("#task-list", OptionList)
+        option_list.set_options(options)
+        if options:
+            option_list.highlighted = 0
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Search again as the query changes."""
+        self._show_matches(event.value)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Attach the highlighted task."""
+        option = self.query_one("#task-list", OptionList).highlighted_option
+        if option is not None:
+            self._choose(option.id)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Attach a task picked with the mouse."""
+        self._choose(event.option.id)
+
+    def _choose(self, option_id: Optional[str]) -> None:
+        """Dismiss with the task behind an option, creating it if needed."""
+        if option_id == DETACH_OPTION_ID:
+            self.dismiss("")
+        elif option_id == CREATE_OPTION_ID:
+            title = self.query_one("#task-search", Input).value
+            self.dismiss(self.tasks.add(title)["id"])
+        elif option_id:
+            self.dismiss(option_id)
+
+    def action_cursor_down(self) -> None:
+        """Highlight the next task."""
+        self.query_one("#task-list", OptionList).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        """Highlight the previous task."""
+        self.query_one("#task-list", OptionList).action_cursor_up()
+
+    def action_mark_done(self) -> None:
+        """Mark the highlighted task as done and hide it."""
+        option = self.query_one("#task-list", OptionList).highlighted_option
+        if option is None or option.id in (CREATE_OPTION_ID, DETACH_OPTION_ID):
+            return
+        self.tasks.set_done(option.id)
+        if option.id == self.current:
+            self.current = None
+        self._show_matches(self.query_one("#task-search", Input).value)
+
+    def action_cancel(self) -> None:
+        """Close without changing the attached task."""
+        self.dismiss(None)
@@ -1,24 +1,66 @@
 """
 Configuration management for the Pomodoro TUI application.
+
+Changes are written behind: save() only marks the configuration dirty,
+and a background thread writes it once no further save() has arrived for
+CONFIG_SAVE_DELAY seconds. The file is replaced atomically, and pending
+changes are flushed when the process exits. A failed write is kept in
+write_error and passed to on_write_error, so the app can show it.
+
+Edits made to the file while the app runs are picked up by
+reload_if_changed(), which costs one stat() call when nothing changed.
+
+Values are validated against the typed schema in src.config_schema;
+config.settings is the resulting immutable snapshot.
+
+The parsed configuration is also kept as a marshal snapshot keyed by the
+file's mtime, size and CONFIG_SCHEMA_VERSION, so startups with an
+unchanged file neither import nor run the TOML parser.
+
+The dictionaries and settings read by the timer and UI threads are never
+changed once published. Writers copy what they change, validate the copy
+and publish it as a new snapshot with a single assignment, so readers
+take no lock and always see one consistent configuration.
 """
+import atexit
+import marshal
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
-import toml
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from src.config_schema import Settings, apply_profile, parse_settings
 from src.utils.constants import (
+    CONFIG_CACHE_FILE,
     CONFIG_DIR,
     CONFIG_FILE,
+    CONFIG_SCHEMA_VERSION,
+    CONFIG_SAVE_DELAY,
     DEFAULT_WORK_DURATION,
     DEFAULT_SHORT_BREAK_DURATION,
     DEFAULT_LONG_BREAK_DURATION,
     DEFAULT_POMODOROS_UNTIL_LONG_BREAK,
     DEFAULT_THEME,
     DEFAULT_VOLUME,
+    DEFAULT_AUDIO_BACKEND,
     DEFAULT_AUDIO_ENABLED,
+    DEFAULT_DAILY_GOAL,
+    DEFAULT_WEEKLY_GOAL,
+    DEFAULT_DAY_START,
+    DEFAULT_DAY_END,
     ART_STYLE_TOMATO,
 )
 
 
+class _Snapshot(NamedTuple):
+    """One published configuration; its dictionaries must not be changed."""
+
+    data: Dict[str, Any]
+    settings: Settings
+    # Ready-made settings for each profile, so switching is a swap
+    profiles: Dict[str, Settings]
+
+
 class Config:
     """Manages application configuration loading, saving, and access."""
 
@@ -26,9 +68,36 @@ class Config:
         """Initialize configuration manager."""
         self.config_dir = Path(CONFIG_DIR).expanduser()
         self.config_path = self.config_dir / CONFIG_FILE
-        self.config_data: Dict[str, Any] = {}
+        self.cache_path = self.config_dir / CONFIG_CACHE_FILE
+        self._snapshot = _Snapshot({}, Settings(), {})
         self._ensure_config_dir()
 
+        # _lock serializes publishing snapshots and guards the dirty flag,
+        # _write_lock keeps snapshots reaching the disk in order
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._save_due = 0.0
+        self._writer: Optional[threading.Thread] = None
+
+        # (mtime_ns, size) of the file as last read or written
+        self._stamp: Optional[Tuple[int, int]] = None
+
+        # Why the last write failed (None after a successful one), and who
+        # to tell; without a handler the error is printed
+        self.write_error: Optional[str] = None
+        self.on_write_error: Optional[Callable[[str], None]] = None
+
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """The current configuration dictionary (read-only)."""
+        return self._snapshot.data
+
+    @property
+    def settings(self) -> Settings:
+        """The current validated settings."""
+        return self._snapshot.settings
+
     def _ensure_config_dir(self) -> None:
         """Ensure the configuration directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -60,6 +129,7 @@ class Config:
             "audio": {
                 "enabled": DEFAULT_AUDIO_ENABLED,
                 "volume": DEFAULT_VOLUME,
+                "backend": DEFAULT_AUDIO_BACKEND,
                 "work_complete_sound": "complete.wav",
                 "break_complete_sound": "break.wav",
             },
@@ -67,6 +137,29 @@ class Config:
                 "track_sessions": True,
                 "save_history": True,
                 "history_file": "~/.pomodoro-tui/history.json",
+                "history_dir": "~/.pomodoro-tui/history",
+            },
+            "goals": {
+                "daily_pomodoros": DEFAULT_DAILY_GOAL,
+                "weekly_pomodoros": DEFAULT_WEEKLY_GOAL,
+            },
+            "calendar": {
+                "ics_path": "",
+                "day_start": DEFAULT_DAY_START,
+                "day_end": DEFAULT_DAY_END,
+            },
+            "profiles": {
+                "active": "",
+                "Deep work": {
+                    "work_duration": 45,
+                    "short_break_duration": 10,
+                    "long_break_duration": 20,
+                    "pomodoros_until_long_break": 3,
+                },
+                "Meetings day": {
+                    "work_duration": 25,
+                    "short_break_duration": 5,
+                },
             },
         }
 
@@ -77,41 +170,261 @@ class Config:
         Returns:
             Configuration dictionary
         """
-        if self.config_path.exists():
+        # Changes not yet written would otherwise be lost
+        self.flush()
+
+        stamp = self._file_stamp()
+        if stamp is not None:
+            current = self._snapshot.data
+            if current and stamp == self._stamp:
+                # Unchanged since it was last read or written
+                return current
             try:
-                self.config_data = toml.load(self.config_path)
-                # Merge with defaults to ensure all keys exist
-                default_config = self._get_default_config()
-                for section, values in default_config.items():
-                    if section not in self.config_data:
-                        self.config_data[section] = values
-                    else:
-                        for key, value in values.items():
-                            if key not in self.config_data[section]:
-                                self.config_data[section][key] = value
+                config_data = self._read(stamp)
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
-                self.config_data = self._get_default_config()
+                config_data = self._get_default_config()
+            self._stamp = stamp
         else:
-            self.config_data = self._get_default_config()
+            config_data = self._get_default_config()
+
+        with self._lock:
+            config_data, settings = self._validate(config_data)
+            self._publish(config_data, settings)
+        if stamp is None:
             self.save()
+        return config_data
+
+    def _validate(self, config_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Settings]:
+        """
+        Build the typed settings, resetting rejected values to their defaults.
 
-        return self.config_data
+        Args:
+            config_data: Configuration dictionary (left unchanged)
 
-    def save(self) -> bool:
+        Returns:
+            (config_data, settings) tuple; the dictionary is a corrected
+            copy if any value was rejected
+        """
+        settings, rejected = parse_settings(config_data)
+        if rejected:
+            config_data = dict(config_data)
+        for section, key, value, reason in rejected:
+            print(f"Error in config: {section}.{key} = {value!r} ({reason}). Using default.")
+            if section != "profiles":
+                value = getattr(getattr(settings, section), key)
+                config_data[section] = {**config_data[section], key: value}
+            elif key == "active":
+                config_data[section] = {**config_data[section], key: ""}
+            else:
+                name, _, key = key.rpartition(".")
+                profile = {k: v for k, v in config_data[section][name].items() if k != key}
+                config_data[section] = {**config_data[section], name: profile}
+        return config_data, settings
+
+    def _publish(self, config_data: Dict[str, Any], settings: Settings) -> None:
         """
-        Save current configuration to file.
+        Make a configuration current and prepare settings for each profile.
+
+        Callers hold _lock, so snapshots are published one at a time.
+
+        Args:
+            config_data: Validated configuration dictionary, not to be changed afterwards
+            settings: Settings validated from it
+        """
+        profiles = {profile.name: apply_profile(settings, profile.name) for profile in settings.profiles}
+        self._snapshot = _Snapshot(config_data, settings, profiles)
+
+    def _read(self, stamp: Tuple[int, int]) -> Dict[str, Any]:
+        """
+        Parse the configuration file and fill in missing keys with defaults.
+
+        Args:
+            stamp: Current (mtime_ns, size) of the file
 
         Returns:
-            True if successful, False otherwise
+            Configuration dictionary, from the cached snapshot if it matches
         """
+        cached = self._read_cache(stamp)
+        if cached is not None:
+            return cached
+
+        import toml
+
+        config_data = toml.load(self.config_path)
+        # Merge with defaults to ensure all keys exist
+        default_config = self._get_default_config()
+        for section, values in default_config.items():
+            if section not in config_data:
+                config_data[section] = values
+            else:
+                for key, value in values.items():
+                    # Tables (profiles) the user removed are not brought back
+                    if key not in config_data[section] and not isinstance(value, dict):
+                        config_data[section][key] = value
+
         try:
-            with open(self.config_path, "w") as f:
-                toml.dump(self.config_data, f)
-            return True
+            self._write_cache(stamp, marshal.dumps(config_data))
+        except ValueError:
+            # Values marshal cannot store (e.g. TOML dates) are never cached
+            pass
+        return config_data
+
+    def _read_cache(self, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Get the cached snapshot if it was taken of this exact file, else None."""
+        try:
+            with open(self.cache_path, "rb") as f:
+                # The header is checked before the snapshot is unmarshalled
+                if marshal.load(f) != (CONFIG_SCHEMA_VERSION, stamp):
+                    return None
+                config_data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return config_data if isinstance(config_data, dict) else None
+
+    def _write_cache(self, stamp: Optional[Tuple[int, int]], snapshot: bytes) -> None:
+        """
+        Atomically replace the cached snapshot.
+
+        Args:
+            stamp: (mtime_ns, size) of the file the snapshot was taken of
+            snapshot: Marshalled configuration dictionary
+        """
+        if stamp is None:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps((CONFIG_SCHEMA_VERSION, stamp)))
+                f.write(snapshot)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Error saving config cache: {e}")
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of the configuration file, or None if missing."""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Re-read the configuration file if it was changed by someone else.
+
+        Changes still waiting to be written take precedence and are not
+        reloaded over.
+
+        Returns:
+            Changed values as section -> {key: new value} (empty if none)
+        """
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return {}
+        with self._lock:
+            if self._dirty:
+                return {}
+        try:
+            config_data = self._read(stamp)
         except Exception as e:
-            print(f"Error saving config: {e}")
-            return False
+            print(f"Error reloading config: {e}")
+            self._stamp = stamp
+            return {}
+
+        with self._lock:
+            # A change made while the file was read wins over the file
+            if self._dirty:
+                return {}
+            config_data, settings = self._validate(config_data)
+            changes = diff_config(self._snapshot.data, config_data)
+            self._publish(config_data, settings)
+            self._stamp = stamp
+        return changes
+
+    def save(self) -> bool:
+        """
+        Schedule the current configuration to be written.
+
+        The write happens on a background thread once no other save() has
+        been requested for CONFIG_SAVE_DELAY seconds, so a burst of
+        changes costs a single write. Use flush() to write immediately.
+
+        Returns:
+            False if the previous write failed, True otherwise. Whether this
+            change is written is only known later: failures are stored in
+            write_error and passed to on_write_error (which may be called
+            from the writer thread).
+        """
+        with self._lock:
+            self._dirty = True
+            self._save_due = time.monotonic() + CONFIG_SAVE_DELAY
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="config-writer", daemon=True)
+                self._writer.start()
+        return self.write_error is None
+
+    def _write_behind(self) -> None:
+        """Wait for changes to settle, then write them (background thread)."""
+        while True:
+            with self._lock:
+                if not self._dirty:
+                    self._writer = None
+                    return
+                delay = self._save_due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write pending changes now.
+
+        Returns:
+            True if successful or nothing was pending, False otherwise
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                self._dirty = False
+                # Published snapshots never change, so serializing needs no lock
+                config_data = self._snapshot.data
+            import toml
+
+            try:
+                text = toml.dumps(config_data)
+            except Exception as e:
+                self._write_failed(f"Error saving config: {e}")
+                return False
+            try:
+                snapshot: Optional[bytes] = marshal.dumps(config_data)
+            except ValueError:
+                snapshot = None
+
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+                os.replace(tmp_path, self.config_path)
+                self._stamp = self._file_stamp()
+            except OSError as e:
+                self._write_failed(f"Error saving config: {e}")
+                return False
+            self.write_error = None
+            # What was just written is already parsed; cache it for the next start
+            if snapshot is not None:
+                self._write_cache(self._stamp, snapshot)
+            return True
+
+    def _write_failed(self, message: str) -> None:
+        """Record a failed write and report it."""
+        self.write_error = message
+        if self.on_write_error is not None:
+            self.on_write_error(message)
+        else:
+            print(message)
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -125,10 +438,46 @@ class Config:
         Returns:
             Configuration value or default
         """
-        if not self.config_data:
-            self.load()
+        config_data = self._snapshot.data
+        if not config_data:
+            config_data = self.load()
 
-        return self.config_data.get(section, {}).get(key, default)
+        return config_data.get(section, {}).get(key, default)
+
+    def profile_names(self) -> List[str]:
+        """
+        List the profiles in the order they are cycled through.
+
+        Returns:
+            Profile names, starting with "" for the plain [timer] settings
+        """
+        return [profile.name for profile in self.settings.profiles]
+
+    def switch_profile(self, name: str) -> Settings:
+        """
+        Make a profile active.
+
+        The profile was validated when the configuration was loaded, so
+        this only swaps the current snapshot; remembering the choice is
+        left to the background writer.
+
+        Args:
+            name: Profile name ("" for the plain [timer] settings)
+
+        Returns:
+            The settings now current
+
+        Raises:
+            KeyError: If there is no profile with that name
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            settings = snapshot.profiles[name]
+            config_data = dict(snapshot.data)
+            config_data["profiles"] = {**config_data.get("profiles", {}), "active": name}
+            self._snapshot = snapshot._replace(data=config_data, settings=settings)
+        self.save()
+        return settings
 
     def set(self, section: str, key: str, value: Any) -> None:
         """
@@ -142,10 +491,10 @@ class Config:
         if not self.config_data:
             self.load()
 
-        if section not in self.config_data:
-            self.config_data[section] = {}
-
-        self.config_data[section][key] = value
+        with self._lock:
+            config_data = dict(self._snapshot.data)
+            config_data[section] = {**config_data.get(section, {}), key: value}
+            self._publish(*self._validate(config_data))
 
     def update(self, updates: Dict[str, Dict[str, Any]]) -> bool:
         """
@@ -160,10 +509,11 @@ class Config:
         if not self.config_data:
             self.load()
 
-        for section, values in updates.items():
-            if section not in self.config_data:
-                self.config_data[section] = {}
-            self.config_data[section].update(values)
+        with self._lock:
+            config_data = dict(self._snapshot.data)
+            for section, values in updates.items():
+                config_data[section] = {**config_data.get(section, {}), **values}
+            self._publish(*self._validate(config_data))
 
         return self.save()
 
@@ -174,10 +524,34 @@ class Config:
         Returns:
             True if successful, False otherwise
         """
-        self.config_data = self._get_default_config()
+        with self._lock:
+            self._publish(*self._validate(self._get_default_config()))
         return self.save()
 
 
+def diff_config(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the values that differ between two configurations.
+
+    Args:
+        old: Previous configuration dictionary
+        new: New configuration dictionary
+
+    Returns:
+        Values of new that are missing or different in old, as
+        section -> {key: value}
+    """
+    changes: Dict[str, Dict[str, Any]] = {}
+    for section, values in new.items():
+        if not isinstance(values, dict):
+            continue
+        previous = old.get(section, {})
+        for key, value in values.items():
+            if previous.get(key) != value:
+                changes.setdefault(section, {})[key] = value
+    return changes
+
+
 # Global config instance
 _config_instance: Optional[Config] = None
 
@@ -193,6 +567,7 @@ def get_config() -> Config:
     if _config_instance is None:
         _config_instance = Config()
         _config_instance.load()
+        atexit.register(_config_instance.flush)
     return _config_instance
 
 
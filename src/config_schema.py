@@ -0,0 +1,400 @@
+"""
+Typed configuration schema.
+
+Each config.toml section maps to a frozen, slotted settings class. The raw
+dictionaries are validated once when the configuration is loaded, using
+the same limits as the settings panel, so values read from disk that have
+the wrong type or are out of range are rejected in favour of the default.
+Hot paths read plain attributes (config.settings.timer.work_duration) of
+an immutable snapshot instead of looking up nested dictionaries.
+
+Named profiles ([profiles.<name>] tables) override the timer durations
+and theme. Each is validated into a complete snapshot up front, so
+switching profiles only swaps which snapshot is current.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.constants import (
+    ART_STYLE_FANCY,
+    ART_STYLE_MINIMAL,
+    ART_STYLE_TOMATO,
+    AUDIO_BACKENDS,
+    DEFAULT_AUDIO_BACKEND,
+    DEFAULT_AUDIO_ENABLED,
+    DEFAULT_DAILY_GOAL,
+    DEFAULT_DAY_END,
+    DEFAULT_DAY_START,
+    DEFAULT_LONG_BREAK_DURATION,
+    DEFAULT_POMODOROS_UNTIL_LONG_BREAK,
+    DEFAULT_SHORT_BREAK_DURATION,
+    DEFAULT_THEME,
+    DEFAULT_VOLUME,
+    DEFAULT_WEEKLY_GOAL,
+    DEFAULT_WORK_DURATION,
+    MAX_LONG_BREAK_DURATION,
+    MAX_POMODOROS_UNTIL_LONG_BREAK,
+    MAX_SHORT_BREAK_DURATION,
+    MAX_WORK_DURATION,
+    MIN_LONG_BREAK_DURATION,
+    MIN_POMODOROS_UNTIL_LONG_BREAK,
+    MIN_SHORT_BREAK_DURATION,
+    MIN_WORK_DURATION,
+)
+
+
+class FrozenInstanceError(AttributeError):
+    """Raised when a settings snapshot is changed in place."""
+
+
+# Default of a field that must always be given
+_REQUIRED = object()
+
+
+class _Frozen:
+    """
+    Base of the immutable, slotted settings classes.
+
+    Subclasses list their fields as (name, type, default) in _FIELDS and
+    repeat the names in __slots__. A default that is a class is called to
+    get the value. Written by hand rather than with dataclasses, which
+    would add the import of inspect to every command's startup.
+    """
+
+    __slots__ = ()
+    _FIELDS: Tuple[Tuple[str, type, Any], ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Set the fields from positional and keyword arguments, in _FIELDS order."""
+        if len(args) > len(self._FIELDS):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self._FIELDS)} arguments")
+        for index, (name, _, default) in enumerate(self._FIELDS):
+            if index < len(args):
+                value = args[index]
+            elif name in kwargs:
+                value = kwargs.pop(name)
+            elif default is _REQUIRED:
+                raise TypeError(f"{type(self).__name__} missing argument: {name}")
+            else:
+                value = default() if isinstance(default, type) else default
+            object.__setattr__(self, name, value)
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected arguments: {', '.join(kwargs)}")
+
+    def _values(self) -> Tuple[Any, ...]:
+        """Get the field values in _FIELDS order."""
+        return tuple(getattr(self, name) for name, _, _ in self._FIELDS)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name, _, _ in self._FIELDS)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return type(self), self._values()
+
+
+def replace(obj: Any, **changes: Any) -> Any:
+    """
+    Get a copy of a settings object with some fields changed.
+
+    Args:
+        obj: TimerSettings, Settings or another settings object
+        **changes: New field values
+
+    Returns:
+        New object of the same class
+    """
+    values = {name: getattr(obj, name) for name, _, _ in obj._FIELDS}
+    unknown = changes.keys() - values.keys()
+    if unknown:
+        raise TypeError(f"{type(obj).__name__} has no fields {', '.join(sorted(unknown))}")
+    values.update(changes)
+    return type(obj)(**values)
+
+
+class TimerSettings(_Frozen):
+    """The [timer] section."""
+
+    __slots__ = (
+        "work_duration",
+        "short_break_duration",
+        "long_break_duration",
+        "pomodoros_until_long_break",
+        "auto_start_breaks",
+        "auto_start_work",
+    )
+    _FIELDS = (
+        ("work_duration", int, DEFAULT_WORK_DURATION),
+        ("short_break_duration", int, DEFAULT_SHORT_BREAK_DURATION),
+        ("long_break_duration", int, DEFAULT_LONG_BREAK_DURATION),
+        ("pomodoros_until_long_break", int, DEFAULT_POMODOROS_UNTIL_LONG_BREAK),
+        ("auto_start_breaks", bool, False),
+        ("auto_start_work", bool, False),
+    )
+
+
+class AppearanceSettings(_Frozen):
+    """The [appearance] section."""
+
+    __slots__ = (
+        "theme",
+        "show_ascii_art",
+        "ascii_art_style",
+        "show_progress_bar",
+        "show_session_count",
+        "animations_enabled",
+    )
+    _FIELDS = (
+        ("theme", str, DEFAULT_THEME),
+        ("show_ascii_art", bool, True),
+        ("ascii_art_style", str, ART_STYLE_TOMATO),
+        ("show_progress_bar", bool, True),
+        ("show_session_count", bool, True),
+        ("animations_enabled", bool, True),
+    )
+
+
+class AudioSettings(_Frozen):
+    """The [audio] section."""
+
+    __slots__ = ("enabled", "volume", "backend", "work_complete_sound", "break_complete_sound")
+    _FIELDS = (
+        ("enabled", bool, DEFAULT_AUDIO_ENABLED),
+        ("volume", float, DEFAULT_VOLUME),
+        ("backend", str, DEFAULT_AUDIO_BACKEND),
+        ("work_complete_sound", str, "complete.wav"),
+        ("break_complete_sound", str, "break.wav"),
+    )
+
+
+class StatisticsSettings(_Frozen):
+    """The [statistics] section."""
+
+    __slots__ = ("track_sessions", "save_history", "history_file", "history_dir")
+    _FIELDS = (
+        ("track_sessions", bool, True),
+        ("save_history", bool, True),
+        ("history_file", str, "~/.pomodoro-tui/history.json"),
+        ("history_dir", str, "~/.pomodoro-tui/history"),
+    )
+
+
+class GoalSettings(_Frozen):
+    """The [goals] section."""
+
+    __slots__ = ("daily_pomodoros", "weekly_pomodoros")
+    _FIELDS = (
+        ("daily_pomodoros", int, DEFAULT_DAILY_GOAL),
+        ("weekly_pomodoros", int, DEFAULT_WEEKLY_GOAL),
+    )
+
+
+class CalendarSettings(_Frozen):
+    """The [calendar] section."""
+
+    __slots__ = ("ics_path", "day_start", "day_end")
+    _FIELDS = (
+        ("ics_path", str, ""),
+        ("day_start", str, DEFAULT_DAY_START),
+        ("day_end", str, DEFAULT_DAY_END),
+    )
+
+
+class Profile(_Frozen):
+    """A named set of timer durations and theme."""
+
+    __slots__ = ("name", "timer", "theme")
+    _FIELDS = (
+        ("name", str, _REQUIRED),
+        ("timer", TimerSettings, _REQUIRED),
+        ("theme", str, _REQUIRED),
+    )
+
+
+class Settings(_Frozen):
+    """Validated, immutable snapshot of the whole configuration."""
+
+    __slots__ = ("timer", "appearance", "audio", "statistics", "goals", "calendar", "profiles", "active_profile")
+    _FIELDS = (
+        ("timer", TimerSettings, TimerSettings),
+        ("appearance", AppearanceSettings, AppearanceSettings),
+        ("audio", AudioSettings, AudioSettings),
+        ("statistics", StatisticsSettings, StatisticsSettings),
+        ("goals", GoalSettings, GoalSettings),
+        ("calendar", CalendarSettings, CalendarSettings),
+        # The plain [timer] durations and theme as profile "", then the named profiles
+        ("profiles", tuple, ()),
+        # Name of the profile applied to timer and theme
+        ("active_profile", str, ""),
+    )
+
+
+# Settings fields holding a config.toml section
+SECTIONS = ("timer", "appearance", "audio", "statistics", "goals", "calendar")
+
+# Timer settings a profile may override (besides the theme)
+PROFILE_TIMER_KEYS = (
+    "work_duration",
+    "short_break_duration",
+    "long_break_duration",
+    "pomodoros_until_long_break",
+)
+
+
+# Inclusive (min, max) limits of numeric settings; None means unbounded
+LIMITS: Dict[Tuple[str, str], Tuple[Optional[float], Optional[float]]] = {
+    ("timer", "work_duration"): (MIN_WORK_DURATION, MAX_WORK_DURATION),
+    ("timer", "short_break_duration"): (MIN_SHORT_BREAK_DURATION, MAX_SHORT_BREAK_DURATION),
+    ("timer", "long_break_duration"): (MIN_LONG_BREAK_DURATION, MAX_LONG_BREAK_DURATION),
+    ("timer", "pomodoros_until_long_break"): (MIN_POMODOROS_UNTIL_LONG_BREAK, MAX_POMODOROS_UNTIL_LONG_BREAK),
+    ("audio", "volume"): (0.0, 1.0),
+    ("goals", "daily_pomodoros"): (1, None),
+    ("goals", "weekly_pomodoros"): (1, None),
+}
+
+# Settings restricted to a fixed set of values
+CHOICES: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    ("appearance", "ascii_art_style"): (ART_STYLE_TOMATO, ART_STYLE_MINIMAL, ART_STYLE_FANCY),
+    ("audio", "backend"): AUDIO_BACKENDS,
+}
+
+# Settings holding a wall-clock time (HH:MM)
+CLOCK_TIMES = {("calendar", "day_start"), ("calendar", "day_end")}
+
+
+def _coerce(value: Any, expected: type) -> Any:
+    """Get a value as the expected type, or raise TypeError if it is not one."""
+    # bool is an int subclass; neither may stand in for the other
+    if expected is bool:
+        if isinstance(value, bool):
+            return value
+    elif expected is int:
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    elif expected is float:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    elif isinstance(value, expected):
+        return value
+    raise TypeError(f"expected {expected.__name__}")
+
+
+def _check(section: str, key: str, value: Any) -> None:
+    """Raise ValueError if a value is outside the allowed range or choices."""
+    low, high = LIMITS.get((section, key), (None, None))
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ValueError(f"must be between {low} and {high}" if high is not None else f"must be at least {low}")
+    choices = CHOICES.get((section, key))
+    if choices and value not in choices:
+        raise ValueError(f"must be one of {', '.join(choices)}")
+    if (section, key) in CLOCK_TIMES:
+        datetime.strptime(value, "%H:%M")
+
+
+def parse_settings(config_data: Dict[str, Any]) -> Tuple[Settings, List[Tuple[str, str, Any, str]]]:
+    """
+    Validate configuration dictionaries into a typed snapshot.
+
+    Args:
+        config_data: Configuration dictionary (section -> {key: value})
+
+    Returns:
+        (settings, rejected) tuple; settings have the active profile
+        applied, and rejected lists (section, key, value, reason) for every
+        value replaced by its default. Rejected profile values have keys
+        like "Deep work.work_duration".
+    """
+    rejected: List[Tuple[str, str, Any, str]] = []
+    sections = {}
+    for section, section_cls, _ in Settings._FIELDS:
+        if section not in SECTIONS:
+            continue
+        values = _parse_values(section, section_cls, config_data.get(section), rejected)
+        sections[section] = section_cls(**values)
+    settings = Settings(**sections)
+
+    raw_profiles = config_data.get("profiles")
+    if not isinstance(raw_profiles, dict):
+        raw_profiles = {}
+    profiles = [Profile("", settings.timer, settings.appearance.theme)]
+    for name, raw in raw_profiles.items():
+        if not isinstance(raw, dict) or not name:
+            continue
+        overrides = _parse_values("timer", TimerSettings, raw, rejected, PROFILE_TIMER_KEYS, prefix=f"{name}.")
+        theme = raw.get("theme", settings.appearance.theme)
+        if not isinstance(theme, str):
+            rejected.append(("profiles", f"{name}.theme", theme, "expected str"))
+            theme = settings.appearance.theme
+        profiles.append(Profile(name, replace(settings.timer, **overrides), theme))
+
+    active = raw_profiles.get("active", "")
+    if not isinstance(active, str) or active not in {profile.name for profile in profiles}:
+        rejected.append(("profiles", "active", active, "no such profile"))
+        active = ""
+    settings = replace(settings, profiles=tuple(profiles))
+    return apply_profile(settings, active), rejected
+
+
+def _parse_values(
+    section: str,
+    section_cls: type,
+    raw: Any,
+    rejected: List[Tuple[str, str, Any, str]],
+    keys: Optional[Tuple[str, ...]] = None,
+    prefix: str = "",
+) -> Dict[str, Any]:
+    """Validate the values of a section, collecting rejected ones."""
+    if not isinstance(raw, dict):
+        return {}
+    values = {}
+    for name, expected, _ in section_cls._FIELDS:
+        if name not in raw or (keys is not None and name not in keys):
+            continue
+        value = raw[name]
+        try:
+            value = _coerce(value, expected)
+            _check(section, name, value)
+        except (TypeError, ValueError) as e:
+            rejected.append(("profiles" if prefix else section, prefix + name, value, str(e)))
+            continue
+        values[name] = value
+    return values
+
+
+def apply_profile(settings: Settings, name: str) -> Settings:
+    """
+    Get the settings with a profile's durations and theme applied.
+
+    Args:
+        settings: Settings with any profile active
+        name: Profile name ("" for the plain [timer] durations and theme)
+
+    Returns:
+        Settings snapshot with the profile active
+
+    Raises:
+        KeyError: If there is no profile with that name
+    """
+    for profile in settings.profiles:
+        if profile.name == name:
+            return replace(
+                settings,
+                timer=profile.timer,
+                appearance=replace(settings.appearance, theme=profile.theme),
+                active_profile=name,
+            )
+    raise KeyError(name)
@@ -0,0 +1,136 @@
+"""
+Streaming export of session history.
+
+Records flow from the history store through generators straight to the
+output stream, so memory use stays flat regardless of history size.
+"""
+import csv
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from src.history import HistoryStore
+
+
+# Column order for CSV exports
+CSV_FIELDS = ["id", "start", "duration", "planned", "kind", "completed", "pauses", "tag"]
+
+# Number of CSV rows handed to the writer per call
+WRITE_BATCH_SIZE = 4096
+
+
+def _batched(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Group an iterable of lines into lists of at most size items."""
+    iterator = iter(lines)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def csv_rows(records: Iterable[Dict[str, Any]]) -> Iterator[List[Any]]:
+    """
+    Convert session records into CSV rows.
+
+    Args:
+        records: Session records
+
+    Returns:
+        Iterator over rows matching CSV_FIELDS
+    """
+    for record in records:
+        start = datetime.fromtimestamp(record["start"]).astimezone()
+        yield [
+            record["id"],
+            start.isoformat(timespec="seconds"),
+            record.get("duration", 0),
+            record.get("planned", 0),
+            record.get("kind", ""),
+            record.get("completed", False),
+            record.get("pauses", 0),
+            record.get("tag", ""),
+        ]
+
+
+def export_jsonl(
+    store: HistoryStore,
+    out: TextIO,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> int:
+    """
+    Write sessions as JSON lines.
+
+    Args:
+        store: History store to read from
+        out: Text stream to write to
+        since: Inclusive lower bound as a Unix timestamp
+        until: Exclusive upper bound as a Unix timestamp
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for chunk in store.iter_chunks(since, until):
+        out.write(chunk)
+        count += chunk.count("\n")
+    return count
+
+
+def export_csv(
+    store: HistoryStore,
+    out: TextIO,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> int:
+    """
+    Write sessions as CSV with a header row.
+
+    Args:
+        store: History store to read from
+        out: Text stream to write to (opened with newline="")
+        since: Inclusive lower bound as a Unix timestamp
+        until: Exclusive upper bound as a Unix timestamp
+
+    Returns:
+        Number of records written
+    """
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    rows = csv_rows(store.iter_sessions(since, until))
+    for batch in _batched(rows, WRITE_BATCH_SIZE):
+        writer.writerows(batch)
+        count += len(batch)
+    return count
+
+
+def export_history(
+    store: HistoryStore,
+    fmt: str,
+    out: TextIO,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+) -> int:
+    """
+    Export sessions in the given format.
+
+    Args:
+        store: History store to read from
+        fmt: Export format ("csv" or "jsonl")
+        out: Text stream to write to
+        since: Inclusive lower bound as a Unix timestamp
+        until: Exclusive upper bound as a Unix timestamp
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt == "jsonl":
+        return export_jsonl(store, out, since, until)
+    if fmt == "csv":
+        return export_csv(store, out, since, until)
+    raise ValueError(f"Unsupported export format: {fmt}")
@@ -0,0 +1,935 @@
+"""
+Session history storage for the Pomodoro TUI.
+
+History is kept as monthly segments in the history directory. The segment
+for the current month is a plain JSON-lines file so appends stay cheap.
+Once a month is over its segment is compacted (superseded and deleted
+entries are dropped) and compressed with gzip.
+
+Lines of the active segment carry a CRC32 checksum so records torn by a
+crash can be detected; compressed segments rely on gzip's own CRC32.
+"""
+import json
+import gzip
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.config import get_config
+from src.history_index import HistoryIndex
+from src.history_integrity import (
+    frame_line,
+    line_is_valid,
+    quarantine,
+    scan_compressed,
+    scan_plain,
+    unframe_line,
+)
+
+
+# Segment file suffixes
+SEGMENT_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.gz"
+
+# Decompressed bytes read per block when streaming compacted segments
+READ_CHUNK_SIZE = 1 << 20
+
+# Number of decoded segments kept in memory for paged queries
+SEGMENT_CACHE_SIZE = 2
+
+# Shared compact encoder (json.dumps builds a new encoder per call
+# whenever separators are customized)
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def serialize_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize a record as a compact, newline-terminated JSON line.
+
+    Args:
+        record: Session record
+
+    Returns:
+        JSON line
+    """
+    return _encode(record) + "\n"
+
+
+def frame_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize a record as a checksummed line for the active segment.
+
+    Args:
+        record: Session record
+
+    Returns:
+        JSON line followed by the CRC32 of the JSON
+    """
+    return frame_line(_encode(record))
+
+
+def month_key(timestamp: float) -> str:
+    """
+    Get the segment key (UTC year and month) for a timestamp.
+
+    Args:
+        timestamp: Unix timestamp in seconds
+
+    Returns:
+        Segment key in YYYY-MM format
+    """
+    tm = time.gmtime(timestamp)
+    return f"{tm.tm_year:04d}-{tm.tm_mon:02d}"
+
+
+def month_bounds(key: str) -> tuple[float, float]:
+    """
+    Get the time range covered by a segment.
+
+    Args:
+        key: Segment key in YYYY-MM format
+
+    Returns:
+        Tuple of (start, end) Unix timestamps, end exclusive
+    """
+    year, month = (int(part) for part in key.split("-"))
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    if month == 12:
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
+    return start.timestamp(), end.timestamp()
+
+
+def new_record_id() -> str:
+    """
+    Generate a random record id.
+
+    uuid is imported here rather than at module level because it is slow
+    to import and read-only commands never create records.
+
+    Returns:
+        32 hex digits (a random UUID)
+    """
+    import uuid
+
+    return uuid.uuid4().hex
+
+
+def make_session_record(
+    kind: str,
+    start: float,
+    duration: int,
+    planned: int,
+    completed: bool,
+    pauses: int = 0,
+    tag: Optional[str] = None,
+    pause_seconds: int = 0,
+    task: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build a new session history record.
+
+    Args:
+        kind: Session kind (WORK, SHORT_BREAK or LONG_BREAK)
+        start: Unix timestamp when the session started
+        duration: Seconds actually spent in the session
+        planned: Planned session length in seconds
+        completed: True if the session ran to completion
+        pauses: Number of times the session was paused
+        tag: Project or task label, omitted when empty
+        pause_seconds: Total time spent paused, omitted when zero
+        task: Id of the task the session was spent on, omitted when empty
+
+    Returns:
+        Session record dictionary
+    """
+    record = {
+        "id": new_record_id(),
+        "start": round(start, 3),
+        "duration": duration,
+        "planned": planned,
+        "kind": kind,
+        "completed": completed,
+        "pauses": pauses,
+    }
+    if tag:
+        record["tag"] = tag
+    if pause_seconds:
+        record["pause_seconds"] = pause_seconds
+    if task:
+        record["task"] = task
+    return record
+
+
+def compact_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse a stream of records to the latest version of each session.
+
+    Later records with the same id supersede earlier ones and tombstones
+    (records with ``deleted`` set) remove the session entirely.
+
+    Args:
+        records: Records in the order they were written
+
+    Returns:
+        Live records sorted by start time
+    """
+    latest: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        # Re-insert so the dict order follows the latest write
+        latest.pop(record["id"], None)
+        latest[record["id"]] = record
+    live = [record for record in latest.values() if not record.get("deleted")]
+    live.sort(key=lambda record: record["start"])
+    return live
+
+
+def dedupe_key(record: Dict[str, Any]) -> tuple[int, int]:
+    """
+    Get the identity used to detect duplicate sessions across sources.
+
+    Args:
+        record: Session record
+
+    Returns:
+        Tuple of (start second, duration in seconds)
+    """
+    return int(record["start"]), int(record.get("duration", 0))
+
+
+class HistoryStore:
+    """Stores completed and interrupted sessions as monthly segments."""
+
+    def __init__(self, history_dir: Optional[Path] = None, read_only: bool = False):
+        """
+        Initialize the history store.
+
+        Args:
+            history_dir: Directory holding the segments. If None, uses the
+                         configured history directory.
+            read_only: Never create or write anything in the directory (the
+                       index is then kept in memory only)
+        """
+        if history_dir is None:
+            history_dir = Path(get_config().settings.statistics.history_dir).expanduser()
+        self.history_dir = Path(history_dir)
+        self.read_only = read_only
+        if not read_only:
+            self.history_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._active_month: Optional[str] = None
+
+        # Active segments whose tail has been checked for a torn last line
+        self._tail_checked: set = set()
+
+        # Decoded segments for paged queries, validated against fingerprints
+        self._segment_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self.index = HistoryIndex(self, persist=not read_only)
+
+        # Event callbacks
+        self._callbacks: Dict[str, List[Callable]] = {
+            "append": [],
+            "change": [],
+        }
+
+    def _segment_path(self, key: str) -> Path:
+        """Get the path of the uncompressed segment for a month."""
+        return self.history_dir / f"{key}{SEGMENT_SUFFIX}"
+
+    def _compressed_path(self, key: str) -> Path:
+        """Get the path of the compressed segment for a month."""
+        return self.history_dir / f"{key}{COMPRESSED_SUFFIX}"
+
+    def segments(self) -> List[str]:
+        """
+        Get the keys of all segments on disk.
+
+        Returns:
+            Sorted list of segment keys (YYYY-MM)
+        """
+        keys = set()
+        for path in self.history_dir.iterdir():
+            name = path.name
+            if name.endswith(COMPRESSED_SUFFIX):
+                keys.add(name[: -len(COMPRESSED_SUFFIX)])
+            elif name.endswith(SEGMENT_SUFFIX):
+                keys.add(name[: -len(SEGMENT_SUFFIX)])
+        return sorted(keys)
+
+    def on(self, event: str, callback: Callable) -> None:
+        """
+        Register a callback for a history event.
+
+        Args:
+            event: Event name (append for new sessions, change for edits,
+                   deletions and bulk loads)
+            callback: Callback function to invoke with the affected record
+                      (None for bulk loads)
+        """
+        if event in self._callbacks:
+            self._callbacks[event].append(callback)
+
+    def off(self, event: str, callback: Callable) -> None:
+        """
+        Unregister a callback for a history event.
+
+        Args:
+            event: Event name
+            callback: Callback function to remove
+        """
+        if event in self._callbacks and callback in self._callbacks[event]:
+            self._callbacks[event].remove(callback)
+
+    def _emit(self, event: str, *args) -> None:
+        """Emit an event to all registered callbacks."""
+        for callback in self._callbacks.get(event, []):
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in history callback for {event}: {e}")
+
+    def _write(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a raw record line to the segment for its start month."""
+        if "id" not in record:
+            record = dict(record, id=new_record_id())
+
+        key = month_key(record["start"])
+        line = frame_record(record)
+        with self._lock:
+            path = self._segment_path(key)
+            if key not in self._tail_checked:
+                # Never glue a new record onto a line torn by a crash
+                if not self._ends_with_newline(path):
+                    line = "\n" + line
+                self._tail_checked.add(key)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+            current = month_key(time.time())
+            if key < current or current != self._active_month:
+                self._active_month = current
+                self.rotate()
+        return record
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        """Check whether a file is empty, missing or ends with a newline."""
+        try:
+            with open(path, "rb") as f:
+                if f.seek(0, os.SEEK_END) == 0:
+                    return True
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
+
+    def append(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append a new session to the segment for its start month.
+
+        The first append after a month rollover closes the previous
+        segments, and records landing in an already closed month are
+        folded into its compressed segment straight away.
+
+        Args:
+            record: Session record (see make_session_record)
+
+        Returns:
+            The stored record
+        """
+        record = self._write(record)
+        self._emit("append", record)
+        return record
+
+    def update(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store an edited version of an existing record.
+
+        The new version supersedes the earlier one with the same id.
+
+        Args:
+            record: Full record including its original id and start
+
+        Returns:
+            The stored record
+        """
+        record = self._write(record)
+        self._emit("change", record)
+        return record
+
+    def delete(self, record: Dict[str, Any]) -> None:
+        """
+        Delete a record by writing a tombstone for it.
+
+        Args:
+            record: Record to delete (needs id and start)
+        """
+        self._write({"id": record["id"], "start": record["start"], "deleted": True})
+        self._emit("change", record)
+
+    def rotate(self, now: Optional[float] = None) -> List[str]:
+        """
+        Compact and compress every segment of a month that has ended.
+
+        Args:
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            Keys of the segments that were compacted
+        """
+        current = month_key(time.time() if now is None else now)
+        rotated = []
+        with self._lock:
+            for key in self.segments():
+                if key < current and self._segment_path(key).exists():
+                    self.compact_segment(key)
+                    rotated.append(key)
+        return rotated
+
+    def compact_segment(self, key: str) -> int:
+        """
+        Compact a month into its compressed segment.
+
+        Merges the compressed segment and any uncompressed entries for the
+        month, keeps only the latest version of each session and replaces
+        the compressed file atomically.
+
+        Args:
+            key: Segment key (YYYY-MM)
+
+        Returns:
+            Number of live records in the compacted segment
+        """
+        with self._lock:
+            records = compact_records(self._read_segment_files(key))
+            self._write_segment(key, records, compressed=True)
+            return len(records)
+
+    def _write_segment(
+        self,
+        key: str,
+        records: Iterable[Dict[str, Any]],
+        compressed: bool,
+    ) -> None:
+        """
+        Atomically replace a month's segment with the given records.
+
+        Records are written as they are consumed, so a generator can be
+        passed without holding the month in memory. Writing the compressed
+        segment also removes the uncompressed one, whose entries the
+        caller has already merged into records.
+        """
+        if compressed:
+            lines = (serialize_record(record) for record in records)
+            self.replace_file(self._compressed_path(key), lines, compressed=True)
+            segment = self._segment_path(key)
+            if segment.exists():
+                segment.unlink()
+        else:
+            lines = (frame_record(record) for record in records)
+            self.replace_file(self._segment_path(key), lines, compressed=False)
+
+    def replace_months(
+        self,
+        months: Iterable[tuple[str, Iterable[Dict[str, Any]]]],
+        now: Optional[float] = None,
+    ) -> int:
+        """
+        Atomically replace months with streams of records.
+
+        Each month is written as its records are consumed and swapped in on
+        its own. Closed months are written compressed; the active month
+        stays plain. A single "change" event is emitted at the end.
+
+        Args:
+            months: (segment key, live records sorted by start time) pairs
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            Number of months replaced
+        """
+        current = month_key(time.time() if now is None else now)
+        replaced = 0
+        with self._lock:
+            for key, records in months:
+                self._write_segment(key, records, compressed=key < current)
+                replaced += 1
+        if replaced:
+            self._emit("change", None)
+        return replaced
+
+    def replace_file(self, path: Path, data: Union[str, Iterable[str]], compressed: bool) -> None:
+        """
+        Atomically replace a segment file with the given text.
+
+        Args:
+            path: Segment file path
+            data: Complete file contents, or an iterable of lines
+            compressed: True to write gzip-compressed data
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        if compressed:
+            f = gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6)
+        else:
+            f = open(tmp_path, "w", encoding="utf-8")
+        with f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                f.writelines(data)
+        os.replace(tmp_path, path)
+
+    def bulk_load(
+        self,
+        key: str,
+        records: Iterable[Dict[str, Any]],
+        now: Optional[float] = None,
+    ) -> int:
+        """
+        Merge a batch of records into one month in a single atomic write.
+
+        Records that duplicate an existing session or an earlier record in
+        the batch, judged by (start second, duration), are skipped. Closed
+        months are rewritten compressed; the active month stays plain.
+
+        Args:
+            key: Segment key (YYYY-MM) every record belongs to
+            records: Records to merge
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            Number of records added
+        """
+        with self._lock:
+            merged = compact_records(self._read_segment_files(key))
+            seen = {dedupe_key(record) for record in merged}
+            added = 0
+            for record in records:
+                identity = dedupe_key(record)
+                if identity in seen:
+                    continue
+                seen.add(identity)
+                merged.append(record)
+                added += 1
+
+            if added:
+                merged.sort(key=lambda record: record["start"])
+                current = month_key(time.time() if now is None else now)
+                self._write_segment(key, merged, compressed=key < current)
+        if added:
+            self._emit("change", None)
+        return added
+
+    def verify(self) -> Dict[str, int]:
+        """
+        Validate every segment and recover from damage.
+
+        Each file is read once, sequentially. A torn last line of the
+        active segment (left by a crash mid-append) is truncated away;
+        other damaged lines are dropped by rewriting the segment. A
+        compressed segment failing its CRC check is replaced by the
+        records that could still be decompressed. Damaged data is kept in
+        the quarantine directory.
+
+        Returns:
+            Dictionary with the number of segments checked, segments
+            repaired and damaged lines or files quarantined
+        """
+        report = {"segments": 0, "repaired": 0, "quarantined": 0}
+        with self._lock:
+            for key in self.segments():
+                report["segments"] += 1
+                quarantined = self._recover_compressed(key) + self._recover_plain(key)
+                if quarantined:
+                    report["repaired"] += 1
+                    report["quarantined"] += quarantined
+        if report["repaired"]:
+            self._emit("change", None)
+        return report
+
+    def _recover_compressed(self, key: str) -> int:
+        """Validate a compressed segment, salvaging it if damaged."""
+        path = self._compressed_path(key)
+        if not path.exists():
+            return 0
+        salvaged, intact = scan_compressed(path)
+        if intact:
+            return 0
+
+        quarantine(self.history_dir, path.name, path.read_bytes())
+        lines = [
+            line.decode("utf-8") + "\n"
+            for line in salvaged.split(b"\n")
+            if line and line_is_valid(line)
+        ]
+        self.replace_file(path, "".join(lines), compressed=True)
+        return 1
+
+    def _recover_plain(self, key: str) -> int:
+        """Validate the active segment of a month, dropping damaged lines."""
+        path = self._segment_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        good, bad, torn = scan_plain(data)
+        if not bad:
+            if data and not data.endswith(b"\n"):
+                with open(path, "ab") as f:
+                    f.write(b"\n")
+            return 0
+
+        quarantine(self.history_dir, path.name, b"\n".join(bad) + b"\n")
+        if torn:
+            os.truncate(path, data.rfind(b"\n") + 1)
+        else:
+            text = "".join(line.decode("utf-8") + "\n" for line in good)
+            self.replace_file(path, text, compressed=False)
+        return len(bad)
+
+    def _read_lines(self, path: Path) -> Iterator[str]:
+        """Yield the non-empty lines of a plain or compressed segment."""
+        if not path.exists():
+            return
+        opener = gzip.open if path.name.endswith(COMPRESSED_SUFFIX) else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield line
+        except (OSError, EOFError, zlib.error, UnicodeDecodeError) as e:
+            # Keep what was readable; verify() recovers the rest
+            print(f"Error reading history segment {path.name}: {e}")
+
+    def _read_segment_files(self, key: str) -> Iterator[Dict[str, Any]]:
+        """Yield raw records of a month in write order."""
+        for path in (self._compressed_path(key), self._segment_path(key)):
+            for line in self._read_lines(path):
+                payload = unframe_line(line)
+                if payload is None:
+                    # Skip torn or corrupt lines
+                    continue
+                try:
+                    yield json.loads(payload)
+                except json.JSONDecodeError:
+                    continue
+
+    def read_segment(self, key: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the live records of a month sorted by start time.
+
+        Compacted segments are streamed straight from disk; a month with
+        pending uncompressed entries is compacted in memory first.
+
+        Args:
+            key: Segment key (YYYY-MM)
+
+        Returns:
+            Iterator over session records
+        """
+        if self._segment_path(key).exists():
+            yield from compact_records(self._read_segment_files(key))
+        else:
+            yield from self._read_segment_files(key)
+
+    def _overlapping_segments(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+    ) -> Iterator[tuple[str, bool]]:
+        """Yield (key, fully_contained) for segments overlapping a range."""
+        for key in self.segments():
+            seg_start, seg_end = month_bounds(key)
+            if since is not None and seg_end <= since:
+                continue
+            if until is not None and seg_start >= until:
+                break
+            contained = (since is None or seg_start >= since) and (
+                until is None or seg_end <= until
+            )
+            yield key, contained
+
+    def _read_chunks(self, path: Path) -> Iterator[str]:
+        """Yield blocks of complete lines from a compressed segment."""
+        remainder = b""
+        with gzip.open(path, "rb") as f:
+            while True:
+                block = f.read(READ_CHUNK_SIZE)
+                if not block:
+                    break
+                block = remainder + block
+                cut = block.rfind(b"\n") + 1
+                remainder = block[cut:]
+                if cut:
+                    yield block[:cut].decode("utf-8")
+        if remainder.strip():
+            yield remainder.decode("utf-8") + "\n"
+
+    def segment_fingerprint(self, key: str) -> tuple:
+        """
+        Get a fingerprint of one segment to detect changes on disk.
+
+        Args:
+            key: Segment key (YYYY-MM)
+
+        Returns:
+            Tuple of (mtime, size) or None for the compressed and plain files
+        """
+        fingerprint = []
+        for path in (self._compressed_path(key), self._segment_path(key)):
+            try:
+                stat = path.stat()
+                fingerprint.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def fingerprint(self) -> Dict[str, list]:
+        """
+        Get a fingerprint of every segment to detect changes on disk.
+
+        Returns:
+            Dictionary mapping segment keys to [(mtime, size) or None] pairs
+        """
+        return {key: [list(part) if part else None for part in self.segment_fingerprint(key)]
+                for key in self.segments()}
+
+    def load_segment(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Get the live records of a month, cached until the segment changes.
+
+        Only the most recently used segments are kept decoded.
+
+        Args:
+            key: Segment key (YYYY-MM)
+
+        Returns:
+            Records sorted by start time (do not modify)
+        """
+        with self._lock:
+            fingerprint = self.segment_fingerprint(key)
+            cached = self._segment_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._segment_cache.move_to_end(key)
+                return cached[1]
+
+            records = list(self.read_segment(key))
+            self._segment_cache[key] = (fingerprint, records)
+            while len(self._segment_cache) > SEGMENT_CACHE_SIZE:
+                self._segment_cache.popitem(last=False)
+            return records
+
+    def count(self, kind: Optional[str] = None, tag: Optional[str] = None) -> int:
+        """
+        Count stored sessions.
+
+        Args:
+            kind: Only count sessions of this kind (e.g. WORK)
+            tag: Only count sessions with this tag
+
+        Returns:
+            Number of live sessions
+        """
+        with self._lock:
+            return sum(self.index.count(key, kind, tag) for key in self.segments())
+
+    def tags(self) -> List[str]:
+        """
+        Get every tag used in the history.
+
+        Returns:
+            Sorted list of tag names
+        """
+        names = set()
+        with self._lock:
+            for key in self.segments():
+                names.update(self.index.entry(key).tag_names)
+        return sorted(names)
+
+    def tag_totals(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Aggregate sessions and time per tag.
+
+        Uses the inverted tag index, so untagged sessions are never
+        visited and no segment is decoded unless its index is out of date.
+
+        Args:
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            Dictionary mapping tag names to {"sessions", "seconds"} totals
+        """
+        totals: Dict[str, Dict[str, int]] = {}
+        for key, _ in self._overlapping_segments(since, until):
+            for tag, (sessions, seconds) in self.index.tag_totals(key, since, until).items():
+                total = totals.setdefault(tag, {"sessions": 0, "seconds": 0})
+                total["sessions"] += sessions
+                total["seconds"] += seconds
+        return totals
+
+    def count_range(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> int:
+        """
+        Count sessions that started within a time range.
+
+        Uses the time-range index, so no segment is decoded unless its
+        index entry is out of date.
+
+        Args:
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            Number of sessions in the range
+        """
+        total = 0
+        for key, contained in self._overlapping_segments(since, until):
+            if contained:
+                total += self.index.count(key)
+            else:
+                lo, hi = self.index.locate(key, since, until)
+                total += hi - lo
+        return total
+
+    def page(
+        self,
+        offset: int,
+        limit: int,
+        descending: bool = False,
+        kind: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of sessions ordered by start time.
+
+        Whole segments before the offset are skipped using index counts,
+        so only the segments holding the page are decoded.
+
+        Args:
+            offset: Number of matching sessions to skip
+            limit: Maximum number of sessions to return
+            descending: True for newest first
+            kind: Only include sessions of this kind (e.g. WORK)
+            tag: Only include sessions with this tag
+
+        Returns:
+            List of session records
+        """
+        keys = self.segments()
+        if descending:
+            keys.reverse()
+
+        result: List[Dict[str, Any]] = []
+        with self._lock:
+            for key in keys:
+                if len(result) >= limit:
+                    break
+                count = self.index.count(key, kind, tag)
+                if offset >= count:
+                    offset -= count
+                    continue
+
+                records = self.load_segment(key)
+                if tag is not None:
+                    entry = self.index.entry(key)
+                    tag_id = entry.tag_id(tag)
+                    positions = entry.postings[tag_id] if tag_id is not None else ()
+                    records = [records[position] for position in positions]
+                if kind is not None:
+                    records = [record for record in records if record.get("kind") == kind]
+                if descending:
+                    records = records[::-1]
+                result.extend(records[offset:offset + limit - len(result)])
+                offset = 0
+        return result
+
+    def iter_sessions(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over sessions that started within a time range.
+
+        Only segments overlapping the range are opened (and decompressed).
+        Segments cut by the range boundaries are sliced at positions found
+        by binary search in the time-range index.
+
+        Args:
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            Iterator over session records sorted by start time
+        """
+        for key, contained in self._overlapping_segments(since, until):
+            if contained:
+                yield from self.read_segment(key)
+                continue
+            lo, hi = self.index.locate(key, since, until)
+            if hi > lo:
+                yield from self.load_segment(key)[lo:hi]
+
+    def iter_chunks(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Iterate over sessions in a time range as blocks of JSON lines.
+
+        Compacted segments that lie entirely inside the range are passed
+        through in large blocks without decoding individual records, which
+        keeps bulk exports cheap. Every block ends with a newline.
+
+        Args:
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            Iterator over text blocks sorted by start time
+        """
+        for key, contained in self._overlapping_segments(since, until):
+            if contained and not self._segment_path(key).exists():
+                yield from self._read_chunks(self._compressed_path(key))
+                continue
+
+            lines = []
+            for record in self.read_segment(key):
+                start = record["start"]
+                if since is not None and start < since:
+                    continue
+                if until is not None and start >= until:
+                    break
+                lines.append(serialize_record(record))
+            if lines:
+                yield "".join(lines)
+
+# Global history store instance
+_history_store: Optional[HistoryStore] = None
+
+
+def get_history_store() -> HistoryStore:
+    """
+    Get the global history store instance.
+
+    Returns:
+        Global HistoryStore instance
+    """
+    global _history_store
+    if _history_store is None:
+        _history_store = HistoryStore()
+    return _history_store
@@ -0,0 +1,264 @@
+"""
+Time-range index over the session history segments.
+
+For every segment the index keeps the sorted start times of its live
+sessions (plus a byte per session encoding its kind and the duration).
+Range lookups are binary searches, so counting or locating "sessions
+between T1 and T2" is O(log n + k) instead of a scan of the history.
+
+Tags are interned per segment to small integer ids, and an inverted index
+maps each tag id to the sorted positions of its sessions, so per-tag
+counts and totals only touch the tagged sessions. Entries are persisted
+per segment and only rebuilt when that segment's files change.
+"""
+import marshal
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.utils.constants import STATE_WORK, STATE_SHORT_BREAK, STATE_LONG_BREAK
+
+if TYPE_CHECKING:
+    from src.history import HistoryStore
+
+
+# Directory (inside the history directory) holding one index file per segment
+INDEX_DIR = ".index"
+
+# Bump when the entry layout changes so old index files are rebuilt
+INDEX_VERSION = 2
+
+# One-byte codes for session kinds (0 for anything else)
+KIND_CODES = {STATE_WORK: 1, STATE_SHORT_BREAK: 2, STATE_LONG_BREAK: 3}
+
+
+class IndexEntry:
+    """Index data for a single segment."""
+
+    __slots__ = ("fingerprint", "starts", "kinds", "durations", "tag_names", "postings")
+
+    def __init__(
+        self,
+        fingerprint: tuple,
+        starts: array,
+        kinds: bytes,
+        durations: array,
+        tag_names: List[str],
+        postings: Dict[int, array],
+    ):
+        """
+        Initialize an index entry.
+
+        Args:
+            fingerprint: Segment fingerprint the entry was built from
+            starts: Sorted start timestamps of the live sessions
+            kinds: Kind code of each session, aligned with starts
+            durations: Duration in seconds of each session, aligned with starts
+            tag_names: Tag names of the segment; a tag's id is its position
+            postings: Sorted session positions for each tag id
+        """
+        self.fingerprint = fingerprint
+        self.starts = starts
+        self.kinds = kinds
+        self.durations = durations
+        self.tag_names = tag_names
+        self.postings = postings
+
+    def tag_id(self, tag: str) -> Optional[int]:
+        """Get the id of a tag in this segment, or None if unused."""
+        try:
+            return self.tag_names.index(tag)
+        except ValueError:
+            return None
+
+
+class HistoryIndex:
+    """Lazily maintained, persisted start-time index for a history store."""
+
+    def __init__(self, store: "HistoryStore", persist: bool = True):
+        """
+        Initialize the index.
+
+        Args:
+            store: History store to index
+            persist: Save built entries next to the history
+        """
+        self.store = store
+        self.persist = persist
+        self.index_dir = Path(store.history_dir) / INDEX_DIR
+        self._entries: Dict[str, IndexEntry] = {}
+        self._lock = threading.RLock()
+
+    def _path(self, key: str) -> Path:
+        """Get the index file path for a segment."""
+        return self.index_dir / f"{key}.idx"
+
+    def _load(self, key: str) -> Optional[IndexEntry]:
+        """Load a persisted entry, or None if missing or unreadable."""
+        try:
+            with open(self._path(key), "rb") as f:
+                data = marshal.load(f)
+            if data[0] != INDEX_VERSION:
+                return None
+            _, fingerprint, starts_bytes, kinds, durations_bytes, tag_names, postings_bytes = data
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            return None
+        starts = array("d")
+        starts.frombytes(starts_bytes)
+        durations = array("I")
+        durations.frombytes(durations_bytes)
+        postings = {}
+        for tag_id, positions_bytes in postings_bytes.items():
+            positions = array("I")
+            positions.frombytes(positions_bytes)
+            postings[tag_id] = positions
+        return IndexEntry(fingerprint, starts, kinds, durations, tag_names, postings)
+
+    def _save(self, key: str, entry: IndexEntry) -> None:
+        """Persist an entry atomically."""
+        self.index_dir.mkdir(exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                marshal.dump(
+                    (
+                        INDEX_VERSION,
+                        entry.fingerprint,
+                        entry.starts.tobytes(),
+                        entry.kinds,
+                        entry.durations.tobytes(),
+                        entry.tag_names,
+                        {tag_id: positions.tobytes() for tag_id, positions in entry.postings.items()},
+                    ),
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving history index: {e}")
+
+    def _build(self, key: str, fingerprint: tuple) -> IndexEntry:
+        """Build an entry by decoding the segment once."""
+        records = self.store.load_segment(key)
+        starts = array("d", (record["start"] for record in records))
+        kinds = bytes(KIND_CODES.get(record.get("kind"), 0) for record in records)
+        durations = array("I", (max(0, int(record.get("duration", 0))) for record in records))
+
+        tag_ids: Dict[str, int] = {}
+        postings: Dict[int, array] = {}
+        for position, record in enumerate(records):
+            tag = record.get("tag")
+            if not tag:
+                continue
+            tag_id = tag_ids.setdefault(tag, len(tag_ids))
+            postings.setdefault(tag_id, array("I")).append(position)
+        return IndexEntry(fingerprint, starts, kinds, durations, list(tag_ids), postings)
+
+    def entry(self, key: str) -> IndexEntry:
+        """
+        Get the up-to-date index entry for a segment.
+
+        The entry is taken from memory or disk when the segment is
+        unchanged, and rebuilt (and persisted) otherwise.
+
+        Args:
+            key: Segment key (YYYY-MM)
+
+        Returns:
+            Index entry
+        """
+        fingerprint = self.store.segment_fingerprint(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.fingerprint != fingerprint:
+                entry = self._load(key)
+                if entry is None or entry.fingerprint != fingerprint:
+                    entry = self._build(key, fingerprint)
+                    if self.persist:
+                        self._save(key, entry)
+                self._entries[key] = entry
+            return entry
+
+    def count(self, key: str, kind: Optional[str] = None, tag: Optional[str] = None) -> int:
+        """
+        Count sessions in a segment without decoding it.
+
+        Args:
+            key: Segment key (YYYY-MM)
+            kind: Only count sessions of this kind
+            tag: Only count sessions with this tag
+
+        Returns:
+            Number of sessions
+        """
+        entry = self.entry(key)
+        if tag is None:
+            if kind is None:
+                return len(entry.starts)
+            return entry.kinds.count(KIND_CODES.get(kind, 0))
+
+        tag_id = entry.tag_id(tag)
+        if tag_id is None:
+            return 0
+        positions = entry.postings[tag_id]
+        if kind is None:
+            return len(positions)
+        code = KIND_CODES.get(kind, 0)
+        return sum(1 for position in positions if entry.kinds[position] == code)
+
+    def tag_totals(
+        self,
+        key: str,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Dict[str, Tuple[int, int]]:
+        """
+        Sum sessions and time per tag within a segment.
+
+        Only the positions in each tag's posting list are visited, clipped
+        to the time range by binary search.
+
+        Args:
+            key: Segment key (YYYY-MM)
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            Dictionary mapping tag names to (sessions, seconds)
+        """
+        entry = self.entry(key)
+        lo, hi = self.locate(key, since, until)
+        totals = {}
+        for tag_id, positions in entry.postings.items():
+            first = bisect_left(positions, lo)
+            last = bisect_left(positions, hi)
+            if last > first:
+                durations = entry.durations
+                seconds = sum(durations[position] for position in positions[first:last])
+                totals[entry.tag_names[tag_id]] = (last - first, seconds)
+        return totals
+
+    def locate(
+        self,
+        key: str,
+        since: Optional[float],
+        until: Optional[float],
+    ) -> Tuple[int, int]:
+        """
+        Find the positions of a time range within a segment.
+
+        Args:
+            key: Segment key (YYYY-MM)
+            since: Inclusive lower bound as a Unix timestamp
+            until: Exclusive upper bound as a Unix timestamp
+
+        Returns:
+            (lo, hi) slice of the segment's sorted records in the range
+        """
+        starts = self.entry(key).starts
+        lo = 0 if since is None else bisect_left(starts, since)
+        hi = len(starts) if until is None else bisect_left(starts, until)
+        return lo, max(lo, hi)
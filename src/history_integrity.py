@@ -0,0 +1,179 @@
+"""
+Checksums and integrity scanning for the session history segments.
+
+Every line of the active (plain) segment is framed as the record's JSON,
+a tab and the CRC32 of the JSON in hex. Compacted segments are written
+atomically and covered by gzip's own CRC32 trailer. The helpers here
+validate either kind of segment in one sequential pass so damage left by
+a crash or a bad disk can be found and set aside at startup.
+"""
+import json
+import time
+import zlib
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Separates a line's JSON payload from its checksum (compact JSON never
+# contains a raw tab)
+CHECKSUM_SEPARATOR = "\t"
+
+# Directory (inside the history directory) receiving damaged data
+QUARANTINE_DIR = "quarantine"
+
+# Compressed bytes inflated per step when validating compressed segments
+SCAN_CHUNK_SIZE = 1 << 16
+
+# zlib window bits selecting the gzip container (header and CRC32 trailer)
+GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def frame_line(payload: str) -> str:
+    """
+    Add a checksum to a JSON payload.
+
+    Args:
+        payload: Serialized record
+
+    Returns:
+        Newline-terminated line with the CRC32 of the payload
+    """
+    checksum = zlib.crc32(payload.encode("utf-8"))
+    return f"{payload}{CHECKSUM_SEPARATOR}{checksum:08x}\n"
+
+
+def unframe_line(line: str) -> Optional[str]:
+    """
+    Verify a segment line and strip its checksum.
+
+    Lines without a checksum (compacted segments and lines written before
+    checksums were added) are returned unchanged.
+
+    Args:
+        line: Line read from a segment
+
+    Returns:
+        JSON payload, or None if the checksum does not match
+    """
+    line = line.rstrip("\n")
+    payload, separator, checksum = line.rpartition(CHECKSUM_SEPARATOR)
+    if not separator:
+        return line
+    try:
+        if zlib.crc32(payload.encode("utf-8")) == int(checksum, 16):
+            return payload
+    except ValueError:
+        pass
+    return None
+
+
+def line_is_valid(line: bytes) -> bool:
+    """
+    Check a raw line (without its newline) from a plain segment.
+
+    Args:
+        line: Raw line bytes
+
+    Returns:
+        True if the checksum matches, or the line is unframed valid JSON
+    """
+    payload, separator, checksum = line.rpartition(CHECKSUM_SEPARATOR.encode())
+    if not separator:
+        try:
+            json.loads(line)
+            return True
+        except ValueError:
+            return False
+    try:
+        return zlib.crc32(payload) == int(checksum, 16)
+    except ValueError:
+        return False
+
+
+def scan_plain(data: bytes) -> Tuple[List[bytes], List[bytes], bool]:
+    """
+    Validate the contents of a plain segment.
+
+    Args:
+        data: Segment file contents
+
+    Returns:
+        Tuple of (valid lines, damaged lines, torn) where torn is True if
+        the only damage is an incomplete last line
+    """
+    lines = data.split(b"\n")
+    tail = lines.pop()  # Bytes after the last newline (empty when clean)
+    good = []
+    bad = []
+    for line in lines:
+        if not line:
+            continue
+        if line_is_valid(line):
+            good.append(line)
+        else:
+            bad.append(line)
+    torn = False
+    if tail:
+        if line_is_valid(tail):
+            # Only the newline was lost
+            good.append(tail)
+        else:
+            torn = not bad
+            bad.append(tail)
+    return good, bad, torn
+
+
+def scan_compressed(path: Path) -> Tuple[bytes, bool]:
+    """
+    Validate a compressed segment by decompressing it once.
+
+    The gzip stream is inflated incrementally and its trailer (CRC32 and
+    length of the data) is checked at the end, so truncated or corrupted
+    files are detected while the data before the damage is kept.
+
+    Args:
+        path: Compressed segment path
+
+    Returns:
+        Tuple of (complete lines decompressed before the damage, or empty
+        bytes when intact; intact)
+    """
+    decompressor = zlib.decompressobj(GZIP_WBITS)
+    blocks = []
+    try:
+        with open(path, "rb") as f:
+            while not decompressor.eof:
+                chunk = f.read(SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                blocks.append(decompressor.decompress(chunk))
+    except (OSError, zlib.error):
+        pass
+    if decompressor.eof:
+        return b"", True
+    data = b"".join(blocks)
+    return data[: data.rfind(b"\n") + 1], False
+
+
+def quarantine(history_dir: Path, name: str, data: bytes) -> Optional[Path]:
+    """
+    Keep damaged data aside for manual inspection.
+
+    Args:
+        history_dir: History directory
+        name: Base file name (usually the segment file name)
+        data: Damaged bytes
+
+    Returns:
+        Path of the quarantined file, or None if it could not be written
+    """
+    directory = Path(history_dir) / QUARANTINE_DIR
+    path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{name}"
+    try:
+        directory.mkdir(exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(data)
+        return path
+    except OSError as e:
+        print(f"Error quarantining damaged history: {e}")
+        return None
@@ -0,0 +1,401 @@
+"""
+Minimal iCalendar (.ics) reader for planning around meetings.
+
+Only what is needed to know when you are busy is read: VEVENT start, end
+or duration, summary, recurrence rules (RRULE with FREQ, INTERVAL, COUNT,
+UNTIL, BYDAY and BYMONTHDAY), EXDATE exceptions and RECURRENCE-ID
+overrides. All-day, cancelled and transparent ("free") events are
+ignored. Times with a TZID are resolved with zoneinfo; floating times
+are local.
+"""
+import re
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # pragma: no cover - Python < 3.9
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
+
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+
+# Length assumed for events without DTEND or DURATION
+DEFAULT_EVENT_SECONDS = 30 * 60
+
+_DURATION_RE = re.compile(
+    r"([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+_BYDAY_RE = re.compile(r"([+-]?\d*)(MO|TU|WE|TH|FR|SA|SU)$")
+
+
+class Event:
+    """A busy calendar event, possibly recurring."""
+
+    __slots__ = ("summary", "start", "duration", "tz", "rrule", "exdates", "uid")
+
+    def __init__(
+        self,
+        summary: str,
+        start: datetime,
+        duration: float,
+        tz: Optional[tzinfo],
+        rrule: Optional[Dict[str, str]] = None,
+        exdates: Optional[Set[float]] = None,
+        uid: str = "",
+    ):
+        """
+        Initialize an event.
+
+        Args:
+            summary: Event title
+            start: Naive wall-clock start in the event's time zone
+            duration: Length in seconds
+            tz: Time zone of start (None for floating local time)
+            rrule: Recurrence rule parts (e.g. {"FREQ": "WEEKLY"}), if recurring
+            exdates: Start timestamps of excluded occurrences
+            uid: Event UID, shared by a recurring event and its overrides
+        """
+        self.summary = summary
+        self.start = start
+        self.duration = duration
+        self.tz = tz
+        self.rrule = rrule
+        self.exdates = exdates or set()
+        self.uid = uid
+
+
+def unfold_lines(text: str) -> Iterator[str]:
+    """
+    Join folded content lines (continuations start with a space or tab).
+
+    Args:
+        text: Calendar file contents
+
+    Returns:
+        Iterator over logical lines
+    """
+    current = None
+    for line in text.splitlines():
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def parse_property(line: str) -> Tuple[str, Dict[str, str], str]:
+    """
+    Split a content line into name, parameters and value.
+
+    Args:
+        line: Unfolded content line (e.g. "DTSTART;TZID=Europe/Paris:20240115T090000")
+
+    Returns:
+        (upper-case name, parameters, value) tuple
+    """
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def _zone(name: Optional[str]) -> Optional[tzinfo]:
+    """Get a time zone by TZID, or None (local time) if unknown."""
+    if not name or ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_datetime(value: str, parameters: Dict[str, str]) -> Tuple[Optional[datetime], Optional[tzinfo]]:
+    """
+    Parse a DATE-TIME value.
+
+    Args:
+        value: Value such as "20240115T090000Z"
+        parameters: Property parameters (TZID, VALUE)
+
+    Returns:
+        (naive wall-clock datetime, time zone) tuple; the datetime is None
+        for all-day dates and unparsable values
+    """
+    value = value.strip()
+    if parameters.get("VALUE") == "DATE" or "T" not in value:
+        return None, None
+    try:
+        if value.endswith("Z"):
+            return datetime.strptime(value[:-1], "%Y%m%dT%H%M%S"), timezone.utc
+        return datetime.strptime(value, "%Y%m%dT%H%M%S"), _zone(parameters.get("TZID"))
+    except ValueError:
+        return None, None
+
+
+def to_timestamp(moment: datetime, tz: Optional[tzinfo]) -> float:
+    """
+    Convert a naive wall-clock time in a time zone to a Unix timestamp.
+
+    Args:
+        moment: Naive datetime
+        tz: Time zone (None for local time)
+
+    Returns:
+        Unix timestamp
+    """
+    return moment.replace(tzinfo=tz).timestamp() if tz else moment.timestamp()
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse an iCalendar DURATION such as "PT1H30M".
+
+    Args:
+        value: Duration value
+
+    Returns:
+        Seconds, or None if unparsable
+    """
+    match = _DURATION_RE.match(value.strip())
+    if not match:
+        return None
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    total = timedelta(
+        weeks=int(weeks or 0),
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0),
+    ).total_seconds()
+    return -total if sign == "-" else total
+
+
+def parse_events(text: str) -> List[Event]:
+    """
+    Parse the busy events of a calendar.
+
+    Args:
+        text: Calendar file contents
+
+    Returns:
+        List of events (overridden occurrences are excluded from their
+        recurring event and returned as separate events)
+    """
+    events: List[Event] = []
+    overrides: Dict[str, Set[float]] = {}
+    props: Optional[Dict[str, Any]] = None
+
+    for line in unfold_lines(text):
+        name, parameters, value = parse_property(line)
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            props = {"exdates": set()}
+        elif name == "END" and value.upper() == "VEVENT" and props is not None:
+            event = _build_event(props, overrides)
+            if event is not None:
+                events.append(event)
+            props = None
+        elif props is None:
+            continue
+        elif name in ("DTSTART", "DTEND", "RECURRENCE-ID"):
+            props[name] = parse_datetime(value, parameters)
+        elif name == "EXDATE":
+            for part in value.split(","):
+                moment, tz = parse_datetime(part, parameters)
+                if moment is not None:
+                    props["exdates"].add(to_timestamp(moment, tz))
+        elif name == "RRULE":
+            props["RRULE"] = dict(part.partition("=")[::2] for part in value.upper().split(";") if part)
+        elif name in ("DURATION", "SUMMARY", "STATUS", "TRANSP", "UID"):
+            props[name] = value
+
+    for event in events:
+        if event.rrule is not None:
+            event.exdates |= overrides.get(event.uid, set())
+    return events
+
+
+def _build_event(props: Dict[str, Any], overrides: Dict[str, Set[float]]) -> Optional[Event]:
+    """Build an event from the properties of a VEVENT, or None if not busy."""
+    start, tz = props.get("DTSTART", (None, None))
+    uid = props.get("UID", "")
+    recurrence_id = props.get("RECURRENCE-ID")
+    if recurrence_id and recurrence_id[0] is not None:
+        # This VEVENT replaces one occurrence of a recurring event
+        overrides.setdefault(uid, set()).add(to_timestamp(*recurrence_id))
+
+    if start is None:
+        return None
+    if props.get("STATUS", "").upper() == "CANCELLED" or props.get("TRANSP", "").upper() == "TRANSPARENT":
+        return None
+
+    duration = None
+    end, end_tz = props.get("DTEND", (None, None))
+    if end is not None:
+        duration = to_timestamp(end, end_tz) - to_timestamp(start, tz)
+    elif "DURATION" in props:
+        duration = parse_duration(props["DURATION"])
+    if duration is None:
+        duration = DEFAULT_EVENT_SECONDS
+    if duration <= 0:
+        return None
+
+    summary = props.get("SUMMARY", "").replace("\\,", ",").replace("\\;", ";").replace("\\n", " ")
+    rrule = props.get("RRULE") if not recurrence_id else None
+    return Event(summary or "Busy", start, duration, tz, rrule, props["exdates"], uid)
+
+
+def _add_months(day: date, months: int) -> Optional[date]:
+    """Get the same day of the month a number of months later, or None if it does not exist."""
+    month_index = day.month - 1 + months
+    try:
+        return day.replace(year=day.year + month_index // 12, month=month_index % 12 + 1)
+    except ValueError:
+        return None
+
+
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> Optional[date]:
+    """Get the nth (or -nth from the end) weekday of a month."""
+    if nth > 0:
+        first = date(year, month, 1)
+        day = first + timedelta(days=(weekday - first.weekday()) % 7 + (nth - 1) * 7)
+    else:
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        last = next_month - timedelta(days=1)
+        day = last - timedelta(days=(last.weekday() - weekday) % 7 + (-nth - 1) * 7)
+    return day if day.month == month else None
+
+
+def _candidate_days(event: Event, window_start: date, window_end: date) -> Iterator[date]:
+    """Yield the days a recurring event could fall on, in order, up to window_end."""
+    rule = event.rrule
+    first = event.start.date()
+    interval = max(1, int(rule.get("INTERVAL", 1)))
+    freq = rule.get("FREQ", "DAILY")
+    byday = [_BYDAY_RE.match(part) for part in rule.get("BYDAY", "").split(",") if part]
+    byday = [match for match in byday if match]
+    weekdays = {WEEKDAYS[match.group(2)] for match in byday}
+    # Without COUNT, whole periods before the window can be skipped
+    skip = "COUNT" not in rule
+
+    if freq == "DAILY":
+        step = 0
+        if skip and window_start > first:
+            step = max(0, (window_start - first).days // interval - 1)
+        while True:
+            day = first + timedelta(days=step * interval)
+            if day > window_end:
+                return
+            if not weekdays or day.weekday() in weekdays:
+                yield day
+            step += 1
+    elif freq == "WEEKLY":
+        monday = first - timedelta(days=first.weekday())
+        days = sorted(weekdays) if weekdays else [first.weekday()]
+        step = 0
+        if skip and window_start > first:
+            step = max(0, (window_start - monday).days // (7 * interval) - 1)
+        while True:
+            week = monday + timedelta(weeks=step * interval)
+            if week > window_end:
+                return
+            for weekday in days:
+                day = week + timedelta(days=weekday)
+                if day >= first:
+                    yield day
+            step += 1
+    elif freq == "MONTHLY":
+        monthdays = [int(part) for part in rule.get("BYMONTHDAY", "").split(",") if part.lstrip("-").isdigit()]
+        step = 0
+        while True:
+            month_start = _add_months(first.replace(day=1), step * interval)
+            if month_start > window_end:
+                return
+            year, month = month_start.year, month_start.month
+            days = []
+            for match in byday:
+                nth = int(match.group(1)) if match.group(1) not in ("", "+", "-") else 1
+                days.append(_nth_weekday(year, month, WEEKDAYS[match.group(2)], nth))
+            for monthday in monthdays or ([] if byday else [first.day]):
+                next_month = _add_months(month_start, 1)
+                length = (next_month - month_start).days
+                monthday = monthday if monthday > 0 else length + monthday + 1
+                if 1 <= monthday <= length:
+                    days.append(month_start.replace(day=monthday))
+            for day in sorted(day for day in days if day is not None and day >= first):
+                yield day
+            step += 1
+    elif freq == "YEARLY":
+        step = 0
+        while True:
+            day = _add_months(first, 12 * step * interval)
+            if first.year + step * interval > window_end.year:
+                return
+            if day is not None:
+                yield day
+            step += 1
+
+
+def occurrences(event: Event, since: float, until: float) -> Iterator[Tuple[float, float]]:
+    """
+    Yield the occurrences of an event overlapping a time range.
+
+    Args:
+        event: Event to expand
+        since: Range start as a Unix timestamp
+        until: Range end as a Unix timestamp
+
+    Returns:
+        Iterator over (start, end) Unix timestamps, in order
+    """
+    if event.rrule is None:
+        start = to_timestamp(event.start, event.tz)
+        if start < until and start + event.duration > since:
+            yield start, start + event.duration
+        return
+
+    rule = event.rrule
+    count = int(rule["COUNT"]) if rule.get("COUNT", "").isdigit() else None
+    until_rule = None
+    if "UNTIL" in rule:
+        moment, tz = parse_datetime(rule["UNTIL"], {})
+        if moment is None and rule["UNTIL"][:8].isdigit():
+            # All-day UNTIL: up to the end of that day
+            moment, tz = datetime.strptime(rule["UNTIL"][:8], "%Y%m%d") + timedelta(days=1), event.tz
+        if moment is not None:
+            until_rule = to_timestamp(moment, tz)
+
+    window_start = datetime.fromtimestamp(since - event.duration).date() - timedelta(days=1)
+    window_end = datetime.fromtimestamp(until).date() + timedelta(days=1)
+    seen = 0
+    for day in _candidate_days(event, window_start, window_end):
+        start = to_timestamp(datetime.combine(day, event.start.time()), event.tz)
+        if start >= until or (until_rule is not None and start > until_rule):
+            return
+        seen += 1
+        if count is not None and seen > count:
+            return
+        if start + event.duration > since and start not in event.exdates:
+            yield start, start + event.duration
+
+
+def read_events(path: Path) -> List[Event]:
+    """
+    Read the busy events of a calendar file.
+
+    Args:
+        path: .ics file path
+
+    Returns:
+        List of events
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return parse_events(f.read())
@@ -0,0 +1,284 @@
+"""
+Bulk import of sessions exported by other Pomodoro and time-tracking tools.
+
+Input files are split into byte-range shards that worker processes parse
+and normalize in parallel, spilling records into per-month files. Each
+month is then merged into the history store in a single atomic write,
+again in parallel, so imports scale with the available cores while memory
+stays bounded by the size of one month.
+"""
+import csv
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.history import HistoryStore, month_key, serialize_record
+from src.utils.constants import STATE_WORK, STATE_SHORT_BREAK, STATE_LONG_BREAK
+from src.utils.helpers import parse_timestamp
+
+
+# Target size of a parsing shard in bytes
+DEFAULT_SHARD_SIZE = 16 * 1024 * 1024
+
+# Column aliases used by common exports, checked in order
+START_FIELDS = ("start", "start_time", "started_at", "begin", "timestamp", "date")
+END_FIELDS = ("end", "end_time", "ended_at", "stop")
+DURATION_FIELDS = ("duration", "duration_seconds", "seconds")
+MINUTES_FIELDS = ("duration_minutes", "minutes")
+KIND_FIELDS = ("kind", "type", "phase", "session_type")
+TAG_FIELDS = ("tag", "project", "task", "label")
+
+KIND_ALIASES = {
+    "work": STATE_WORK,
+    "pomodoro": STATE_WORK,
+    "focus": STATE_WORK,
+    "short_break": STATE_SHORT_BREAK,
+    "short break": STATE_SHORT_BREAK,
+    "break": STATE_SHORT_BREAK,
+    "long_break": STATE_LONG_BREAK,
+    "long break": STATE_LONG_BREAK,
+}
+
+
+def _first(row: Dict[str, Any], fields: Sequence[str]) -> Any:
+    """Get the first non-empty value among field aliases."""
+    for field in fields:
+        value = row.get(field)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert an epoch number (s or ms) or ISO string to a timestamp."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return parse_timestamp(str(value))
+    # Millisecond epochs are common in JavaScript-based tools
+    return number / 1000 if number > 1e11 else number
+
+
+def normalize_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a row from another tool into a session record.
+
+    Args:
+        row: Parsed CSV row or JSON object
+
+    Returns:
+        Session record, or None if the row has no usable start or duration
+    """
+    row = {str(key).strip().lower().replace(" ", "_"): value for key, value in row.items()}
+    try:
+        start = _to_timestamp(_first(row, START_FIELDS))
+
+        duration = _first(row, DURATION_FIELDS)
+        if duration is not None:
+            duration = int(float(duration))
+        elif _first(row, MINUTES_FIELDS) is not None:
+            duration = int(float(_first(row, MINUTES_FIELDS)) * 60)
+        elif _first(row, END_FIELDS) is not None:
+            duration = int(_to_timestamp(_first(row, END_FIELDS)) - start)
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    if duration <= 0:
+        return None
+
+    kind = KIND_ALIASES.get(str(_first(row, KIND_FIELDS) or "work").strip().lower(), STATE_WORK)
+    completed = str(row.get("completed", "true")).strip().lower() not in ("false", "0", "no")
+    planned = row.get("planned")
+    record = {
+        # Derived from the dedupe identity so re-imports map to the same id
+        "id": f"import-{int(start):x}-{duration:x}",
+        "start": round(start, 3),
+        "duration": duration,
+        "planned": int(planned) if str(planned or "").isdigit() else duration,
+        "kind": kind,
+        "completed": completed,
+        "pauses": 0,
+    }
+    tag = str(_first(row, TAG_FIELDS) or "").strip()
+    if tag:
+        record["tag"] = tag
+    return record
+
+
+def detect_format(path: Path) -> str:
+    """
+    Guess the input format from a file extension.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        "csv" or "jsonl"
+    """
+    return "csv" if path.suffix.lower() in (".csv", ".tsv") else "jsonl"
+
+
+def plan_shards(path: Path, shard_size: int = DEFAULT_SHARD_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of roughly shard_size bytes.
+
+    Args:
+        path: Input file path
+        shard_size: Target shard size in bytes
+
+    Returns:
+        List of (start, end) byte offsets
+    """
+    size = path.stat().st_size
+    return [(start, min(start + shard_size, size)) for start in range(0, size, shard_size)] or [(0, 0)]
+
+
+def _iter_shard_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """
+    Yield the lines that begin inside a byte range.
+
+    A line belongs to the shard its first byte falls in, so adjacent
+    shards never share or lose a line. A byte order mark (as written by
+    spreadsheet exports) is dropped.
+    """
+    with open(path, "rb") as f:
+        position = start
+        if start > 0:
+            f.seek(start - 1)
+            position += len(f.readline()) - 1
+        for line in f:
+            if position >= end:
+                break
+            position += len(line)
+            yield line.decode("utf-8-sig", errors="replace")
+
+
+def _parse_shard(task: Tuple[str, str, int, int, Optional[List[str]], str, int]) -> Dict[str, Any]:
+    """
+    Parse one shard and spill its records into per-month files.
+
+    Runs in a worker process. CSV fields containing newlines are not
+    supported because shards are split on line boundaries.
+
+    Args:
+        task: (path, fmt, start, end, csv header, spill dir, shard number)
+
+    Returns:
+        Dictionary with parsed/rejected counts and the months written
+    """
+    path, fmt, start, end, header, spill_dir, shard_no = task
+    lines = _iter_shard_lines(path, start, end)
+    if fmt == "csv":
+        if start == 0:
+            next(lines, None)  # Header row
+        delimiter = "\t" if path.lower().endswith(".tsv") else ","
+        rows: Iterator[Dict[str, Any]] = csv.DictReader(lines, fieldnames=header, delimiter=delimiter)
+    else:
+        rows = (_load_json(line) for line in lines if line.strip())
+
+    spills: Dict[str, Any] = {}
+    parsed = rejected = 0
+    try:
+        for row in rows:
+            record = normalize_row(row) if row else None
+            if record is None:
+                rejected += 1
+                continue
+            key = month_key(record["start"])
+            if key not in spills:
+                spills[key] = open(os.path.join(spill_dir, f"{key}.{shard_no}.jsonl"), "w", encoding="utf-8")
+            spills[key].write(serialize_record(record))
+            parsed += 1
+    finally:
+        for f in spills.values():
+            f.close()
+
+    return {"parsed": parsed, "rejected": rejected, "months": list(spills)}
+
+
+def _load_json(line: str) -> Optional[Dict[str, Any]]:
+    """Decode a JSON line, returning None for malformed input."""
+    try:
+        value = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _merge_month(task: Tuple[str, str, List[str]]) -> int:
+    """
+    Merge all spilled records of one month into the history store.
+
+    Runs in a worker process; each month is a separate segment file, so
+    months can be merged concurrently.
+
+    Args:
+        task: (history dir, segment key, spill file paths)
+
+    Returns:
+        Number of records added to the store
+    """
+    history_dir, key, spill_paths = task
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for spill_path in spill_paths:
+            with open(spill_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    return HistoryStore(Path(history_dir)).bulk_load(key, records())
+
+
+def import_files(
+    paths: Sequence[Path],
+    store: HistoryStore,
+    workers: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Dict[str, int]:
+    """
+    Import session exports into the history store.
+
+    Args:
+        paths: CSV/TSV or JSON-lines files to import
+        store: Destination history store
+        workers: Number of worker processes (defaults to CPU count)
+        shard_size: Target shard size in bytes
+
+    Returns:
+        Dictionary with parsed, rejected, imported and duplicate counts
+    """
+    spill_dir = tempfile.mkdtemp(prefix="pomodoro-import-")
+    try:
+        tasks = []
+        for path in map(Path, paths):
+            fmt = detect_format(path)
+            header = None
+            if fmt == "csv":
+                with open(path, "r", encoding="utf-8-sig", newline="") as f:
+                    delimiter = "\t" if path.suffix.lower() == ".tsv" else ","
+                    header = next(csv.reader(f, delimiter=delimiter), [])
+            for start, end in plan_shards(path, shard_size):
+                tasks.append((str(path), fmt, start, end, header, spill_dir, len(tasks)))
+
+        totals = {"parsed": 0, "rejected": 0, "imported": 0, "duplicates": 0}
+        months: Dict[str, List[str]] = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for task, result in zip(tasks, executor.map(_parse_shard, tasks)):
+                totals["parsed"] += result["parsed"]
+                totals["rejected"] += result["rejected"]
+                for key in result["months"]:
+                    months.setdefault(key, []).append(os.path.join(spill_dir, f"{key}.{task[-1]}.jsonl"))
+
+            merge_tasks = [(str(store.history_dir), key, spills) for key, spills in sorted(months.items())]
+            totals["imported"] = sum(executor.map(_merge_month, merge_tasks))
+
+        totals["duplicates"] = totals["parsed"] - totals["imported"]
+        return totals
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
@@ -0,0 +1,106 @@
+"""
+Static interval tree over time ranges.
+
+Intervals are sorted by start and stored in flat arrays; the tree is
+implicit (the node of a slice is its middle element) and each node keeps
+the latest end within its subtree. Finding the earliest interval that
+overlaps a range visits one root-to-leaf path in the usual case, so a
+conflict check is O(log n) however many events the calendar holds.
+"""
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+
+class IntervalTree:
+    """Immutable interval tree answering overlap queries."""
+
+    __slots__ = ("starts", "ends", "labels", "_max_end")
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, str]]):
+        """
+        Build the tree.
+
+        Args:
+            intervals: (start, end, label) tuples with start < end
+        """
+        ordered = sorted(intervals)
+        self.starts = array("d", (interval[0] for interval in ordered))
+        self.ends = array("d", (interval[1] for interval in ordered))
+        self.labels: List[str] = [interval[2] for interval in ordered]
+        self._max_end = array("d", self.ends)
+        self._build(0, len(ordered))
+
+    def _build(self, lo: int, hi: int) -> float:
+        """Fill in the latest end of the subtree rooted at the middle of lo:hi."""
+        if lo >= hi:
+            return float("-inf")
+        mid = (lo + hi) // 2
+        latest = max(self.ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = latest
+        return latest
+
+    def __len__(self) -> int:
+        """Get the number of intervals."""
+        return len(self.starts)
+
+    def _first(self, lo: int, hi: int, start: float, end: float) -> Optional[int]:
+        """Find the earliest interval in lo:hi overlapping start:end."""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                # Everything in this subtree ends before the range
+                return None
+            found = self._first(lo, mid, start, end)
+            if found is not None:
+                return found
+            if self.starts[mid] >= end:
+                # This interval and everything after it start too late
+                return None
+            if self.ends[mid] > start:
+                return mid
+            lo = mid + 1
+        return None
+
+    def first_overlap(self, start: float, end: float) -> Optional[Tuple[float, float, str]]:
+        """
+        Find the earliest-starting interval overlapping a range.
+
+        Args:
+            start: Range start
+            end: Range end (exclusive)
+
+        Returns:
+            (start, end, label) of the interval, or None if the range is free
+        """
+        index = self._first(0, len(self.starts), start, end)
+        if index is None:
+            return None
+        return self.starts[index], self.ends[index], self.labels[index]
+
+    def overlapping(self, start: float, end: float) -> List[Tuple[float, float, str]]:
+        """
+        Find every interval overlapping a range.
+
+        Args:
+            start: Range start
+            end: Range end (exclusive)
+
+        Returns:
+            (start, end, label) tuples sorted by start
+        """
+        found: List[Tuple[float, float, str]] = []
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            if self.starts[mid] < end:
+                if self.ends[mid] > start:
+                    found.append((self.starts[mid], self.ends[mid], self.labels[mid]))
+                stack.append((mid + 1, hi))
+        found.sort()
+        return found
@@ -0,0 +1,75 @@
+"""
+Streaming merge of history stores from several machines.
+
+Every store yields its sessions sorted by start time, so the stores are
+combined with a k-way heap merge and written month by month into the
+target store. Duplicates (the same session copied between machines, or
+imported on both) always share a start second, so only the identities
+seen within the current second are remembered: memory stays constant and
+the merge is a single linear pass over the inputs.
+"""
+import heapq
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.history import HistoryStore, dedupe_key, month_key
+
+
+def unique_sessions(records: Iterable[Dict[str, Any]], totals: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    """
+    Drop duplicate sessions from a stream sorted by start time.
+
+    A record is a duplicate if a record in the same start second has the
+    same id or the same (start second, duration). The first one wins.
+
+    Args:
+        records: Records sorted by start time
+        totals: Counters updated in place ("sessions" and "duplicates")
+
+    Returns:
+        Iterator over the unique records
+    """
+    second = None
+    seen: set = set()
+    for record in records:
+        identity = dedupe_key(record)
+        if identity[0] != second:
+            second = identity[0]
+            seen.clear()
+        if identity in seen or record["id"] in seen:
+            totals["duplicates"] += 1
+            continue
+        seen.add(identity)
+        seen.add(record["id"])
+        totals["sessions"] += 1
+        yield record
+
+
+def merge_stores(
+    sources: List[HistoryStore],
+    target: HistoryStore,
+    now: Optional[float] = None,
+) -> Dict[str, int]:
+    """
+    Merge history stores into a target store.
+
+    The target's own sessions take part in the merge and win over
+    duplicates from the sources, so merging into an existing store never
+    loses data. Each month is replaced atomically.
+
+    Args:
+        sources: Stores to merge in
+        target: Store receiving the merged history
+        now: Current Unix timestamp (defaults to time.time())
+
+    Returns:
+        Dictionary with sessions written, duplicates skipped and segments
+    """
+    totals = {"sessions": 0, "duplicates": 0, "segments": 0}
+    streams = [store.iter_sessions() for store in [target, *sources]]
+    merged = heapq.merge(*streams, key=lambda record: record["start"])
+    unique = unique_sessions(merged, totals)
+
+    months = groupby(unique, key=lambda record: month_key(record["start"]))
+    totals["segments"] = target.replace_months(months, now=now)
+    return totals
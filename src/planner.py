@@ -0,0 +1,247 @@
+"""
+Plan the day's pomodoros around meetings from a local calendar.
+
+The calendar file is parsed once and re-read only when its modification
+time or size changes. Each day's meetings are expanded into an interval
+tree (also cached), so checking whether a session would run into a
+meeting is a single O(log n) query and replanning after every session
+stays cheap even for calendars with thousands of recurring events.
+
+Parsing and expanding can take a noticeable fraction of a second for big
+calendars, so the app does both in a worker with busy() and the UI only
+reads trees that are already built, with cached().
+"""
+import os
+import threading
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.ics import Event, occurrences, read_events
+from src.interval_tree import IntervalTree
+from src.utils.constants import MIN_PLANNED_WORK_MINUTES
+from src.utils.helpers import minutes_to_seconds
+
+
+# Days of expanded meetings kept in memory
+DAY_CACHE_SIZE = 7
+
+Meeting = Tuple[float, float, str]
+
+
+def day_bounds(day: date) -> Tuple[float, float]:
+    """
+    Get the local midnight timestamps starting and ending a day.
+
+    Args:
+        day: Local date
+
+    Returns:
+        (start, end) Unix timestamps
+    """
+    start = datetime.combine(day, dt_time.min)
+    return start.timestamp(), (start + timedelta(days=1)).timestamp()
+
+
+def clock_time(day: date, value: str) -> float:
+    """
+    Get the timestamp of a wall-clock time on a day.
+
+    Args:
+        day: Local date
+        value: Time as HH:MM
+
+    Returns:
+        Unix timestamp
+
+    Raises:
+        ValueError: If the time is not valid HH:MM
+    """
+    moment = datetime.strptime(value.strip(), "%H:%M").time()
+    return datetime.combine(day, moment).timestamp()
+
+
+class Calendar:
+    """Busy times from a local .ics file, cached by file modification time."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the calendar.
+
+        Args:
+            path: .ics file path (a missing file means no meetings)
+        """
+        self.path = Path(path).expanduser()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._loaded = False
+        self._events: List[Event] = []
+        self._days: Dict[date, IntervalTree] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> bool:
+        """
+        Re-read the file if it changed since it was last parsed.
+
+        Returns:
+            True if the events were read again
+        """
+        try:
+            stat = os.stat(self.path)
+            stamp: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if self._loaded and stamp == self._stamp:
+            return False
+        try:
+            self._events = read_events(self.path) if stamp is not None else []
+        except OSError as e:
+            print(f"Error reading calendar: {e}")
+            self._events = []
+        self._stamp = stamp
+        self._loaded = True
+        return True
+
+    def busy(self, day: date) -> IntervalTree:
+        """
+        Get the meetings of a day, parsing and expanding them if needed.
+
+        Blocks while the file is parsed; call it from a worker thread.
+
+        Args:
+            day: Local date
+
+        Returns:
+            Interval tree of (start, end, summary) meetings overlapping the day
+        """
+        with self._lock:
+            days = {} if self._refresh() else self._days
+            tree = days.get(day)
+            if tree is None:
+                since, until = day_bounds(day)
+                tree = IntervalTree(
+                    (start, end, event.summary)
+                    for event in self._events
+                    for start, end in occurrences(event, since, until)
+                )
+                days = dict(days) if len(days) < DAY_CACHE_SIZE else {}
+                days[day] = tree
+            # Published with one assignment, so cached() needs no lock
+            self._days = days
+            return tree
+
+    def cached(self, day: date) -> Optional[IntervalTree]:
+        """
+        Get the meetings of a day if busy() already built them, without waiting.
+
+        Args:
+            day: Local date
+
+        Returns:
+            Interval tree of the day's meetings as last read, or None
+        """
+        return self._days.get(day)
+
+    def meetings(self, day: date) -> List[Meeting]:
+        """
+        List the meetings of a day.
+
+        Args:
+            day: Local date
+
+        Returns:
+            (start, end, summary) tuples sorted by start
+        """
+        return self.busy(day).overlapping(*day_bounds(day))
+
+
+def fit_work(
+    tree: IntervalTree,
+    start: float,
+    work_seconds: int,
+    min_work_seconds: int = minutes_to_seconds(MIN_PLANNED_WORK_MINUTES),
+) -> Tuple[int, Optional[Meeting]]:
+    """
+    Fit a work session before the next meeting.
+
+    Args:
+        tree: Meetings
+        start: Session start timestamp
+        work_seconds: Full session length in seconds
+        min_work_seconds: Shortest session worth starting before a meeting
+
+    Returns:
+        (seconds, meeting) tuple: the full length and None if no meeting is
+        in the way; the time left before the meeting if the session has to
+        be shortened; 0 and the meeting if it should be skipped
+    """
+    meeting = tree.first_overlap(start, start + work_seconds)
+    if meeting is None:
+        return work_seconds, None
+    available = int(meeting[0] - start)
+    return (available if available >= min_work_seconds else 0), meeting
+
+
+def plan_day(
+    tree: IntervalTree,
+    start: float,
+    end: float,
+    work_seconds: int,
+    short_break_seconds: int,
+    long_break_seconds: int,
+    pomodoros_until_long_break: int,
+    completed_in_cycle: int = 0,
+    min_work_seconds: int = minutes_to_seconds(MIN_PLANNED_WORK_MINUTES),
+) -> List[Dict[str, Any]]:
+    """
+    Plan work sessions and breaks between meetings.
+
+    Sessions that would run into a meeting are shortened to end when it
+    starts, or skipped past it when less than min_work_seconds is left.
+    Breaks end early when a meeting starts (the meeting is the break).
+
+    Args:
+        tree: Meetings
+        start: Planning start timestamp
+        end: Planning end timestamp
+        work_seconds: Work session length in seconds
+        short_break_seconds: Short break length in seconds
+        long_break_seconds: Long break length in seconds
+        pomodoros_until_long_break: Pomodoros per cycle
+        completed_in_cycle: Pomodoros already done in the current cycle
+        min_work_seconds: Shortest session worth planning
+
+    Returns:
+        Blocks with start, end, kind (WORK, SHORT_BREAK or LONG_BREAK),
+        shortened and before (the meeting a shortened session ends for)
+    """
+    blocks: List[Dict[str, Any]] = []
+    cycle = completed_in_cycle
+    moment = start
+    while end - moment >= min_work_seconds:
+        length, meeting = fit_work(tree, moment, min(work_seconds, int(end - moment)), min_work_seconds)
+        if length == 0:
+            moment = max(moment, meeting[1])
+            continue
+        blocks.append({
+            "start": moment,
+            "end": moment + length,
+            "kind": "WORK",
+            "shortened": meeting is not None,
+            "before": meeting[2] if meeting else None,
+        })
+        moment += length
+        cycle += 1
+
+        if cycle >= pomodoros_until_long_break:
+            kind, length = "LONG_BREAK", long_break_seconds
+            cycle = 0
+        else:
+            kind, length = "SHORT_BREAK", short_break_seconds
+        length = min(length, int(end - moment))
+        meeting = tree.first_overlap(moment, moment + length)
+        if meeting is not None:
+            length = max(0, int(meeting[0] - moment))
+        if length > 0:
+            blocks.append({"start": moment, "end": moment + length, "kind": kind, "shortened": False, "before": None})
+            moment += length
+    return blocks
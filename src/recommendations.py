@@ -0,0 +1,270 @@
+"""
+Personal work and break duration recommendations.
+
+The session history is loaded into NumPy columns and analysed with
+vectorized group-bys, histograms and a linear regression:
+
+- clean completion rate (completed without pausing) per planned work
+  length, and the longest length expected to stay above a target rate;
+- clean completion rate per hour of the day, to find productive hours;
+- clean completion rate of work sessions by the length of the break
+  before them.
+
+Results are cached next to the history and only recomputed once enough
+new sessions have been recorded.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.history import HistoryStore
+from src.history_index import KIND_CODES
+from src.utils.constants import (
+    STATE_WORK,
+    MIN_WORK_DURATION,
+    MAX_WORK_DURATION,
+    MIN_SHORT_BREAK_DURATION,
+    MAX_SHORT_BREAK_DURATION,
+)
+
+
+# Cache file name inside the history directory
+RECOMMENDATIONS_FILE = "recommendations.json"
+
+# Bump when the analysis changes so cached results are recomputed
+RECOMMENDATIONS_VERSION = 1
+
+# New sessions needed before cached results are recomputed
+RECOMPUTE_AFTER = 20
+
+# Sessions a group (length, hour) needs before it is trusted
+MIN_GROUP_SIZE = 5
+
+# Clean completion rate a recommended work length should reach
+TARGET_CLEAN_RATE = 0.8
+
+# Hours reported as most productive
+BEST_HOURS = 3
+
+# A break counts as preceding a work session if it ended this close to it
+BREAK_GAP_SECONDS = 15 * 60
+
+_WORK = KIND_CODES[STATE_WORK]
+
+
+def history_columns(store: HistoryStore) -> Dict[str, np.ndarray]:
+    """
+    Load the session history as NumPy columns.
+
+    Args:
+        store: History store to read from
+
+    Returns:
+        Dictionary of equally long arrays sorted by start time: start,
+        duration, planned, kind (index kind codes), clean (completed
+        without pauses) and hour (local hour of the start)
+    """
+    rows = [
+        (
+            record["start"],
+            record.get("duration", 0),
+            record.get("planned", 0),
+            KIND_CODES.get(record.get("kind"), 0),
+            bool(record.get("completed")) and not record.get("pauses", 0),
+            time.localtime(record["start"]).tm_hour,
+        )
+        for record in store.iter_sessions()
+    ]
+    table = np.array(rows, dtype=np.float64).reshape(-1, 6)
+    start, duration, planned, kind, clean, hour = table.T
+    return {
+        "start": start,
+        "duration": duration.astype(np.int64),
+        "planned": planned.astype(np.int64),
+        "kind": kind.astype(np.int8),
+        "clean": clean.astype(bool),
+        "hour": hour.astype(np.int8),
+    }
+
+
+def _group_rates(keys: np.ndarray, clean: np.ndarray) -> Dict[int, Dict[str, float]]:
+    """Get the size and clean completion rate of each group of keys."""
+    values, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    successes = np.bincount(inverse, weights=clean.astype(np.float64), minlength=len(values))
+    return {
+        int(value): {"sessions": int(count), "rate": round(float(success / count), 3)}
+        for value, count, success in zip(values, counts, successes)
+    }
+
+
+def _trusted(groups: Dict[int, Dict[str, float]]) -> Dict[int, Dict[str, float]]:
+    """Keep only groups with enough sessions."""
+    return {key: group for key, group in groups.items() if group["sessions"] >= MIN_GROUP_SIZE}
+
+
+def recommend_work_duration(groups: Dict[int, Dict[str, float]]) -> Optional[int]:
+    """
+    Suggest a work length from clean completion rates per planned length.
+
+    With two or more trusted lengths, a line weighted by group size is
+    fitted to rate against minutes and solved for the target rate;
+    otherwise the only trusted length is kept if it meets the target.
+
+    Args:
+        groups: Planned minutes mapped to their size and clean rate
+
+    Returns:
+        Suggested work length in minutes, or None without enough data
+    """
+    groups = _trusted(groups)
+    if not groups:
+        return None
+    minutes = np.array(list(groups), dtype=np.float64)
+    rates = np.array([group["rate"] for group in groups.values()])
+    weights = np.sqrt([group["sessions"] for group in groups.values()])
+
+    if len(minutes) >= 2:
+        slope, intercept = np.polyfit(minutes, rates, 1, w=weights)
+        if slope < 0:
+            suggestion = (TARGET_CLEAN_RATE - intercept) / slope
+        else:
+            # Longer sessions do not hurt: keep the longest one tried
+            suggestion = minutes.max()
+    else:
+        suggestion = minutes[0] if rates[0] >= TARGET_CLEAN_RATE else minutes[0] - 5
+
+    suggestion = int(round(suggestion / 5) * 5)
+    return int(np.clip(suggestion, MIN_WORK_DURATION, MAX_WORK_DURATION))
+
+
+def recommend_break_duration(groups: Dict[int, Dict[str, float]]) -> Optional[int]:
+    """
+    Suggest a short break length from how well the next session went.
+
+    Picks the shortest trusted break length whose following work sessions
+    reach a clean rate within 5 points of the best length.
+
+    Args:
+        groups: Break minutes mapped to the size and clean rate of the
+                work sessions that followed
+
+    Returns:
+        Suggested break length in minutes, or None without enough data
+    """
+    groups = _trusted(groups)
+    if not groups:
+        return None
+    best = max(group["rate"] for group in groups.values())
+    suggestion = min(minutes for minutes, group in groups.items() if group["rate"] >= best - 0.05)
+    return int(np.clip(suggestion, MIN_SHORT_BREAK_DURATION, MAX_SHORT_BREAK_DURATION))
+
+
+def analyze(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    Analyse history columns.
+
+    Args:
+        columns: Columns from history_columns()
+
+    Returns:
+        Dictionary with the suggested work_duration and short_break
+        (minutes or None), best_hours and the per-group statistics
+    """
+    work = columns["kind"] == _WORK
+    clean = columns["clean"][work]
+
+    planned_minutes = np.rint(columns["planned"][work] / 60).astype(np.int64)
+    by_length = _group_rates(planned_minutes, clean)
+
+    hours = columns["hour"][work].astype(np.int64)
+    sessions_per_hour = np.bincount(hours, minlength=24)
+    clean_per_hour = np.bincount(hours, weights=clean.astype(np.float64), minlength=24)
+    trusted_hours = np.flatnonzero(sessions_per_hour >= MIN_GROUP_SIZE)
+    # Rank by clean sessions so an hour used often beats a lucky one
+    ranked = trusted_hours[np.argsort(-clean_per_hour[trusted_hours], kind="stable")]
+    best_hours = sorted(int(hour) for hour in ranked[:BEST_HOURS])
+
+    # Pair each work session with a break ending shortly before it
+    start = columns["start"]
+    end = start + columns["duration"]
+    previous_is_break = np.zeros(len(start), dtype=bool)
+    previous_is_break[1:] = (columns["kind"][:-1] != _WORK) & (columns["kind"][:-1] != 0)
+    gap = np.full(len(start), np.inf)
+    gap[1:] = start[1:] - end[:-1]
+    after_break = work & previous_is_break & (gap >= 0) & (gap <= BREAK_GAP_SECONDS)
+    break_minutes = np.rint(columns["duration"][np.flatnonzero(after_break) - 1] / 60).astype(np.int64)
+    by_break = _group_rates(break_minutes, columns["clean"][after_break])
+
+    return {
+        "work_sessions": int(work.sum()),
+        "work_duration": recommend_work_duration(by_length),
+        "short_break": recommend_break_duration(by_break),
+        "best_hours": best_hours,
+        "by_length": by_length,
+        "by_break": by_break,
+    }
+
+
+class Recommendations:
+    """Cached recommendations for a history store."""
+
+    def __init__(self, store: HistoryStore, path: Optional[Path] = None):
+        """
+        Initialize recommendations for a history store.
+
+        Args:
+            store: History store to analyse
+            path: Cache file path. If None, stored in the history directory.
+        """
+        self.store = store
+        self.path = Path(path) if path else store.history_dir / RECOMMENDATIONS_FILE
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Load cached results, or None if missing or outdated."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != RECOMMENDATIONS_VERSION:
+            return None
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        """Persist results atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving recommendations: {e}")
+
+    def get(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Get recommendations, recomputing them only when needed.
+
+        Cached results are reused until RECOMPUTE_AFTER sessions have been
+        added or removed since they were computed. This reads the whole
+        history when recomputing, so call it from a worker thread.
+
+        Args:
+            force: Recompute even if the cached results are recent
+
+        Returns:
+            Results of analyze() plus the session count they are based on
+        """
+        sessions = self.store.count()
+        cached = None if force else self._load()
+        if cached is not None and abs(sessions - cached["sessions"]) < RECOMPUTE_AFTER:
+            return cached["results"]
+
+        results = analyze(history_columns(self.store))
+        results["sessions"] = sessions
+        self._save({"version": RECOMMENDATIONS_VERSION, "sessions": sessions, "results": results})
+        # Match the types of results loaded from the cache (JSON keys are strings)
+        return json.loads(json.dumps(results))
@@ -0,0 +1,384 @@
+"""
+Weekly and monthly reports as self-contained HTML or Markdown.
+
+A report is summarized from the rollups (day buckets, quantile sketches,
+streak) and the tag index, so the session history itself is never read
+unless the rollups are stale. The renderers are generators that yield the
+document piece by piece straight to the output stream.
+
+Team reports summarize every member's history directory in a separate
+process and combine the results; quantiles are combined by merging the
+members' sketches.
+"""
+import html
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from src.history import HistoryStore
+from src.sketch import QuantileSketch
+from src.stats import SKETCH_METRICS, HEATMAP_LEVELS, Rollups, empty_bucket, focus_level
+from src.utils.constants import DEFAULT_DAILY_GOAL
+from src.utils.helpers import format_duration, round_to_minute
+
+
+# Weeks of daily focus shown in a report's heatmap
+REPORT_HEATMAP_WEEKS = 12
+
+# Tags listed in a report
+REPORT_MAX_TAGS = 20
+
+# Heatmap cell colors in HTML reports, by intensity level
+HTML_LEVEL_COLORS = ("#ebedf0", "#c6e48b", "#7bc96f", "#239a3b", "#196127")
+
+# Heatmap cell glyphs in Markdown reports, by intensity level
+MARKDOWN_LEVEL_GLYPHS = ("·", "░", "▒", "▓", "█")
+
+# Characters backslash-escaped in Markdown table cells
+MARKDOWN_SPECIAL = set("\\`*_[]<>|~")
+
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+HTML_STYLE = """
+body { font-family: sans-serif; max-width: 52em; margin: 2em auto; color: #24292e; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+th, td { text-align: left; padding: 0.25em 0.8em; border-bottom: 1px solid #e1e4e8; }
+td.num { text-align: right; }
+table.heatmap td { width: 0.9em; height: 0.9em; padding: 0; border: 2px solid #fff; }
+table.heatmap th { font-weight: normal; font-size: 0.8em; padding: 0 0.5em 0 0; border: none; }
+"""
+
+
+def period_bounds(period: str, today: Optional[date] = None) -> Tuple[date, date]:
+    """
+    Get the days covered by a report period.
+
+    Args:
+        period: "week" (from Monday) or "month" (from the 1st)
+        today: Last day of the period (defaults to today)
+
+    Returns:
+        (first day, last day) tuple
+    """
+    today = today or date.today()
+    if period == "month":
+        return today.replace(day=1), today
+    return today - timedelta(days=today.weekday()), today
+
+
+def _heatmap_start(end: date) -> date:
+    """Get the Monday the report heatmap starts on."""
+    return end - timedelta(days=end.weekday() + (REPORT_HEATMAP_WEEKS - 1) * 7)
+
+
+def summarize(rollups: Rollups, start: date, end: date, name: str = "") -> Dict[str, Any]:
+    """
+    Summarize a period from the rollups and the tag index.
+
+    Args:
+        rollups: Rollups of the history to summarize
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        name: Name shown in the report title
+
+    Returns:
+        Picklable summary dictionary
+    """
+    heatmap = [bucket["focus_seconds"] for _, bucket in rollups.iter_days(_heatmap_start(end), end)]
+    goal_days = sum(
+        1 for _, bucket in rollups.iter_days(start, end) if bucket["pomodoros"] >= rollups.daily_goal
+    )
+    since = time.mktime(start.timetuple())
+    until = time.mktime((end + timedelta(days=1)).timetuple())
+    return {
+        "name": name,
+        "start": start,
+        "end": end,
+        "totals": rollups.totals(start, end),
+        "daily_goal": rollups.daily_goal,
+        "goal_days": goal_days,
+        "streaks": rollups.streaks(min(end, date.today())),
+        "heatmap": heatmap,
+        "tags": rollups.store.tag_totals(since=since, until=until),
+        "sketches": {metric: rollups.sketch(metric, start, end).to_dict() for metric in SKETCH_METRICS},
+        "members": [],
+    }
+
+
+def summarize_directory(task: Tuple[str, date, date, int]) -> Dict[str, Any]:
+    """
+    Summarize one history directory.
+
+    Runs in a worker process for team reports. Nothing is written to the
+    directory: the rollups and index are built in memory only.
+
+    Args:
+        task: (history directory, first day, last day, daily goal)
+
+    Returns:
+        Summary named after the directory
+    """
+    path, start, end, daily_goal = task
+    rollups = Rollups(HistoryStore(Path(path), read_only=True), daily_goal=daily_goal, persist=False)
+    return summarize(rollups, start, end, name=Path(path).name)
+
+
+def combine(summaries: List[Dict[str, Any]], name: str) -> Dict[str, Any]:
+    """
+    Combine member summaries into a team summary.
+
+    Args:
+        summaries: Summaries of the same period
+        name: Team name shown in the report title
+
+    Returns:
+        Team summary listing the members
+    """
+    first = summaries[0]
+    totals = empty_bucket()
+    heatmap = [0] * len(first["heatmap"])
+    tags: Dict[str, Dict[str, int]] = {}
+    sketches = {metric: QuantileSketch() for metric in SKETCH_METRICS}
+    for summary in summaries:
+        for key, value in summary["totals"].items():
+            totals[key] += value
+        heatmap = [a + b for a, b in zip(heatmap, summary["heatmap"])]
+        for tag, total in summary["tags"].items():
+            team_total = tags.setdefault(tag, {"sessions": 0, "seconds": 0})
+            team_total["sessions"] += total["sessions"]
+            team_total["seconds"] += total["seconds"]
+        for metric, data in summary["sketches"].items():
+            sketches[metric].merge(QuantileSketch.from_dict(data))
+    return {
+        "name": name,
+        "start": first["start"],
+        "end": first["end"],
+        "totals": totals,
+        "daily_goal": None,
+        "goal_days": None,
+        "streaks": None,
+        "heatmap": heatmap,
+        "tags": tags,
+        "sketches": {metric: sketch.to_dict() for metric, sketch in sketches.items()},
+        "members": summaries,
+    }
+
+
+def summarize_team(
+    team_dir: Path,
+    start: date,
+    end: date,
+    daily_goal: int = DEFAULT_DAILY_GOAL,
+    workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Summarize every member history directory of a team in parallel.
+
+    Args:
+        team_dir: Directory holding one history directory per member
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        daily_goal: Daily pomodoro goal used for goal days and streaks
+        workers: Number of worker processes (defaults to CPU count)
+
+    Returns:
+        Team summary
+
+    Raises:
+        ValueError: If the directory holds no member directories
+    """
+    members = sorted(str(path) for path in Path(team_dir).iterdir() if path.is_dir())
+    if not members:
+        raise ValueError(f"No member history directories in {team_dir}")
+    tasks = [(path, start, end, daily_goal) for path in members]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = list(executor.map(summarize_directory, tasks))
+    return combine(summaries, name=Path(team_dir).name)
+
+
+def _quantile_rows(summary: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Get (label, value) rows for the typical session values."""
+    sketches = {metric: QuantileSketch.from_dict(data) for metric, data in summary["sketches"].items()}
+    rows = []
+    focus = sketches["focus_length"]
+    if focus.count:
+        rows.append((
+            "Focus block",
+            f"p50 {format_duration(round_to_minute(focus.quantile(0.5)))}, "
+            f"p90 {format_duration(round_to_minute(focus.quantile(0.9)))}",
+        ))
+        hour, minute = divmod(round(sketches["start_minute"].quantile(0.5)) % (24 * 60), 60)
+        rows.append(("Usual start", f"around {hour:02d}:{minute:02d}"))
+    pauses = sketches["pause_seconds"]
+    if pauses.count:
+        rows.append((
+            "Paused for",
+            f"p50 {format_duration(round_to_minute(pauses.quantile(0.5)))}, "
+            f"p90 {format_duration(round_to_minute(pauses.quantile(0.9)))}",
+        ))
+    return rows
+
+
+def _summary_rows(summary: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Get (label, value) rows for the totals section."""
+    totals = summary["totals"]
+    rows = [
+        ("Pomodoros", str(totals["pomodoros"])),
+        ("Focus", format_duration(totals["focus_seconds"])),
+        ("Breaks", format_duration(totals["break_seconds"])),
+        ("Sessions", str(totals["sessions"])),
+    ]
+    if summary["goal_days"] is not None:
+        days = (summary["end"] - summary["start"]).days + 1
+        goal = f"{summary['goal_days']} of {days} days ({summary['daily_goal']} pomodoros)"
+        rows.append(("Goal met", goal))
+    if summary["streaks"] is not None:
+        streaks = summary["streaks"]
+        rows.append(("Streak", f"{streaks['current']} days (best {streaks['longest']})"))
+    return rows + _quantile_rows(summary)
+
+
+def _ranked_tags(summary: Dict[str, Any]) -> List[Tuple[str, Dict[str, int]]]:
+    """Get the most used tags of a summary, by focus time."""
+    ranked = sorted(summary["tags"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    return ranked[:REPORT_MAX_TAGS]
+
+
+def _heatmap_rows(summary: Dict[str, Any]) -> Iterator[Tuple[str, List[Optional[int]]]]:
+    """Yield (weekday name, levels by week) rows; None marks days after the end."""
+    levels = [focus_level(seconds) for seconds in summary["heatmap"]]
+    for weekday, name in enumerate(WEEKDAY_NAMES):
+        cells = levels[weekday::7]
+        yield name, cells + [None] * (REPORT_HEATMAP_WEEKS - len(cells))
+
+
+def _title(summary: Dict[str, Any]) -> str:
+    """Get the report title."""
+    name = f"{summary['name']}: " if summary["name"] else ""
+    return f"{name}Focus report {summary['start']} - {summary['end']}"
+
+
+def _markdown_cell(text: str) -> str:
+    """Escape text for a Markdown table cell, joining its lines."""
+    text = " ".join(text.splitlines())
+    return "".join(f"\\{char}" if char in MARKDOWN_SPECIAL else char for char in text)
+
+
+def render_markdown(summary: Dict[str, Any]) -> Iterator[str]:
+    """
+    Render a summary as Markdown.
+
+    Args:
+        summary: Summary from summarize() or combine()
+
+    Returns:
+        Iterator over document chunks
+    """
+    yield f"# {_title(summary)}\n\n"
+    yield "| | |\n|---|---|\n"
+    for label, value in _summary_rows(summary):
+        yield f"| {label} | {value} |\n"
+
+    if summary["members"]:
+        yield (
+            "\n## Members\n\n| Member | Pomodoros | Focus | Goal met | Streak |\n"
+            "|---|---:|---:|---:|---:|\n"
+        )
+        for member in summary["members"]:
+            totals = member["totals"]
+            yield (
+                f"| {_markdown_cell(member['name'])} | {totals['pomodoros']} "
+                f"| {format_duration(totals['focus_seconds'])} | {member['goal_days']} | {member['streaks']['current']} |\n"
+            )
+
+    tags = _ranked_tags(summary)
+    if tags:
+        yield "\n## Tags\n\n| Tag | Sessions | Focus |\n|---|---:|---:|\n"
+        for tag, total in tags:
+            yield f"| {_markdown_cell(tag)} | {total['sessions']} | {format_duration(total['seconds'])} |\n"
+
+    yield f"\n## Last {REPORT_HEATMAP_WEEKS} weeks\n\n```\n"
+    for name, cells in _heatmap_rows(summary):
+        glyphs = "".join(" " if level is None else MARKDOWN_LEVEL_GLYPHS[level] for level in cells)
+        yield f"{name} {glyphs.rstrip()}\n"
+    thresholds = ", ".join(
+        f"{glyph} {minutes}+ min" for glyph, minutes in zip(MARKDOWN_LEVEL_GLYPHS[1:], HEATMAP_LEVELS)
+    )
+    yield f"```\n\n{MARKDOWN_LEVEL_GLYPHS[0]} none, {thresholds}\n"
+
+
+def render_html(summary: Dict[str, Any]) -> Iterator[str]:
+    """
+    Render a summary as a self-contained HTML page.
+
+    Args:
+        summary: Summary from summarize() or combine()
+
+    Returns:
+        Iterator over document chunks
+    """
+    escape = html.escape
+    title = escape(_title(summary))
+    yield (
+        f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{title}</title>\n<style>{HTML_STYLE}</style>\n</head>\n<body>\n<h1>{title}</h1>\n<table>\n"
+    )
+    for label, value in _summary_rows(summary):
+        yield f"<tr><th>{escape(label)}</th><td>{escape(value)}</td></tr>\n"
+    yield "</table>\n"
+
+    if summary["members"]:
+        yield (
+            "<h2>Members</h2>\n<table>\n<tr><th>Member</th><th>Pomodoros</th><th>Focus</th>"
+            "<th>Goal met</th><th>Streak</th></tr>\n"
+        )
+        for member in summary["members"]:
+            totals = member["totals"]
+            yield (
+                f"<tr><td>{escape(member['name'])}</td><td class=\"num\">{totals['pomodoros']}</td>"
+                f"<td class=\"num\">{format_duration(totals['focus_seconds'])}</td>"
+                f"<td class=\"num\">{member['goal_days']}</td>"
+                f"<td class=\"num\">{member['streaks']['current']}</td></tr>\n"
+            )
+        yield "</table>\n"
+
+    tags = _ranked_tags(summary)
+    if tags:
+        yield "<h2>Tags</h2>\n<table>\n<tr><th>Tag</th><th>Sessions</th><th>Focus</th></tr>\n"
+        for tag, total in tags:
+            yield (
+                f"<tr><td>{escape(tag)}</td><td class=\"num\">{total['sessions']}</td>"
+                f"<td class=\"num\">{format_duration(total['seconds'])}</td></tr>\n"
+            )
+        yield "</table>\n"
+
+    yield f'<h2>Last {REPORT_HEATMAP_WEEKS} weeks</h2>\n<table class="heatmap">\n'
+    for name, cells in _heatmap_rows(summary):
+        row = "".join(
+            "<td></td>" if level is None else f'<td style="background:{HTML_LEVEL_COLORS[level]}"></td>'
+            for level in cells
+        )
+        yield f"<tr><th>{name}</th>{row}</tr>\n"
+    yield "</table>\n</body>\n</html>\n"
+
+
+def write_report(summary: Dict[str, Any], fmt: str, out: TextIO) -> None:
+    """
+    Render a summary to a text stream.
+
+    Args:
+        summary: Summary from summarize() or combine()
+        fmt: Report format ("html" or "markdown")
+        out: Text stream to write to
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if fmt == "html":
+        out.writelines(render_html(summary))
+    elif fmt == "markdown":
+        out.writelines(render_markdown(summary))
+    else:
+        raise ValueError(f"Unsupported report format: {fmt}")
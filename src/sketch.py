@@ -0,0 +1,136 @@
+"""
+Mergeable streaming quantile sketch.
+
+A small DDSketch-style sketch: positive values are counted in buckets
+whose boundaries grow geometrically, so any quantile is answered with a
+bounded relative error. Sketches of the same accuracy merge by adding
+bucket counts, which lets per-day sketches roll up into weeks (or across
+stores) without the raw values. The number of buckets is capped, so
+memory stays constant however many values are added.
+"""
+import math
+from typing import Any, Dict, Optional
+
+
+# Relative accuracy of quantile estimates (2%)
+SKETCH_ACCURACY = 0.02
+
+# Maximum number of buckets; the lowest buckets are merged beyond this
+MAX_SKETCH_BUCKETS = 256
+
+
+class QuantileSketch:
+    """Streaming quantile sketch with relative-error guarantees."""
+
+    __slots__ = ("accuracy", "gamma", "_log_gamma", "buckets", "zero_count", "count")
+
+    def __init__(self, accuracy: float = SKETCH_ACCURACY):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            accuracy: Relative accuracy of quantile estimates (0 < accuracy < 1)
+        """
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """
+        Add a value to the sketch.
+
+        Args:
+            value: Non-negative value (values below 1 count as zero)
+            weight: Number of occurrences
+        """
+        self.count += weight
+        if value < 1:
+            self.zero_count += weight
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + weight
+        if len(self.buckets) > MAX_SKETCH_BUCKETS:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """Merge the lowest buckets so the bucket count stays capped."""
+        keys = sorted(self.buckets)
+        excess = len(keys) - MAX_SKETCH_BUCKETS
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.buckets[target] += self.buckets.pop(key)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Add the contents of another sketch to this one.
+
+        Args:
+            other: Sketch with the same accuracy
+
+        Raises:
+            ValueError: If the sketches have different accuracies
+        """
+        if other.accuracy != self.accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        for key, weight in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + weight
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.buckets) > MAX_SKETCH_BUCKETS:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.5 for the median)
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(key-1), gamma^key] in relative terms
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the sketch to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with accuracy, zero count and buckets
+        """
+        return {
+            "accuracy": self.accuracy,
+            "zero": self.zero_count,
+            "buckets": {str(key): weight for key, weight in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """
+        Restore a sketch saved with to_dict().
+
+        Args:
+            data: Dictionary from to_dict()
+
+        Returns:
+            Restored sketch
+        """
+        sketch = cls(data.get("accuracy", SKETCH_ACCURACY))
+        sketch.zero_count = data.get("zero", 0)
+        sketch.buckets = {int(key): weight for key, weight in data.get("buckets", {}).items()}
+        sketch.count = sketch.zero_count + sum(sketch.buckets.values())
+        return sketch
@@ -0,0 +1,503 @@
+"""
+Precomputed statistics over the session history.
+
+Rollups keep per-day buckets of focus and break time, quantile sketches
+of session lengths, pauses and start times per day and per week, plus the
+streak of consecutive days meeting the daily pomodoro goal. They are updated
+incrementally as sessions are appended, persisted next to the history and
+only rebuilt from the segments when the history changes in other ways
+(edits, deletions, imports).
+"""
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from src.history import HistoryStore, get_history_store
+from src.sketch import QuantileSketch
+from src.config import get_config
+from src.utils.constants import STATE_WORK, DEFAULT_DAILY_GOAL
+
+
+# Rollup file name inside the history directory
+ROLLUPS_FILE = "rollups.json"
+
+# Bump when the bucket layout changes so old files are rebuilt
+ROLLUPS_VERSION = 3
+
+# Quantile sketches kept per day and week:
+# focus_length - seconds actually spent in work sessions
+# pause_seconds - time spent paused, for sessions that were paused
+# start_minute - local minute of the day work sessions started at
+SKETCH_METRICS = ("focus_length", "pause_seconds", "start_minute")
+
+# Focus minutes at which a day reaches each heatmap intensity level above zero
+HEATMAP_LEVELS = (1, 25, 50, 100)
+
+
+def day_key(timestamp: float) -> str:
+    """
+    Get the local calendar day of a timestamp.
+
+    Args:
+        timestamp: Unix timestamp in seconds
+
+    Returns:
+        Day in YYYY-MM-DD format
+    """
+    return datetime.fromtimestamp(timestamp).date().isoformat()
+
+
+def empty_bucket() -> Dict[str, int]:
+    """
+    Get a bucket with all counters at zero.
+
+    Returns:
+        Bucket dictionary
+    """
+    return {"focus_seconds": 0, "pomodoros": 0, "break_seconds": 0, "sessions": 0}
+
+
+def focus_level(focus_seconds: int) -> int:
+    """
+    Get the heatmap intensity level for a day.
+
+    Args:
+        focus_seconds: Focus time of the day in seconds
+
+    Returns:
+        Level between 0 (no focus) and len(HEATMAP_LEVELS)
+    """
+    minutes = focus_seconds / 60
+    level = 0
+    for threshold in HEATMAP_LEVELS:
+        if minutes >= threshold:
+            level += 1
+    return level
+
+
+def week_key(day: date) -> str:
+    """
+    Get the ISO week (Monday to Sunday) of a day.
+
+    Args:
+        day: Calendar day
+
+    Returns:
+        Week in YYYY-Www format
+    """
+    year, week, _ = day.isocalendar()
+    return f"{year:04d}-W{week:02d}"
+
+
+def sketch_values(record: Dict[str, Any]) -> Iterator[Tuple[str, float]]:
+    """
+    Get the values a session contributes to each sketch metric.
+
+    Args:
+        record: Session record
+
+    Returns:
+        Iterator over (metric, value) pairs
+    """
+    if record.get("pause_seconds"):
+        yield "pause_seconds", record["pause_seconds"]
+    if record.get("kind") == STATE_WORK:
+        yield "focus_length", record.get("duration", 0)
+        started = datetime.fromtimestamp(record["start"])
+        yield "start_minute", started.hour * 60 + started.minute
+
+
+def empty_streak(goal: int) -> Dict[str, Any]:
+    """
+    Get a streak with no qualifying days.
+
+    Args:
+        goal: Daily pomodoro goal the streak is counted against
+
+    Returns:
+        Streak dictionary
+    """
+    return {"goal": goal, "current": 0, "longest": 0, "last_day": None}
+
+
+class Rollups:
+    """Per-day focus and break totals derived from the session history."""
+
+    def __init__(
+        self,
+        store: HistoryStore,
+        path: Optional[Path] = None,
+        daily_goal: int = DEFAULT_DAILY_GOAL,
+        persist: bool = True,
+    ):
+        """
+        Initialize rollups for a history store.
+
+        Args:
+            store: History store the rollups summarize
+            path: Rollup file path. If None, stored in the history directory.
+            daily_goal: Pomodoros a day needs to extend the streak
+            persist: Save the rollups; if False they are only built in memory
+        """
+        self.store = store
+        self.persist = persist
+        self.path = Path(path) if path else store.history_dir / ROLLUPS_FILE
+        self.days: Dict[str, Dict[str, int]] = {}
+        # Sketches by day (YYYY-MM-DD) and by week (YYYY-Www), then metric
+        # Sketches by kind ("day_sketches" keyed YYYY-MM-DD, "week_sketches"
+        # keyed YYYY-Www), period and metric. Persisted sketches are only
+        # restored when a period is used; serialized forms are refreshed
+        # on save for changed periods only.
+        self._sketches: Dict[str, Dict[str, Dict[str, QuantileSketch]]] = {
+            "day_sketches": {},
+            "week_sketches": {},
+        }
+        self._sketch_dumps: Dict[str, Dict[str, Any]] = {"day_sketches": {}, "week_sketches": {}}
+        self._dirty_sketches: set = set()
+        self.daily_goal = max(1, int(daily_goal))
+        self.streak = empty_streak(self.daily_goal)
+        # Bumped whenever a bucket other than today's may have changed,
+        # so render caches only need to watch today's bucket otherwise
+        self.epoch = 0
+        self._stale = True
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted rollups if they match the history on disk."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != ROLLUPS_VERSION:
+            return
+        if data.get("fingerprint") != self.store.fingerprint():
+            return
+        self.days = data.get("days", {})
+        self._sketch_dumps = {
+            "day_sketches": data.get("day_sketches", {}),
+            "week_sketches": data.get("week_sketches", {}),
+        }
+        self._sketches = {"day_sketches": {}, "week_sketches": {}}
+        streak = data.get("streak")
+        if streak and streak.get("goal") == self.daily_goal:
+            self.streak = streak
+        else:
+            self._rebuild_streak()
+        self._stale = False
+
+    def _period_sketches(self, name: str, period: str) -> Dict[str, QuantileSketch]:
+        """Get the sketches of a day or week, restoring them if persisted."""
+        sketches = self._sketches[name]
+        by_metric = sketches.get(period)
+        if by_metric is None:
+            dumped = self._sketch_dumps[name].get(period, {})
+            by_metric = {metric: QuantileSketch.from_dict(data) for metric, data in dumped.items()}
+            sketches[period] = by_metric
+        return by_metric
+
+    def _dump_sketches(self) -> Dict[str, Dict[str, Any]]:
+        """Get the serialized sketches, converting only changed periods."""
+        for name, period in self._dirty_sketches:
+            self._sketch_dumps[name][period] = {
+                metric: sketch.to_dict() for metric, sketch in self._sketches[name][period].items()
+            }
+        self._dirty_sketches.clear()
+        return self._sketch_dumps
+
+    def save(self) -> bool:
+        """
+        Persist the rollups atomically.
+
+        Returns:
+            True if successful (or not persisted), False otherwise
+        """
+        if not self.persist:
+            return True
+        with self._lock:
+            dumps = self._dump_sketches()
+            data = {
+                "version": ROLLUPS_VERSION,
+                "fingerprint": self.store.fingerprint(),
+                "days": self.days,
+                "day_sketches": dumps["day_sketches"],
+                "week_sketches": dumps["week_sketches"],
+                "streak": self.streak,
+            }
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(data, separators=(",", ":")))
+                os.replace(tmp_path, self.path)
+                return True
+            except OSError as e:
+                print(f"Error saving rollups: {e}")
+                return False
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Add a session record to its day bucket and sketches."""
+        day = day_key(record["start"])
+        bucket = self.days.setdefault(day, empty_bucket())
+        duration = int(record.get("duration", 0))
+        bucket["sessions"] += 1
+        if record.get("kind") == STATE_WORK:
+            bucket["focus_seconds"] += duration
+            if record.get("completed"):
+                bucket["pomodoros"] += 1
+        else:
+            bucket["break_seconds"] += duration
+
+        week = week_key(date.fromisoformat(day))
+        for metric, value in sketch_values(record):
+            for name, period in (("day_sketches", day), ("week_sketches", week)):
+                by_metric = self._period_sketches(name, period)
+                if metric not in by_metric:
+                    by_metric[metric] = QuantileSketch()
+                by_metric[metric].add(value)
+                self._dirty_sketches.add((name, period))
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Fold a newly appended session into the rollups and persist them.
+
+        Args:
+            record: Session record
+        """
+        with self._lock:
+            if self._stale:
+                self.rebuild()
+                return
+            self._apply(record)
+            self._advance_streak(record)
+            if day_key(record["start"]) != date.today().isoformat():
+                self.epoch += 1
+            self.save()
+
+    def _advance_streak(self, record: Dict[str, Any]) -> None:
+        """Extend the streak when a session makes its day reach the goal."""
+        if record.get("kind") != STATE_WORK or not record.get("completed"):
+            return
+        day = day_key(record["start"])
+        if self.days[day]["pomodoros"] != self.daily_goal:
+            return
+
+        last_day = self.streak["last_day"]
+        if last_day is not None and day <= last_day:
+            # A past day reached the goal late; recount from the buckets
+            self._rebuild_streak()
+            return
+        previous_day = (date.fromisoformat(day) - timedelta(days=1)).isoformat()
+        current = self.streak["current"] + 1 if last_day == previous_day else 1
+        self.streak["current"] = current
+        self.streak["longest"] = max(self.streak["longest"], current)
+        self.streak["last_day"] = day
+
+    def _rebuild_streak(self) -> None:
+        """Recount the streak from the day buckets."""
+        streak = empty_streak(self.daily_goal)
+        previous: Optional[date] = None
+        for key in sorted(self.days):
+            if self.days[key]["pomodoros"] < self.daily_goal:
+                continue
+            day = date.fromisoformat(key)
+            if previous is not None and day - previous == timedelta(days=1):
+                streak["current"] += 1
+            else:
+                streak["current"] = 1
+            streak["longest"] = max(streak["longest"], streak["current"])
+            previous = day
+        streak["last_day"] = previous.isoformat() if previous else None
+        self.streak = streak
+
+    def set_daily_goal(self, goal: int) -> None:
+        """
+        Change the daily goal, recounting the streak if it differs.
+
+        Args:
+            goal: Pomodoros a day needs to extend the streak
+        """
+        goal = max(1, int(goal))
+        with self._lock:
+            if goal == self.daily_goal:
+                return
+            self.daily_goal = goal
+            if not self._stale:
+                self._rebuild_streak()
+                self.save()
+
+    def streaks(self, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Get the current and longest streaks.
+
+        The current streak stays alive through today until the day is
+        over, so it only drops to zero once a full day missed the goal.
+
+        Args:
+            today: Current day (defaults to date.today())
+
+        Returns:
+            Dictionary with current and longest streak lengths in days
+        """
+        self.ensure_fresh()
+        today = today or date.today()
+        last_day = self.streak["last_day"]
+        alive = last_day is not None and last_day >= (today - timedelta(days=1)).isoformat()
+        return {
+            "current": self.streak["current"] if alive else 0,
+            "longest": self.streak["longest"],
+        }
+
+    def invalidate(self, record: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Mark the rollups stale after an edit, deletion or import.
+
+        Args:
+            record: Affected record (unused, matches the history callback)
+        """
+        with self._lock:
+            self._stale = True
+            self.epoch += 1
+
+    def rebuild(self) -> None:
+        """Recompute all buckets with one pass over the history."""
+        with self._lock:
+            self.days = {}
+            self._sketches = {"day_sketches": {}, "week_sketches": {}}
+            self._sketch_dumps = {"day_sketches": {}, "week_sketches": {}}
+            for record in self.store.iter_sessions():
+                self._apply(record)
+            self._rebuild_streak()
+            self._stale = False
+            self.epoch += 1
+            self.save()
+
+    def ensure_fresh(self) -> None:
+        """Rebuild the rollups if they no longer match the history."""
+        with self._lock:
+            if self._stale:
+                self.rebuild()
+
+    def day(self, day: date) -> Dict[str, int]:
+        """
+        Get the bucket for a single day.
+
+        Args:
+            day: Calendar day
+
+        Returns:
+            Copy of the day's bucket
+        """
+        self.ensure_fresh()
+        return dict(self.days.get(day.isoformat(), empty_bucket()))
+
+    def iter_days(self, start: date, end: date) -> Iterator[Tuple[date, Dict[str, int]]]:
+        """
+        Iterate over the buckets of a range of days.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Iterator over (day, bucket) tuples, including empty days
+        """
+        self.ensure_fresh()
+        current = start
+        while current <= end:
+            yield current, self.days.get(current.isoformat(), empty_bucket())
+            current += timedelta(days=1)
+
+    def totals(self, start: date, end: date) -> Dict[str, int]:
+        """
+        Sum the buckets of a range of days.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Bucket with summed counters
+        """
+        total = empty_bucket()
+        for _, bucket in self.iter_days(start, end):
+            for key, value in bucket.items():
+                total[key] += value
+        return total
+
+    def sketch(self, metric: str, start: date, end: date) -> QuantileSketch:
+        """
+        Merge the sketches of a metric over a range of days.
+
+        Whole weeks inside the range use their weekly sketch, so a range
+        merges at most about one sketch per week plus the partial weeks'
+        days.
+
+        Args:
+            metric: One of SKETCH_METRICS
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Merged sketch
+        """
+        self.ensure_fresh()
+        merged = QuantileSketch()
+        current = start
+        while current <= end:
+            week_end = current + timedelta(days=6)
+            if current.weekday() == 0 and week_end <= end:
+                sketches = self._period_sketches("week_sketches", week_key(current))
+                current = week_end + timedelta(days=1)
+            else:
+                sketches = self._period_sketches("day_sketches", current.isoformat())
+                current += timedelta(days=1)
+            if metric in sketches:
+                merged.merge(sketches[metric])
+        return merged
+
+    def quantiles(
+        self,
+        metric: str,
+        start: date,
+        end: date,
+        qs: Iterable[float] = (0.5, 0.9),
+    ) -> Dict[float, Optional[float]]:
+        """
+        Estimate quantiles of a metric over a range of days.
+
+        Args:
+            metric: One of SKETCH_METRICS
+            start: First day (inclusive)
+            end: Last day (inclusive)
+            qs: Quantiles to estimate
+
+        Returns:
+            Dictionary mapping each quantile to its estimate (None if no data)
+        """
+        merged = self.sketch(metric, start, end)
+        return {q: merged.quantile(q) for q in qs}
+
+
+# Global rollups instance
+_rollups: Optional[Rollups] = None
+
+
+def get_rollups() -> Rollups:
+    """
+    Get the global rollups instance, subscribed to the global history.
+
+    Returns:
+        Global Rollups instance
+    """
+    global _rollups
+    if _rollups is None:
+        store = get_history_store()
+        _rollups = Rollups(store, daily_goal=get_config().settings.goals.daily_pomodoros)
+        store.on("append", _rollups.add)
+        store.on("change", _rollups.invalidate)
+    return _rollups
@@ -0,0 +1,185 @@
+"""
+Incremental fuzzy search index over task titles.
+
+A task matches a query when every query word appears in its title as a
+subsequence (the letters in order, not necessarily adjacent), ignoring
+case. Two inverted indexes avoid rescanning every title per keystroke:
+
+- characters to tasks: only tasks containing every character of the
+  query can match, so candidates are the intersection of a few sets;
+- trigrams to tasks: tasks sharing more trigrams with the query (titles
+  are padded with a space, so word starts count too) are checked and
+  ranked first.
+
+Candidate sets are cached per character set, so typing another letter
+only intersects the previous candidates with one more set. Adding,
+renaming or removing a task updates just that task's postings.
+"""
+import re
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+
+
+# Candidate sets kept for recent queries (typing and backspacing reuse them)
+CANDIDATE_CACHE_SIZE = 16
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the trigrams of a lowercased, space-padded text.
+
+    Args:
+        text: Lowercased text
+
+    Returns:
+        Set of three-character substrings of " " + text
+    """
+    padded = " " + text
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TaskIndex:
+    """Character and trigram index for fuzzy matching task titles."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._texts: Dict[str, str] = {}
+        self._chars: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._candidates: "OrderedDict[FrozenSet[str], Set[str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of indexed tasks."""
+        return len(self._texts)
+
+    def add(self, key: str, text: str) -> None:
+        """
+        Index a task title, replacing any previous title of the task.
+
+        Args:
+            key: Task id
+            text: Task title
+        """
+        if key in self._texts:
+            self.remove(key)
+        text = text.lower()
+        self._texts[key] = text
+        for char in set(text) - {" "}:
+            self._chars.setdefault(char, set()).add(key)
+        for gram in trigrams(text):
+            self._trigrams.setdefault(gram, set()).add(key)
+        # Cached candidates only cover tasks indexed before; drop the
+        # ones this title could now belong to
+        for chars in [chars for chars in self._candidates if chars <= set(text)]:
+            del self._candidates[chars]
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a task from the index.
+
+        Args:
+            key: Task id (ignored if not indexed)
+        """
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for char in set(text) - {" "}:
+            postings = self._chars[char]
+            postings.discard(key)
+            if not postings:
+                del self._chars[char]
+        for gram in trigrams(text):
+            postings = self._trigrams[gram]
+            postings.discard(key)
+            if not postings:
+                del self._trigrams[gram]
+        for candidates in self._candidates.values():
+            candidates.discard(key)
+
+    def _candidates_for(self, chars: FrozenSet[str]) -> Set[str]:
+        """Get the tasks containing every character, reusing cached sets."""
+        candidates = self._candidates.get(chars)
+        if candidates is not None:
+            self._candidates.move_to_end(chars)
+            return candidates
+
+        # Start from the largest cached subset (usually the query before
+        # the last keystroke) and intersect the missing characters only
+        base_chars: FrozenSet[str] = _EMPTY
+        for cached in self._candidates:
+            if cached <= chars and len(cached) > len(base_chars):
+                base_chars = cached
+        postings = [self._chars.get(char) for char in chars - base_chars]
+        if None in postings:
+            candidates: Set[str] = set()
+        else:
+            postings.sort(key=len)
+            if base_chars:
+                candidates = self._candidates[base_chars].intersection(*postings)
+            else:
+                candidates = postings[0].intersection(*postings[1:])
+
+        self._candidates[chars] = candidates
+        while len(self._candidates) > CANDIDATE_CACHE_SIZE:
+            self._candidates.popitem(last=False)
+        return candidates
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """
+        Find tasks whose titles fuzzy-match a query.
+
+        Args:
+            query: Words to match, each as a subsequence of the title
+            limit: Maximum number of results
+            accept: Optional filter called with each matching task id
+
+        Returns:
+            Matching task ids, best matches first
+        """
+        words = query.lower().split()
+        chars = frozenset("".join(words))
+        if not chars:
+            return []
+        candidates = self._candidates_for(chars)
+        if not candidates:
+            return []
+
+        # Rank by trigrams shared with the query; only their postings are visited
+        grams = set().union(*(trigrams(word) for word in words))
+        hits: Counter = Counter()
+        for gram in grams:
+            postings = self._trigrams.get(gram)
+            if postings:
+                hits.update(candidates.intersection(postings))
+
+        patterns = [re.compile(".*?".join(map(re.escape, word))) for word in words]
+        results = []
+        for key in self._ordered(hits, len(grams), candidates):
+            text = self._texts[key]
+            if all(pattern.search(text) for pattern in patterns) and (accept is None or accept(key)):
+                results.append(key)
+                if len(results) >= limit:
+                    break
+        results.sort(key=lambda key: (-hits[key], len(self._texts[key])))
+        return results
+
+    @staticmethod
+    def _ordered(hits: Counter, most: int, candidates: Set[str]) -> Iterable[str]:
+        """Yield candidates with trigram hits first, most hits first."""
+        # Bucket by hit count rather than sorting (key, count) pairs, which
+        # would allocate a tuple per candidate on every keystroke
+        buckets: List[List[str]] = [[] for _ in range(most + 1)]
+        for key, count in hits.items():
+            buckets[count].append(key)
+        for bucket in reversed(buckets):
+            yield from bucket
+        for key in candidates:
+            if key not in hits:
+                yield key
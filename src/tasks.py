@@ -0,0 +1,242 @@
+"""
+Task list that pomodoros can be attached to.
+
+Tasks are kept in a JSON-lines log in the configuration directory: every
+change appends the task's new state, later lines supersede earlier ones
+and tombstones (``deleted`` set) remove a task. The log is compacted once
+superseded lines outnumber live tasks. Titles are kept in a TaskIndex so
+the picker can fuzzy-search tens of thousands of tasks per keystroke.
+"""
+import json
+import os
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.history import new_record_id, serialize_record
+from src.task_index import TaskIndex
+from src.utils.constants import CONFIG_DIR, TASKS_FILE
+
+
+# Superseded log lines tolerated before the log is compacted
+COMPACT_AFTER = 1000
+
+
+class TaskStore:
+    """Stores tasks and keeps their fuzzy search index up to date."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the task store.
+
+        Args:
+            path: Task log path. If None, stored in the configuration directory.
+        """
+        self.path = Path(path) if path else Path(CONFIG_DIR).expanduser() / TASKS_FILE
+        self.index = TaskIndex()
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._log_lines = 0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def load(self) -> None:
+        """
+        Read the task log and build the search index.
+
+        Runs once, on first use; call it from a worker thread to build the
+        index of a long task list ahead of time. Other calls wait until the
+        index is complete instead of reading a partly loaded list.
+        """
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            task = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Skip a line torn by a crash
+                            continue
+                        self._log_lines += 1
+                        if task.get("deleted"):
+                            self._tasks.pop(task["id"], None)
+                        else:
+                            self._tasks[task["id"]] = task
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error loading tasks: {e}")
+            for key, task in self._tasks.items():
+                if not task.get("done"):
+                    self.index.add(key, task["title"])
+            self._loaded = True
+
+    def _write(self, task: Dict[str, Any]) -> None:
+        """Append a task's new state to the log, compacting when due."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(serialize_record(task))
+            self._log_lines += 1
+            if self._log_lines - len(self._tasks) > max(COMPACT_AFTER, len(self._tasks)):
+                self.compact()
+        except OSError as e:
+            print(f"Error saving tasks: {e}")
+
+    def compact(self) -> None:
+        """Rewrite the log with only the current state of each task."""
+        with self._lock:
+            self.load()
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(serialize_record(task) for task in self._tasks.values())
+            os.replace(tmp_path, self.path)
+            self._log_lines = len(self._tasks)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a task by id.
+
+        Args:
+            task_id: Task id
+
+        Returns:
+            Task dictionary (do not modify), or None if unknown
+        """
+        with self._lock:
+            self.load()
+            return self._tasks.get(task_id)
+
+    def add(self, title: str) -> Dict[str, Any]:
+        """
+        Create a task.
+
+        Args:
+            title: Task title
+
+        Returns:
+            The new task
+        """
+        task = {
+            "id": new_record_id(),
+            "title": title.strip(),
+            "created": round(time.time(), 3),
+            "done": False,
+            "pomodoros": 0,
+        }
+        with self._lock:
+            self.load()
+            self._tasks[task["id"]] = task
+            self.index.add(task["id"], task["title"])
+            self._write(task)
+        return task
+
+    def _change(self, task_id: str, **changes: Any) -> Optional[Dict[str, Any]]:
+        """Store a changed copy of a task and update the index."""
+        with self._lock:
+            self.load()
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            task = {**task, **changes}
+            self._tasks[task_id] = task
+            if task.get("done"):
+                self.index.remove(task_id)
+            elif "title" in changes or "done" in changes:
+                self.index.add(task_id, task["title"])
+            self._write(task)
+            return task
+
+    def rename(self, task_id: str, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Change a task's title.
+
+        Args:
+            task_id: Task id
+            title: New title
+
+        Returns:
+            The updated task, or None if unknown
+        """
+        return self._change(task_id, title=title.strip())
+
+    def set_done(self, task_id: str, done: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Mark a task as done (hidden from searches) or open.
+
+        Args:
+            task_id: Task id
+            done: New state
+
+        Returns:
+            The updated task, or None if unknown
+        """
+        return self._change(task_id, done=done)
+
+    def add_pomodoro(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Count a completed pomodoro towards a task.
+
+        Args:
+            task_id: Task id
+
+        Returns:
+            The updated task, or None if unknown
+        """
+        task = self.get(task_id)
+        if task is None:
+            return None
+        return self._change(task_id, pomodoros=task.get("pomodoros", 0) + 1)
+
+    def delete(self, task_id: str) -> None:
+        """
+        Delete a task.
+
+        Args:
+            task_id: Task id (ignored if unknown)
+        """
+        with self._lock:
+            self.load()
+            if self._tasks.pop(task_id, None) is None:
+                return
+            self.index.remove(task_id)
+            self._write({"id": task_id, "deleted": True})
+
+    def search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Find open tasks by fuzzy title match.
+
+        Args:
+            query: Search text; empty lists the most recent open tasks
+            limit: Maximum number of results
+
+        Returns:
+            Matching tasks, best matches first
+        """
+        with self._lock:
+            self.load()
+            if not query.strip():
+                # Tasks keep their creation order, so the newest come last
+                open_tasks = (task for task in reversed(self._tasks.values()) if not task.get("done"))
+                return list(islice(open_tasks, limit))
+            return [self._tasks[key] for key in self.index.search(query, limit)]
+
+
+# Global task store instance
+_task_store: Optional[TaskStore] = None
+
+
+def get_task_store() -> TaskStore:
+    """
+    Get the global task store instance.
+
+    Returns:
+        Global TaskStore instance
+    """
+    global _task_store
+    if _task_store is None:
+        _task_store = TaskStore()
+    return _task_store
@@ -139,10 +139,14 @@ class PomodoroTimer:
             if old_state != new_state:
                 self._emit("state_change", old_state, new_state)
 
-    def start(self) -> bool:
+    def start(self, work_seconds: Optional[int] = None) -> bool:
         """
         Start a work session.
 
+        Args:
+            work_seconds: Length of this session in seconds. If None, uses
+                the configured work duration.
+
         Returns:
             True if started successfully, False otherwise
         """
@@ -152,7 +156,7 @@ class PomodoroTimer:
 
             # Start a new work session
             self._change_state(TimerState.WORK)
-            self.total_seconds = self.work_duration
+            self.total_seconds = work_seconds or self.work_duration
             self.elapsed_seconds = 0
             self.remaining_seconds = self.total_seconds
 
@@ -0,0 +1,140 @@
+"""
+Synthesized notification tones.
+
+Tones are rendered once with NumPy as 16-bit PCM, with short raised-cosine
+fades at both ends of every tone so they start and stop without a click.
+Rendered sounds are kept in memory and as WAV files on disk (named after
+a digest of everything that shapes the samples), and handed out as
+read-only memoryviews so playback never copies them.
+
+Volume is applied by scaling the rendered samples, so changing it never
+renders the tones again. The scaled copies of the most recently used
+volume levels are cached as well.
+"""
+import hashlib
+import os
+import threading
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from src.utils.constants import AUDIO_SAMPLE_RATE
+
+
+# Peak amplitude of synthesized tones (16-bit full scale is 32767)
+TONE_AMPLITUDE = 16000
+
+# Length of the fade-in and fade-out of every tone (ms)
+TONE_FADE_MS = 5
+
+# Sounds kept scaled to a volume level; the least recently used is dropped
+VOLUME_CACHE_SIZE = 12
+
+Tones = Sequence[Tuple[int, int]]
+
+
+def synthesize(tones: Tones) -> np.ndarray:
+    """
+    Render tones as PCM samples.
+
+    Args:
+        tones: (frequency in Hz, duration in ms) tones played in turn
+
+    Returns:
+        16-bit little-endian mono samples at AUDIO_SAMPLE_RATE
+    """
+    parts = []
+    for frequency, duration_ms in tones:
+        count = AUDIO_SAMPLE_RATE * duration_ms // 1000
+        tone = np.sin(np.arange(count) * (2 * np.pi * frequency / AUDIO_SAMPLE_RATE))
+        fade = min(AUDIO_SAMPLE_RATE * TONE_FADE_MS // 1000, count // 2)
+        if fade:
+            ramp = 0.5 - 0.5 * np.cos(np.linspace(0.0, np.pi, fade))
+            tone[:fade] *= ramp
+            tone[count - fade:] *= ramp[::-1]
+        parts.append(tone)
+    samples = np.concatenate(parts) if parts else np.zeros(0)
+    return np.round(samples * TONE_AMPLITUDE).astype("<i2")
+
+
+class ToneCache:
+    """Rendered sounds kept in memory and as WAV files."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the WAV files (created when first written)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        # Samples at full volume, by sound name
+        self._sounds: Dict[str, np.ndarray] = {}
+        # (name, volume level) -> scaled samples, in least recently used order
+        self._scaled: "OrderedDict[Tuple[str, float], memoryview]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str, tones: Tones, volume: float = 1.0) -> memoryview:
+        """
+        Get a sound, rendering it only if neither memory nor disk has it.
+
+        Args:
+            name: Sound name
+            tones: Tones making up the sound
+            volume: Volume between 0.0 and 1.0 (rounded to hundredths)
+
+        Returns:
+            Read-only view of the 16-bit PCM samples
+        """
+        level = round(min(max(volume, 0.0), 1.0), 2)
+        key = (name, level)
+        with self._lock:
+            sound = self._scaled.get(key)
+            if sound is not None:
+                self._scaled.move_to_end(key)
+                return sound
+
+            samples = self._sounds.get(name)
+            if samples is None:
+                samples = self._load(name, tones)
+                samples.flags.writeable = False
+                self._sounds[name] = samples
+            if level != 1.0:
+                samples = np.round(samples * level).astype("<i2")
+                samples.flags.writeable = False
+            sound = self._scaled[key] = memoryview(samples).cast("B")
+            if len(self._scaled) > VOLUME_CACHE_SIZE:
+                self._scaled.popitem(last=False)
+            return sound
+
+    def _path(self, name: str, tones: Tones) -> Path:
+        """Get the WAV file of a sound; the digest changes with how it is rendered."""
+        shape = repr((tuple(tones), AUDIO_SAMPLE_RATE, TONE_AMPLITUDE, TONE_FADE_MS))
+        return self.cache_dir / f"{name}-{hashlib.sha1(shape.encode()).hexdigest()[:12]}.wav"
+
+    def _load(self, name: str, tones: Tones) -> np.ndarray:
+        """Read a sound from its WAV file, or render and write it."""
+        path = self._path(name, tones)
+        try:
+            with wave.open(str(path), "rb") as wav:
+                if (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (1, 2, AUDIO_SAMPLE_RATE):
+                    return np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        except (OSError, EOFError, wave.Error):
+            pass
+
+        samples = synthesize(tones)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with wave.open(str(tmp_path), "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(AUDIO_SAMPLE_RATE)
+                wav.writeframes(samples.tobytes())
+            os.replace(tmp_path, path)
+        except (OSError, wave.Error) as e:
+            print(f"Error saving tone cache: {e}")
+        return samples
@@ -30,6 +30,17 @@ MAX_LONG_BREAK_DURATION = 30
 MIN_POMODOROS_UNTIL_LONG_BREAK = 2
 MAX_POMODOROS_UNTIL_LONG_BREAK = 6
 
+# Default pomodoro goals
+DEFAULT_DAILY_GOAL = 8
+DEFAULT_WEEKLY_GOAL = 40
+
+# Calendar planning: shortest work session worth fitting before a meeting (minutes)
+MIN_PLANNED_WORK_MINUTES = 10
+
+# Calendar planning: when the planned day starts and ends (HH:MM)
+DEFAULT_DAY_START = "09:00"
+DEFAULT_DAY_END = "18:00"
+
 # Phase display names
 PHASE_NAMES = {
     STATE_WORK: "FOCUS TIME",
@@ -43,6 +54,23 @@ PHASE_NAMES = {
 CONFIG_DIR = "~/.pomodoro-tui"
 CONFIG_FILE = "config.toml"
 HISTORY_FILE = "history.json"
+HISTORY_DIR = "history"
+TASKS_FILE = "tasks.jsonl"
+
+# Parsed config snapshot, reused while config.toml is unchanged
+CONFIG_CACHE_FILE = ".config.cache"
+
+# Bump when the config layout or defaults change (invalidates cached snapshots)
+CONFIG_SCHEMA_VERSION = 3
+
+# Seconds of quiet before config changes are written (bursts become one write)
+CONFIG_SAVE_DELAY = 0.5
+
+# History export formats
+EXPORT_FORMATS = ("csv", "jsonl")
+
+# Report formats
+REPORT_FORMATS = ("html", "markdown")
 
 # Default theme
 DEFAULT_THEME = "pomodoro-default"
@@ -56,9 +84,31 @@ ART_STYLE_FANCY = "fancy"
 DEFAULT_VOLUME = 0.7
 DEFAULT_AUDIO_ENABLED = True
 
+# Audio backends; "auto" picks winsound on Windows, else PulseAudio or ALSA if installed
+AUDIO_BACKENDS = ("auto", "winsound", "pulse", "aplay", "wav", "null")
+DEFAULT_AUDIO_BACKEND = "auto"
+
+# Sample rate of synthesized notification tones (Hz, 16-bit mono)
+AUDIO_SAMPLE_RATE = 22050
+
+# Sounds waiting to be played; further ones are dropped rather than piling up
+AUDIO_QUEUE_SIZE = 4
+
+# Rendered notification tones, kept as WAV files (in CONFIG_DIR)
+AUDIO_CACHE_DIR = "sounds"
+
+# File the "wav" audio backend writes each notification to (in CONFIG_DIR)
+AUDIO_WAV_FILE = "notification.wav"
+
 # UI update interval (seconds)
 TIMER_TICK_INTERVAL = 1.0
 
+# How often the config file is checked for outside edits (seconds)
+CONFIG_POLL_INTERVAL = 2.0
+
+# How often the calendar file is re-read if changed and today's meetings expanded (seconds)
+CALENDAR_POLL_INTERVAL = 60.0
+
 # Color CSS classes
 CSS_CLASS_TIMER_WORK = "timer-work"
 CSS_CLASS_TIMER_BREAK = "timer-break"
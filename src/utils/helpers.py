@@ -1,6 +1,7 @@
 """
 Helper utility functions for the Pomodoro TUI application.
 """
+from datetime import datetime
 from typing import Tuple
 
 
@@ -19,6 +20,33 @@ def format_time(seconds: int) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+def format_duration(seconds: int) -> str:
+    """
+    Format a total duration as hours and minutes.
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        Formatted duration (e.g. "3h 25m")
+    """
+    hours, minutes = divmod(seconds // 60, 60)
+    return f"{hours}h {minutes:02d}m" if hours else f"{minutes}m"
+
+
+def round_to_minute(seconds: float) -> int:
+    """
+    Round a duration to whole minutes.
+
+    Args:
+        seconds: Duration in seconds (may be an estimate)
+
+    Returns:
+        Duration in seconds, a multiple of 60
+    """
+    return int(round(seconds / 60)) * 60
+
+
 def parse_time(time_str: str) -> int:
     """
     Parse MM:SS time string into total seconds.
@@ -96,3 +124,21 @@ def validate_duration(duration: int, min_val: int, max_val: int) -> bool:
         True if valid, False otherwise
     """
     return min_val <= duration <= max_val
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Parse an ISO 8601 date or datetime into a Unix timestamp.
+
+    Values without a UTC offset are interpreted in local time.
+
+    Args:
+        value: Date (YYYY-MM-DD) or datetime string
+
+    Returns:
+        Unix timestamp in seconds
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 date or datetime
+    """
+    return datetime.fromisoformat(value.strip()).timestamp()
@@ -0,0 +1,151 @@
+"""
+Unit tests for queued notification sounds, the tone cache and audio backends.
+"""
+import tempfile
+import threading
+import time
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from src import tones
+from src.audio import SOUNDS, AudioManager
+from src.audio_backends import AudioBackend, NullBackend, WavFileBackend, create_backend
+from src.config_schema import AudioSettings, Settings, replace
+from src.tones import ToneCache, synthesize
+from src.utils.constants import AUDIO_SAMPLE_RATE
+
+
+class SlowBackend(AudioBackend):
+    """Backend that blocks until released, recording what it played."""
+
+    name = "slow"
+
+    def __init__(self):
+        """Create the backend, blocked."""
+        self.release = threading.Event()
+        self.played = []
+
+    def play(self, pcm: memoryview) -> None:
+        """Wait for the release, then record the sound."""
+        self.release.wait(5)
+        self.played.append(pcm)
+
+
+class TestAudioManager(unittest.TestCase):
+    """Test cases for the background playback queue."""
+
+    def setUp(self):
+        """Create a manager with the null backend configured."""
+        self.tmp = tempfile.TemporaryDirectory()
+        config = mock.Mock(settings=Settings(audio=replace(AudioSettings(), backend="null")))
+        with mock.patch("src.audio.get_config", return_value=config):
+            self.audio = AudioManager()
+        self.audio._tones = ToneCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        """Remove the tone cache."""
+        self.tmp.cleanup()
+
+    def test_play_returns_while_backend_blocks(self):
+        """Test sounds are played on the playback thread, not the caller's."""
+        backend = SlowBackend()
+        with mock.patch("src.audio.create_backend", return_value=backend):
+            started = time.perf_counter()
+            self.audio.play_work_complete()
+            self.audio.play_break_complete()
+            self.assertLess(time.perf_counter() - started, 0.5)
+            self.assertEqual(backend.played, [])
+            backend.release.set()
+            self.audio.drain()
+        self.assertEqual(len(backend.played), 2)
+        # 200 ms + 300 ms of 16-bit samples, the cached buffer itself
+        self.assertEqual(len(backend.played[0]), 2 * AUDIO_SAMPLE_RATE // 2)
+        self.assertIs(backend.played[0], self.audio._tones.get("work_complete", SOUNDS["work_complete"], self.audio.volume))
+        self.assertLess(self.audio.last_latency, 5.0)
+
+    def test_disabled_queues_nothing(self):
+        """Test no sound is queued while audio is disabled."""
+        self.audio.enabled = False
+        self.audio.play_timer_start()
+        self.assertTrue(self.audio._queue.empty())
+        self.assertIsNone(self.audio._player)
+
+
+class TestTones(unittest.TestCase):
+    """Test cases for rendering and caching tones."""
+
+    def test_tones_fade_in_and_out(self):
+        """Test every tone starts and ends near silence and peaks in between."""
+        samples = synthesize(SOUNDS["work_complete"])
+        self.assertEqual(samples.dtype, np.dtype("<i2"))
+        boundary = AUDIO_SAMPLE_RATE * 200 // 1000
+        for edge in (0, boundary - 1, boundary, len(samples) - 1):
+            self.assertLess(abs(int(samples[edge])), 200)
+        self.assertGreater(int(np.abs(samples).max()), 0.9 * tones.TONE_AMPLITUDE)
+
+    def test_cache_reuses_memory_and_disk(self):
+        """Test sounds are rendered once, then served from memory or the WAV file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ToneCache(Path(tmp))
+            sound = cache.get("work_complete", SOUNDS["work_complete"])
+            self.assertTrue(sound.readonly)
+            self.assertIs(cache.get("work_complete", SOUNDS["work_complete"]), sound)
+            self.assertEqual(len(list(Path(tmp).glob("work_complete-*.wav"))), 1)
+
+            with mock.patch("src.tones.synthesize", side_effect=AssertionError("rendered again")):
+                reloaded = ToneCache(Path(tmp)).get("work_complete", SOUNDS["work_complete"])
+            self.assertEqual(reloaded.tobytes(), sound.tobytes())
+
+            # Rendering differently gets a new file instead of the stale one
+            with mock.patch("src.tones.TONE_FADE_MS", 10):
+                ToneCache(Path(tmp)).get("work_complete", SOUNDS["work_complete"])
+            self.assertEqual(len(list(Path(tmp).glob("work_complete-*.wav"))), 2)
+
+    def test_volume_scales_cached_samples(self):
+        """Test volume levels scale the rendered sound without rendering it again."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ToneCache(Path(tmp))
+            full = np.frombuffer(cache.get("timer_start", SOUNDS["timer_start"]), dtype="<i2")
+            with mock.patch("src.tones.synthesize", side_effect=AssertionError("rendered again")), \
+                    mock.patch("src.tones.VOLUME_CACHE_SIZE", 3):
+                half = cache.get("timer_start", SOUNDS["timer_start"], 0.5)
+                self.assertTrue(half.readonly)
+                np.testing.assert_array_equal(np.frombuffer(half, dtype="<i2"), np.round(full * 0.5))
+                self.assertIs(cache.get("timer_start", SOUNDS["timer_start"], 0.501), half)
+                self.assertFalse(np.frombuffer(cache.get("timer_start", SOUNDS["timer_start"], 0.0), dtype="<i2").any())
+                # A fourth level evicts the least recently used one (full volume)
+                cache.get("timer_start", SOUNDS["timer_start"], 0.2)
+                self.assertEqual([level for _, level in cache._scaled], [0.5, 0.0, 0.2])
+
+
+class TestBackends(unittest.TestCase):
+    """Test cases for choosing and using backends."""
+
+    def test_wav_backend_writes_playable_file(self):
+        """Test the WAV backend writes the sound as a mono 16-bit file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sound.wav"
+            pcm = ToneCache(Path(tmp)).get("work_complete", SOUNDS["work_complete"])
+            WavFileBackend(path).play(pcm)
+            with wave.open(str(path), "rb") as wav:
+                self.assertEqual((wav.getnchannels(), wav.getsampwidth()), (1, 2))
+                self.assertEqual(wav.getframerate(), AUDIO_SAMPLE_RATE)
+                self.assertEqual(wav.readframes(wav.getnframes()), pcm)
+
+    def test_unavailable_backend_falls_back_to_null(self):
+        """Test a missing player or module means silence, not a crash."""
+        with mock.patch("src.audio_backends.shutil.which", return_value=None), \
+                mock.patch("src.audio_backends.sys.platform", "linux"):
+            self.assertIsInstance(create_backend("auto"), NullBackend)
+            with mock.patch("builtins.print"):
+                self.assertIsInstance(create_backend("aplay"), NullBackend)
+        with mock.patch.dict("sys.modules", {"winsound": None}), mock.patch("builtins.print"):
+            self.assertIsInstance(create_backend("winsound"), NullBackend)
+
+
+if __name__ == "__main__":
+    unittest.main()
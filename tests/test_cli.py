@@ -0,0 +1,68 @@
+"""
+Tests for the command line subcommands.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestStatsCommand(unittest.TestCase):
+    """Test cases for the stats subcommand."""
+
+    def setUp(self):
+        """Set up a home directory with one session today."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.env = dict(os.environ, HOME=self._tmp.name)
+        code = (
+            "import time\n"
+            "from src.history import get_history_store, make_session_record\n"
+            "from src.stats import get_rollups\n"
+            "get_rollups().ensure_fresh()\n"
+            "get_history_store().append(make_session_record('WORK', time.time(), 1500, 1500, True))\n"
+        )
+        self._run(["-c", code])
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def _run(self, args):
+        """Run Python in the repository with the temporary home."""
+        result = subprocess.run(
+            [sys.executable, *args],
+            cwd=ROOT,
+            env=self.env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def test_stats_json(self):
+        """Test today's totals are printed as JSON."""
+        data = json.loads(self._run(["main.py", "stats", "--json"]))
+        self.assertEqual(data["pomodoros"], 1)
+        self.assertEqual(data["focus_seconds"], 1500)
+        self.assertEqual(data["start"], time.strftime("%Y-%m-%d"))
+
+    def test_stats_does_not_import_textual(self):
+        """Test the stats command stays clear of the TUI modules."""
+        code = (
+            "import sys, io, contextlib\n"
+            "from src.cli import main\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    main(['stats', '--week'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('textual', 'src.components'))))\n"
+        )
+        self.assertEqual(self._run(["-c", code]).strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
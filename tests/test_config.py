@@ -0,0 +1,202 @@
+"""
+Unit tests for configuration loading and write-behind saving.
+"""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import toml
+
+from src.config import Config
+from src.config_schema import FrozenInstanceError, parse_settings
+
+
+class TestConfig(unittest.TestCase):
+    """Test cases for the Config class."""
+
+    def setUp(self):
+        """Point the configuration directory at a temporary home."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"HOME": self.tmp.name, "USERPROFILE": self.tmp.name})
+        self.env.start()
+        self.config = Config()
+        self.config.load()
+        self.config.flush()
+
+    def tearDown(self):
+        """Write pending changes, then remove the temporary home."""
+        self.config.flush()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_burst_of_saves_is_one_write(self):
+        """Test rapid changes are coalesced and written in the background."""
+        with mock.patch("src.config.os.replace", wraps=os.replace) as replace:
+            for theme in ("a", "b", "c", "d", "e"):
+                self.config.set("appearance", "theme", theme)
+                self.config.save()
+            deadline = time.monotonic() + 10
+            while self.config._writer is not None and time.monotonic() < deadline:
+                time.sleep(0.05)
+            writes = [call for call in replace.call_args_list if call.args[1] == self.config.config_path]
+            self.assertEqual(len(writes), 1)
+        self.assertEqual(toml.load(self.config.config_path)["appearance"]["theme"], "e")
+        self.assertFalse(Path(str(self.config.config_path) + ".tmp").exists())
+
+    def test_write_errors_are_reported(self):
+        """Test a failed background write reaches the error handler, not stdout."""
+        errors = []
+        self.config.on_write_error = errors.append
+        with mock.patch("src.config.os.replace", side_effect=OSError("disk full")), \
+                mock.patch("builtins.print") as printed:
+            self.config.set("appearance", "theme", "a")
+            self.assertTrue(self.config.save())
+            deadline = time.monotonic() + 10
+            while self.config._writer is not None and time.monotonic() < deadline:
+                time.sleep(0.05)
+        self.assertNotIn("disk full", str(printed.call_args_list))
+        self.assertEqual(len(errors), 1)
+        self.assertIn("disk full", self.config.write_error)
+
+        self.config.set("appearance", "theme", "b")
+        self.assertFalse(self.config.save())
+        self.assertTrue(self.config.flush())
+        self.assertIsNone(self.config.write_error)
+
+    def test_load_keeps_pending_changes(self):
+        """Test reloading flushes changes that were not written yet."""
+        self.config.set("timer", "work_duration", 30)
+        self.config.save()
+        self.assertEqual(self.config.load()["timer"]["work_duration"], 30)
+        self.assertEqual(toml.load(self.config.config_path)["timer"]["work_duration"], 30)
+
+    def test_reload_applies_only_outside_edits(self):
+        """Test edits to the file are reported as changed keys, own writes are not."""
+        self.assertEqual(self.config.reload_if_changed(), {})
+        self.config.set("audio", "volume", 0.2)
+        self.config.save()
+        self.config.flush()
+        self.assertEqual(self.config.reload_if_changed(), {})
+
+        data = toml.load(self.config.config_path)
+        data["timer"]["work_duration"] = 40
+        data["appearance"]["theme"] = "pomodoro-nord"
+        with open(self.config.config_path, "w") as f:
+            toml.dump(data, f)
+            f.write("\n")
+        changes = self.config.reload_if_changed()
+        self.assertEqual(changes, {"timer": {"work_duration": 40}, "appearance": {"theme": "pomodoro-nord"}})
+        self.assertEqual(self.config.get("timer", "work_duration"), 40)
+        self.assertEqual(self.config.reload_if_changed(), {})
+
+    def test_warm_load_skips_toml(self):
+        """Test an unchanged file is loaded from the snapshot without parsing TOML."""
+        self.config.set("timer", "work_duration", 35)
+        self.config.save()
+        self.config.flush()
+
+        with mock.patch("toml.load", side_effect=AssertionError("parsed TOML")):
+            self.assertEqual(Config().load()["timer"]["work_duration"], 35)
+
+        with open(self.config.config_path, "a") as f:
+            f.write("\n# edited\n")
+        with mock.patch("toml.load", wraps=toml.load) as load:
+            self.assertEqual(Config().load()["timer"]["work_duration"], 35)
+            with mock.patch("src.config.CONFIG_SCHEMA_VERSION", 999):
+                Config().load()
+            self.assertEqual(load.call_count, 2)
+
+    def test_schema_rejects_bad_values(self):
+        """Test invalid values from disk fall back to their defaults."""
+        data = toml.load(self.config.config_path)
+        data["timer"]["work_duration"] = 200
+        data["timer"]["short_break_duration"] = 4
+        data["audio"]["volume"] = "loud"
+        data["audio"]["enabled"] = 1
+        data["calendar"]["day_end"] = "6pm"
+        with open(self.config.config_path, "w") as f:
+            toml.dump(data, f)
+
+        with mock.patch("builtins.print"):
+            config = Config()
+            config.load()
+        settings = config.settings
+        self.assertEqual(settings.timer.work_duration, 25)
+        self.assertEqual(settings.timer.short_break_duration, 4)
+        self.assertEqual((settings.audio.volume, settings.audio.enabled), (0.7, True))
+        self.assertEqual(settings.calendar.day_end, "18:00")
+        self.assertEqual(config.get("timer", "work_duration"), 25)
+        with self.assertRaises(FrozenInstanceError):
+            settings.timer.work_duration = 30
+
+        config.set("timer", "work_duration", 40)
+        self.assertEqual(config.settings.timer.work_duration, 40)
+        self.assertEqual(settings.timer.work_duration, 25)
+
+    def test_parse_settings_reports_rejections(self):
+        """Test each rejected value is reported with its section and key."""
+        _, rejected = parse_settings({"goals": {"daily_pomodoros": 0}, "appearance": {"ascii_art_style": "x"}})
+        self.assertEqual([(section, key) for section, key, _, _ in rejected],
+                         [("appearance", "ascii_art_style"), ("goals", "daily_pomodoros")])
+
+    def test_switch_profile(self):
+        """Test switching profiles swaps validated settings without parsing or writing."""
+        self.config.set("profiles", "Focus", {"work_duration": 45, "short_break_duration": 99, "theme": "pomodoro-nord"})
+        self.config.flush()
+        self.assertEqual(self.config.profile_names(), ["", "Deep work", "Meetings day", "Focus"])
+
+        with mock.patch("src.config.parse_settings") as parse, mock.patch.object(self.config, "flush") as flush:
+            settings = self.config.switch_profile("Focus")
+            parse.assert_not_called()
+            flush.assert_not_called()
+        self.assertIs(self.config.settings, settings)
+        self.assertEqual(settings.active_profile, "Focus")
+        self.assertEqual(settings.timer.work_duration, 45)
+        # The out-of-range override was rejected when the profile was loaded
+        self.assertEqual(settings.timer.short_break_duration, 5)
+        self.assertEqual(settings.appearance.theme, "pomodoro-nord")
+
+        self.config.flush()
+        self.assertEqual(Config().load()["profiles"]["active"], "Focus")
+        self.assertEqual(self.config.switch_profile("").timer.work_duration, 25)
+        with self.assertRaises(KeyError):
+            self.config.switch_profile("Missing")
+
+    def test_changes_publish_new_snapshots(self):
+        """Test published snapshots stay unchanged and consistent while writers run."""
+        data, settings = self.config.config_data, self.config.settings
+        self.config.set("timer", "work_duration", 30)
+        self.config.update({"audio": {"volume": 0.3}})
+        self.config.switch_profile("Deep work")
+        self.assertEqual(data["timer"]["work_duration"], 25)
+        self.assertEqual(data["audio"]["volume"], 0.7)
+        self.assertEqual(data["profiles"]["active"], "")
+        self.assertEqual(settings.timer.work_duration, 25)
+        self.assertIsNot(self.config.config_data, data)
+        # Sections nobody changed are shared, not copied
+        self.assertIs(self.config.config_data["goals"], data["goals"])
+
+        errors = []
+
+        def read():
+            for _ in range(2000):
+                snapshot = self.config._snapshot
+                if snapshot.data["timer"]["work_duration"] != snapshot.profiles[""].timer.work_duration:
+                    errors.append(snapshot)
+
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        for reader in readers:
+            reader.start()
+        for minutes in range(20, 60):
+            self.config.set("timer", "work_duration", minutes)
+        for reader in readers:
+            reader.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
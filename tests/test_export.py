@@ -0,0 +1,72 @@
+"""
+Unit tests for streaming history export.
+"""
+import csv
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.export import export_history
+from src.history import HistoryStore, make_session_record
+
+
+# 2024-01-15 12:00:00 UTC
+JAN = 1705320000.0
+# 2024-03-01 00:00:00 UTC
+MAR = 1709251200.0
+
+
+class TestExport(unittest.TestCase):
+    """Test cases for history export."""
+
+    def setUp(self):
+        """Populate a store spanning closed and open months."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(Path(self._tmp.name))
+        for day in range(60):
+            start = JAN + day * 86400
+            self.store.append(make_session_record("WORK", start, 1500, 1500, True))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def test_jsonl_export(self):
+        """Test JSONL export yields every record in order."""
+        out = io.StringIO()
+        count = export_history(self.store, "jsonl", out)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(count, 60)
+        self.assertEqual(len(lines), 60)
+        starts = [json.loads(line)["start"] for line in lines]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_jsonl_export_range(self):
+        """Test JSONL export honours since and until."""
+        out = io.StringIO()
+        count = export_history(self.store, "jsonl", out, since=JAN + 10 * 86400, until=MAR)
+        self.assertEqual(count, len(out.getvalue().splitlines()))
+        # 2024-01-25 .. 2024-02-29 inclusive
+        self.assertEqual(count, 36)
+
+    def test_csv_export(self):
+        """Test CSV export writes a header and one row per record."""
+        out = io.StringIO(newline="")
+        count = export_history(self.store, "csv", out, since=JAN + 59 * 86400)
+
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0][0], "id")
+        self.assertEqual(count, 1)
+        self.assertEqual(len(rows), 2)
+
+    def test_unknown_format(self):
+        """Test unsupported formats are rejected."""
+        with self.assertRaises(ValueError):
+            export_history(self.store, "xml", io.StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
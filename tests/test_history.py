@@ -0,0 +1,203 @@
+"""
+Unit tests for the session history store.
+"""
+import gzip
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.history import (
+    HistoryStore,
+    make_session_record,
+    month_bounds,
+    month_key,
+)
+
+
+# 2024-01-15 12:00:00 UTC and 2024-02-10 09:00:00 UTC
+JAN = 1705320000.0
+FEB = 1707555600.0
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Test cases for the HistoryStore class."""
+
+    def setUp(self):
+        """Set up a store in a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(Path(self._tmp.name))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def _record(self, start, duration=1500):
+        """Build a completed work record."""
+        return make_session_record("WORK", start, duration, 1500, True)
+
+    def test_month_helpers(self):
+        """Test segment keys and bounds."""
+        self.assertEqual(month_key(JAN), "2024-01")
+        start, end = month_bounds("2024-12")
+        self.assertEqual(month_key(start), "2024-12")
+        self.assertEqual(month_key(end), "2025-01")
+
+    def test_closed_months_are_compressed(self):
+        """Test appends to past months end up in compressed segments."""
+        self.store.append(self._record(JAN))
+        self.store.append(self._record(FEB))
+
+        path = Path(self._tmp.name)
+        self.assertTrue((path / "2024-01.jsonl.gz").exists())
+        self.assertFalse((path / "2024-01.jsonl").exists())
+        with gzip.open(path / "2024-02.jsonl.gz", "rt") as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def test_compaction_drops_superseded_and_deleted(self):
+        """Test edits and deletions are collapsed on compaction."""
+        first = self.store.append(self._record(JAN))
+        second = self.store.append(self._record(JAN + 60))
+        self.store.update(dict(first, duration=900))
+        self.store.delete(second)
+
+        sessions = list(self.store.iter_sessions())
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(sessions[0]["id"], first["id"])
+        self.assertEqual(sessions[0]["duration"], 900)
+
+    def test_range_query_skips_other_segments(self):
+        """Test range queries only read overlapping segments."""
+        self.store.append(self._record(JAN))
+        self.store.append(self._record(FEB))
+
+        # Corrupt January so reading it would fail loudly
+        (Path(self._tmp.name) / "2024-01.jsonl.gz").write_bytes(b"garbage")
+
+        sessions = list(self.store.iter_sessions(since=FEB - 3600))
+        self.assertEqual([s["start"] for s in sessions], [FEB])
+
+    def test_range_bounds(self):
+        """Test since is inclusive and until is exclusive."""
+        for offset in range(5):
+            self.store.append(self._record(JAN + offset * 3600))
+
+        sessions = list(self.store.iter_sessions(since=JAN + 3600, until=JAN + 3 * 3600))
+        self.assertEqual(len(sessions), 2)
+
+    def test_count_and_page(self):
+        """Test paged queries across segments in both orders."""
+        for offset in range(4):
+            self.store.append(self._record(JAN + offset * 3600))
+            self.store.append(make_session_record("SHORT_BREAK", FEB + offset * 3600, 300, 300, True))
+
+        self.assertEqual(self.store.count(), 8)
+        self.assertEqual(self.store.count("WORK"), 4)
+
+        page = self.store.page(3, 2)
+        self.assertEqual([s["start"] for s in page], [JAN + 3 * 3600, FEB])
+
+        page = self.store.page(0, 3, descending=True, kind="WORK")
+        self.assertEqual([s["start"] for s in page], [JAN + 3 * 3600, JAN + 2 * 3600, JAN + 3600])
+
+    def test_count_tracks_appends(self):
+        """Test cached counts are invalidated when a segment changes."""
+        self.store.append(self._record(JAN))
+        self.assertEqual(self.store.count(), 1)
+        self.store.append(self._record(JAN + 60))
+        self.assertEqual(self.store.count(), 2)
+
+    def test_count_range(self):
+        """Test range counts use the index and honour boundaries."""
+        for offset in range(5):
+            self.store.append(self._record(JAN + offset * 3600))
+        self.store.append(self._record(FEB))
+
+        self.assertEqual(self.store.count_range(JAN + 3600, JAN + 3 * 3600), 2)
+        self.assertEqual(self.store.count_range(since=JAN + 4 * 3600), 2)
+        self.assertEqual(self.store.count_range(), 6)
+
+    def test_index_is_persisted(self):
+        """Test a new store reuses the saved index without decoding segments."""
+        for offset in range(3):
+            self.store.append(self._record(JAN + offset * 3600))
+        self.assertEqual(self.store.count(), 3)
+
+        reopened = HistoryStore(Path(self._tmp.name))
+
+        def fail(key):
+            raise AssertionError(f"segment {key} was decoded")
+
+        reopened.load_segment = fail
+        self.assertEqual(reopened.count(), 3)
+        self.assertEqual(reopened.count_range(JAN, JAN + 3600), 1)
+
+    def test_torn_tail_is_truncated(self):
+        """Test verify() cuts a half-written last line and quarantines it."""
+        now = time.time()
+        self.store.append(self._record(now))
+        path = Path(self._tmp.name) / f"{month_key(now)}.jsonl"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"id":"torn","start":')
+
+        report = self.store.verify()
+
+        self.assertEqual(report["quarantined"], 1)
+        self.assertTrue(path.read_text().endswith("\n"))
+        self.assertEqual(len(list(self.store.iter_sessions())), 1)
+        self.assertEqual(len(list((Path(self._tmp.name) / "quarantine").iterdir())), 1)
+        self.assertEqual(self.store.verify()["repaired"], 0)
+
+    def test_corrupt_lines_are_dropped(self):
+        """Test checksum mismatches are skipped on read and removed by verify()."""
+        now = time.time()
+        for offset in range(3):
+            self.store.append(self._record(now + offset))
+        path = Path(self._tmp.name) / f"{month_key(now)}.jsonl"
+        lines = path.read_text().splitlines(keepends=True)
+        lines[1] = lines[1].replace('"duration":1500', '"duration":9999')
+        path.write_text("".join(lines))
+
+        self.assertEqual(len(list(self.store.iter_sessions())), 2)
+        self.assertEqual(self.store.verify()["quarantined"], 1)
+        self.assertEqual(len(path.read_text().splitlines()), 2)
+
+    def test_damaged_compressed_segment_is_salvaged(self):
+        """Test a compressed segment failing its CRC keeps readable records."""
+        for offset in range(200):
+            self.store.append(self._record(JAN + offset * 60))
+        path = Path(self._tmp.name) / "2024-01.jsonl.gz"
+        data = path.read_bytes()
+        path.write_bytes(data[: len(data) // 2])
+
+        report = self.store.verify()
+
+        self.assertEqual(report["repaired"], 1)
+        recovered = list(self.store.iter_sessions())
+        self.assertTrue(0 < len(recovered) < 200)
+        self.assertEqual(self.store.verify()["repaired"], 0)
+
+    def test_tag_index(self):
+        """Test per-tag counts, totals and filtering use the inverted index."""
+        tags = ["alpha", "beta", None]
+        for offset in range(9):
+            record = make_session_record(
+                "WORK", JAN + offset * 3600, 600 + offset, 1500, True, tag=tags[offset % 3]
+            )
+            self.store.append(record)
+        self.store.append(make_session_record("WORK", FEB, 1500, 1500, True, tag="alpha"))
+
+        self.assertEqual(self.store.tags(), ["alpha", "beta"])
+        self.assertEqual(self.store.count(tag="alpha"), 4)
+        self.assertEqual(self.store.count(kind="SHORT_BREAK", tag="alpha"), 0)
+
+        totals = self.store.tag_totals(since=JAN + 3600, until=FEB)
+        self.assertEqual(totals["alpha"], {"sessions": 2, "seconds": 603 + 606})
+        self.assertEqual(totals["beta"]["sessions"], 3)
+
+        page = self.store.page(1, 10, tag="beta")
+        self.assertEqual([record["duration"] for record in page], [604, 607])
+
+
+if __name__ == "__main__":
+    unittest.main()
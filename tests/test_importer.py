@@ -0,0 +1,101 @@
+"""
+Unit tests for bulk session import.
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.history import HistoryStore
+from src.importer import import_files, normalize_row, plan_shards
+
+
+class TestNormalizeRow(unittest.TestCase):
+    """Test cases for row normalization."""
+
+    def test_iso_start_and_minutes(self):
+        """Test ISO timestamps and minute durations are converted."""
+        record = normalize_row({"Start Time": "2024-01-15T12:00:00+00:00", "Minutes": "25"})
+        self.assertEqual(record["start"], 1705320000.0)
+        self.assertEqual(record["duration"], 1500)
+        self.assertEqual(record["kind"], "WORK")
+
+    def test_millisecond_epoch_and_end(self):
+        """Test millisecond epochs and end times are handled."""
+        record = normalize_row({"start": 1705320000000, "end": 1705320300000, "type": "Short Break"})
+        self.assertEqual(record["start"], 1705320000.0)
+        self.assertEqual(record["duration"], 300)
+        self.assertEqual(record["kind"], "SHORT_BREAK")
+
+    def test_unusable_rows(self):
+        """Test rows without start or duration are rejected."""
+        self.assertIsNone(normalize_row({"start": "not a date", "duration": 60}))
+        self.assertIsNone(normalize_row({"start": 1705320000}))
+
+
+class TestImportFiles(unittest.TestCase):
+    """Test cases for parallel import."""
+
+    def setUp(self):
+        """Create a temporary store and input directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.store = HistoryStore(self.root / "history")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def test_shards_cover_file(self):
+        """Test shards are contiguous and cover the whole file."""
+        path = self.root / "data.jsonl"
+        path.write_text("x" * 1000)
+        shards = plan_shards(path, shard_size=300)
+        self.assertEqual(shards[0][0], 0)
+        self.assertEqual(shards[-1][1], 1000)
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, start)
+
+    def test_import_deduplicates(self):
+        """Test CSV and JSONL imports are merged without duplicates."""
+        base = 1705320000
+        csv_path = self.root / "other.csv"
+        csv_path.write_text(
+            "start,duration,kind\n"
+            + "".join(f"{base + i * 86400},1500,work\n" for i in range(40))
+        )
+        jsonl_path = self.root / "other.jsonl"
+        jsonl_path.write_text(
+            "".join(json.dumps({"start": base + i * 86400, "duration": 1500}) + "\n" for i in range(30, 50))
+            + "not json\n"
+        )
+
+        totals = import_files([csv_path, jsonl_path], self.store, workers=2, shard_size=256)
+
+        self.assertEqual(totals["parsed"], 60)
+        self.assertEqual(totals["rejected"], 1)
+        self.assertEqual(totals["imported"], 50)
+        self.assertEqual(totals["duplicates"], 10)
+        self.assertEqual(len(list(self.store.iter_sessions())), 50)
+
+        # Importing again adds nothing
+        totals = import_files([csv_path], self.store, workers=2)
+        self.assertEqual(totals["imported"], 0)
+
+    def test_byte_order_mark(self):
+        """Test spreadsheet exports starting with a byte order mark are read."""
+        base = 1705320000
+        tsv_path = self.root / "export.tsv"
+        tsv_path.write_text(
+            "start\tduration\tkind\n" + "".join(f"{base + i * 3600}\t1500\twork\n" for i in range(5)),
+            encoding="utf-8-sig",
+        )
+        jsonl_path = self.root / "export.jsonl"
+        jsonl_path.write_text(json.dumps({"start": base - 86400, "duration": 1500}) + "\n", encoding="utf-8-sig")
+
+        totals = import_files([tsv_path, jsonl_path], self.store, workers=2)
+        self.assertEqual((totals["parsed"], totals["rejected"], totals["imported"]), (6, 0, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit tests for merging history stores.
+"""
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.cli import main
+from src.history import HistoryStore, make_session_record
+from src.merge import merge_stores
+
+
+# 2024-01-15 12:00:00 UTC and 2024-02-10 09:00:00 UTC
+JAN = 1705320000.0
+FEB = 1707555600.0
+
+
+class TestMergeStores(unittest.TestCase):
+    """Test cases for merge_stores."""
+
+    def setUp(self):
+        """Set up three stores in a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.laptop = HistoryStore(root / "laptop")
+        self.desktop = HistoryStore(root / "desktop")
+        self.target = HistoryStore(root / "merged")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def _record(self, start, duration=1500):
+        """Build a completed work record."""
+        return make_session_record("WORK", start, duration, 1500, True)
+
+    def test_merge_deduplicates_and_sorts(self):
+        """Test sessions are merged in order without duplicates."""
+        copied = self.laptop.append(self._record(JAN))
+        self.laptop.append(self._record(FEB + 600))
+        self.desktop.append(dict(copied))
+        self.desktop.append(self._record(JAN + 0.4))  # Same session imported again
+        self.desktop.append(self._record(JAN + 3600))
+        self.desktop.append(self._record(FEB))
+
+        totals = merge_stores([self.laptop, self.desktop], self.target, now=FEB + 90 * 86400)
+
+        self.assertEqual(totals, {"sessions": 4, "duplicates": 2, "segments": 2})
+        starts = [record["start"] for record in self.target.iter_sessions()]
+        self.assertEqual(starts, [JAN, JAN + 3600, FEB, FEB + 600])
+        self.assertTrue((self.target.history_dir / "2024-02.jsonl.gz").exists())
+
+    def test_merge_keeps_target_sessions(self):
+        """Test merging into a store keeps its own sessions and is idempotent."""
+        own = self.target.append(self._record(JAN, duration=900))
+        self.laptop.append(self._record(JAN + 7200))
+
+        merge_stores([self.laptop], self.target)
+        totals = merge_stores([self.laptop], self.target)
+
+        self.assertEqual(totals["duplicates"], 1)
+        records = list(self.target.iter_sessions())
+        self.assertEqual([record["id"] for record in records][0], own["id"])
+        self.assertEqual(len(records), 2)
+
+    def test_merge_command_leaves_sources_untouched(self):
+        """Test the merge command only reads the directories it merges in."""
+        self.laptop.append(self._record(JAN))
+        self.laptop.append(self._record(FEB))
+        before = sorted(path.relative_to(self.laptop.history_dir) for path in self.laptop.history_dir.rglob("*"))
+
+        with contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch("src.merge.merge_stores", wraps=merge_stores) as merge:
+            main(["merge", str(self.laptop.history_dir), "--output", str(self.target.history_dir)])
+
+        self.assertTrue(all(source.read_only for source in merge.call_args.args[0]))
+        after = sorted(path.relative_to(self.laptop.history_dir) for path in self.laptop.history_dir.rglob("*"))
+        self.assertEqual(after, before)
+        self.assertEqual(len(list(self.target.iter_sessions())), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Unit tests for calendar parsing and planning pomodoros around meetings.
+"""
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from src.app import PomodoroApp
+from src.ics import occurrences, parse_events
+from src.interval_tree import IntervalTree
+from src.planner import Calendar, fit_work, plan_day
+from src.timer import PomodoroTimer
+
+
+CALENDAR = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+UID:standup
+DTSTART;TZID=Europe/Paris:20240101T093000
+DTEND;TZID=Europe/Paris:20240101T094500
+RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR
+EXDATE;TZID=Europe/Paris:20240103T093000
+SUMMARY:Standup
+END:VEVENT
+BEGIN:VEVENT
+UID:standup
+RECURRENCE-ID;TZID=Europe/Paris:20240104T093000
+DTSTART;TZID=Europe/Paris:20240104T110000
+DTEND;TZID=Europe/Paris:20240104T111500
+SUMMARY:Standup
+  (moved)
+END:VEVENT
+BEGIN:VEVENT
+UID:lunch
+DTSTART:20240102T120000Z
+DURATION:PT1H
+SUMMARY:Lunch
+END:VEVENT
+BEGIN:VEVENT
+UID:focus
+DTSTART:20240102T140000Z
+DURATION:PT1H
+TRANSP:TRANSPARENT
+SUMMARY:Free
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def utc(*args) -> float:
+    """Get the timestamp of a UTC date and time."""
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class TestCalendar(unittest.TestCase):
+    """Test cases for reading meetings from .ics files."""
+
+    def test_recurrence_exceptions_and_overrides(self):
+        """Test weekly rules honour EXDATE, RECURRENCE-ID and time zones."""
+        events = parse_events(CALENDAR)
+        self.assertEqual(sorted(event.summary for event in events), ["Lunch", "Standup", "Standup (moved)"])
+        standup = next(event for event in events if event.rrule)
+
+        starts = [start for start, _ in occurrences(standup, utc(2024, 1, 1), utc(2024, 1, 8))]
+        # Paris is UTC+1 in January; Wednesday is excluded, Thursday moved
+        self.assertEqual(starts, [utc(2024, 1, day, 8, 30) for day in (1, 2, 5)])
+        # Later weeks are reached without expanding the weeks in between
+        starts = [start for start, _ in occurrences(standup, utc(2030, 7, 1), utc(2030, 7, 2))]
+        self.assertEqual(starts, [utc(2030, 7, 1, 7, 30)])
+
+    def test_reparses_when_file_changes(self):
+        """Test the calendar is cached until the file changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "work.ics"
+            path.write_text(CALENDAR, encoding="utf-8")
+            calendar = Calendar(path)
+            day = datetime.fromtimestamp(utc(2024, 1, 2, 12)).date()
+            tree = calendar.busy(day)
+            self.assertIs(calendar.busy(day), tree)
+            self.assertIn("Lunch", [summary for _, _, summary in calendar.meetings(day)])
+
+            path.write_text(CALENDAR.replace("SUMMARY:Lunch", "SUMMARY:Team lunch"), encoding="utf-8")
+            os.utime(path, ns=(0, 0))
+            # Readers keep the last built tree until busy() has parsed the edit
+            self.assertIs(calendar.cached(day), tree)
+            self.assertIn("Team lunch", [summary for _, _, summary in calendar.meetings(day)])
+            self.assertIsNot(calendar.cached(day), tree)
+
+    def test_cached_never_parses(self):
+        """Test cached() returns nothing until busy() has expanded the day."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "work.ics"
+            path.write_text(CALENDAR, encoding="utf-8")
+            calendar = Calendar(path)
+            day = datetime.fromtimestamp(utc(2024, 1, 2, 12)).date()
+            with mock.patch("src.planner.read_events", side_effect=AssertionError("parsed")):
+                self.assertIsNone(calendar.cached(day))
+            tree = calendar.busy(day)
+            self.assertIs(calendar.cached(day), tree)
+
+
+class TestPlanner(unittest.TestCase):
+    """Test cases for fitting sessions between meetings."""
+
+    def setUp(self):
+        """Create a morning with two meetings."""
+        self.tree = IntervalTree([
+            (utc(2024, 1, 2, 10), utc(2024, 1, 2, 10, 30), "Review"),
+            (utc(2024, 1, 2, 9), utc(2024, 1, 2, 9, 15), "Standup"),
+        ])
+
+    def test_first_overlap(self):
+        """Test the earliest overlapping meeting is found."""
+        self.assertEqual(self.tree.first_overlap(utc(2024, 1, 2, 8), utc(2024, 1, 2, 12))[2], "Standup")
+        self.assertEqual(self.tree.first_overlap(utc(2024, 1, 2, 9, 15), utc(2024, 1, 2, 12))[2], "Review")
+        self.assertIsNone(self.tree.first_overlap(utc(2024, 1, 2, 9, 15), utc(2024, 1, 2, 10)))
+        self.assertEqual(len(self.tree.overlapping(utc(2024, 1, 2, 8), utc(2024, 1, 2, 12))), 2)
+
+    def test_fit_work(self):
+        """Test sessions are shortened before meetings or skipped."""
+        self.assertEqual(fit_work(self.tree, utc(2024, 1, 2, 8), 1500), (1500, None))
+        seconds, meeting = fit_work(self.tree, utc(2024, 1, 2, 8, 45), 1500)
+        self.assertEqual((seconds, meeting[2]), (900, "Standup"))
+        self.assertEqual(fit_work(self.tree, utc(2024, 1, 2, 8, 55), 1500)[0], 0)
+
+    def test_plan_day(self):
+        """Test the plan never overlaps a meeting with a work session."""
+        blocks = plan_day(self.tree, utc(2024, 1, 2, 8, 30), utc(2024, 1, 2, 11), 1500, 300, 900, 4)
+        work = [block for block in blocks if block["kind"] == "WORK"]
+        for block in work:
+            self.assertIsNone(self.tree.first_overlap(block["start"], block["end"]))
+        self.assertEqual(work[0]["end"], utc(2024, 1, 2, 8, 55))
+        self.assertEqual(work[1]["start"], utc(2024, 1, 2, 9, 15))
+        self.assertTrue(any(block["shortened"] and block["before"] == "Review" for block in work))
+        self.assertLessEqual(blocks[-1]["end"], utc(2024, 1, 2, 11))
+
+
+class TestStartButton(unittest.TestCase):
+    """Test cases for starting sessions around meetings from the UI."""
+
+    def test_start_button_shortens_session(self):
+        """Test clicking Start ends the session before an upcoming meeting, like the keyboard."""
+        meeting_start = datetime.fromtimestamp(time.time() + 15 * 60, tz=timezone.utc)
+        ics = (
+            "BEGIN:VCALENDAR\nBEGIN:VEVENT\nUID:sync\n"
+            f"DTSTART:{meeting_start:%Y%m%dT%H%M%S}Z\nDURATION:PT30M\nSUMMARY:Sync\n"
+            "END:VEVENT\nEND:VCALENDAR\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "work.ics"
+            path.write_text(ics, encoding="utf-8")
+            app = mock.Mock()
+            app.timer = PomodoroTimer(work_duration=25)
+            app.calendar = Calendar(path)
+            app._todays_meetings = lambda: PomodoroApp._todays_meetings(app)
+            app._planned_work_seconds = lambda: PomodoroApp._planned_work_seconds(app)
+            event = mock.Mock()
+            event.button.id = "btn-start"
+            # Until the worker has read the calendar, Start neither waits for it nor plans
+            with mock.patch("src.planner.read_events", side_effect=AssertionError("parsed on the UI thread")):
+                self.assertIsNone(app._planned_work_seconds())
+
+            app.calendar.busy(datetime.now().date())
+            try:
+                PomodoroApp.on_button_pressed(app, event)
+                total = app.timer.total_seconds
+            finally:
+                app.timer.stop()
+        self.assertLess(total, 25 * 60)
+        self.assertAlmostEqual(total, 15 * 60, delta=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Unit tests for duration recommendations.
+"""
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from src.history import HistoryStore, make_session_record
+from src.recommendations import Recommendations, analyze, history_columns
+
+
+class TestRecommendations(unittest.TestCase):
+    """Test cases for the history analysis."""
+
+    def setUp(self):
+        """Set up a store with a few weeks of sessions."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(Path(self._tmp.name))
+        records = []
+        for day in range(1, 21):
+            # 25-minute sessions at 9:00 go well, 45-minute ones at 15:00 do not
+            morning = datetime(2024, 3, day, 9).timestamp()
+            records.append(make_session_record("SHORT_BREAK", morning - 600, 300, 300, True))
+            records.append(make_session_record("WORK", morning, 1500, 1500, True))
+            afternoon = datetime(2024, 3, day, 15).timestamp()
+            records.append(make_session_record("LONG_BREAK", afternoon - 1200, 900, 900, True))
+            records.append(
+                make_session_record("WORK", afternoon, 2700, 2700, day % 4 == 0, pauses=day % 2)
+            )
+        self.store.bulk_load("2024-03", records)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def test_analysis(self):
+        """Test groups, suggested durations and productive hours."""
+        results = analyze(history_columns(self.store))
+
+        self.assertEqual(results["work_sessions"], 40)
+        self.assertEqual(results["by_length"][25], {"sessions": 20, "rate": 1.0})
+        self.assertLess(results["by_length"][45]["rate"], 0.5)
+        self.assertTrue(25 <= results["work_duration"] < 45)
+        self.assertEqual(results["short_break"], 5)
+        self.assertEqual(results["best_hours"][0], 9)
+
+    def test_empty_history(self):
+        """Test an empty history yields no suggestions."""
+        empty = HistoryStore(Path(self._tmp.name) / "empty")
+        results = analyze(history_columns(empty))
+        self.assertIsNone(results["work_duration"])
+        self.assertEqual(results["best_hours"], [])
+
+    def test_results_are_cached(self):
+        """Test results are reused until enough new sessions arrive."""
+        recommendations = Recommendations(self.store)
+        first = recommendations.get()
+
+        with mock.patch("src.recommendations.analyze", side_effect=AssertionError("recomputed")):
+            self.assertEqual(Recommendations(self.store).get(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for focus reports.
+"""
+import io
+import tempfile
+import time
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.history import HistoryStore, make_session_record
+from src.report import period_bounds, summarize, summarize_team, write_report
+from src.stats import Rollups
+
+
+class TestReport(unittest.TestCase):
+    """Test cases for report summaries and rendering."""
+
+    def setUp(self):
+        """Set up two member histories with sessions today."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.team_dir = Path(self._tmp.name) / "team"
+        self.today = date.today()
+        noon = time.mktime(self.today.timetuple()) + 12 * 3600
+        for name, tag, count in (("alice", "api", 2), ("bob", "docs <b>", 3)):
+            store = HistoryStore(self.team_dir / name)
+            for i in range(count):
+                store.append(make_session_record("WORK", noon + i * 1800, 1500, 1500, True, tag=tag))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def test_period_bounds(self):
+        """Test week and month periods end today."""
+        start, end = period_bounds("week", date(2024, 6, 13))
+        self.assertEqual((start, end), (date(2024, 6, 10), date(2024, 6, 13)))
+        self.assertEqual(period_bounds("month", date(2024, 6, 13))[0], date(2024, 6, 1))
+
+    def test_markdown_report(self):
+        """Test a single history renders totals, tags and the heatmap."""
+        rollups = Rollups(HistoryStore(self.team_dir / "alice"), daily_goal=2)
+        summary = summarize(rollups, self.today - timedelta(days=6), self.today)
+        self.assertEqual(summary["totals"]["pomodoros"], 2)
+        self.assertEqual(summary["goal_days"], 1)
+
+        out = io.StringIO()
+        write_report(summary, "markdown", out)
+        text = out.getvalue()
+        self.assertIn("| Focus | 50m |", text)
+        self.assertIn("| api | 2 | 50m |", text)
+        self.assertIn("▒", text)
+
+    def test_team_report(self):
+        """Test member summaries are combined and HTML output is escaped."""
+        before = sorted(path.relative_to(self.team_dir) for path in self.team_dir.rglob("*"))
+        summary = summarize_team(self.team_dir, self.today, self.today, daily_goal=3, workers=2)
+        # The member histories are inputs; the report writes nothing into them
+        self.assertEqual(sorted(path.relative_to(self.team_dir) for path in self.team_dir.rglob("*")), before)
+        self.assertEqual(summary["totals"]["pomodoros"], 5)
+        self.assertEqual([member["name"] for member in summary["members"]], ["alice", "bob"])
+        self.assertEqual([member["goal_days"] for member in summary["members"]], [0, 1])
+
+        out = io.StringIO()
+        write_report(summary, "html", out)
+        text = out.getvalue()
+        self.assertIn("docs &lt;b&gt;", text)
+        self.assertIn("p50 25m", text)
+
+    def test_markdown_cells_are_escaped(self):
+        """Test member names and tags cannot break out of their table cells."""
+        team_dir = Path(self._tmp.name) / "other"
+        noon = time.mktime(self.today.timetuple()) + 12 * 3600
+        HistoryStore(team_dir / "qa|ops").append(
+            make_session_record("WORK", noon, 1500, 1500, True, tag="a\\|b\nc")
+        )
+        summary = summarize_team(team_dir, self.today, self.today, workers=1)
+
+        out = io.StringIO()
+        write_report(summary, "markdown", out)
+        text = out.getvalue()
+        self.assertIn("| qa\\|ops | 1 | 25m |", text)
+        self.assertIn("| a\\\\\\|b c | 1 | 25m |", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
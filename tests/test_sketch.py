@@ -0,0 +1,52 @@
+"""
+Unit tests for the quantile sketch.
+"""
+import random
+import unittest
+
+from src.sketch import MAX_SKETCH_BUCKETS, SKETCH_ACCURACY, QuantileSketch
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test cases for the QuantileSketch class."""
+
+    def test_relative_accuracy(self):
+        """Test quantiles stay within the relative accuracy."""
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(7, 0.5) for _ in range(10000))
+        sketch = QuantileSketch()
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.1, 0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=SKETCH_ACCURACY * 1.01)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merged sketches equal one sketch over all values."""
+        first, second, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(0, 3000, 7):
+            (first if value % 2 else second).add(value)
+            combined.add(value)
+
+        first.merge(second)
+        self.assertEqual(first.count, combined.count)
+        self.assertEqual(first.buckets, combined.buckets)
+        with self.assertRaises(ValueError):
+            first.merge(QuantileSketch(accuracy=0.05))
+
+    def test_memory_is_bounded_and_roundtrips(self):
+        """Test the bucket cap and dictionary round trip."""
+        sketch = QuantileSketch(accuracy=0.001)
+        for exponent in range(2000):
+            sketch.add(1.01 ** exponent)
+        self.assertLessEqual(len(sketch.buckets), MAX_SKETCH_BUCKETS)
+        self.assertEqual(sketch.count, 2000)
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+        self.assertEqual(restored.quantile(0.9), sketch.quantile(0.9))
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
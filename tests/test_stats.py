@@ -0,0 +1,134 @@
+"""
+Unit tests for history rollups.
+"""
+import tempfile
+import time
+import unittest
+from unittest import mock
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from src import stats
+from src.config_schema import parse_settings
+from src.history import HistoryStore, make_session_record
+from src.stats import Rollups
+
+
+class TestRollups(unittest.TestCase):
+    """Test cases for the Rollups class."""
+
+    def setUp(self):
+        """Set up a store and rollups in a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(Path(self._tmp.name))
+        self.rollups = self._attach(Rollups(self.store))
+        self.now = time.time()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def _attach(self, rollups):
+        """Subscribe rollups to the store like get_rollups does."""
+        self.store.on("append", rollups.add)
+        self.store.on("change", rollups.invalidate)
+        return rollups
+
+    def test_incremental_append(self):
+        """Test appended sessions are added to today's bucket."""
+        self.store.append(make_session_record("WORK", self.now, 1500, 1500, True))
+        self.store.append(make_session_record("WORK", self.now, 600, 1500, False))
+        self.store.append(make_session_record("SHORT_BREAK", self.now, 300, 300, True))
+
+        bucket = self.rollups.day(date.today())
+        self.assertEqual(bucket["focus_seconds"], 2100)
+        self.assertEqual(bucket["pomodoros"], 1)
+        self.assertEqual(bucket["break_seconds"], 300)
+        self.assertEqual(bucket["sessions"], 3)
+
+    def test_edit_triggers_rebuild(self):
+        """Test edits mark the rollups stale and rebuild on access."""
+        record = self.store.append(make_session_record("WORK", self.now, 1500, 1500, True))
+        epoch = self.rollups.epoch
+        self.store.update(dict(record, duration=900))
+
+        self.assertGreater(self.rollups.epoch, epoch)
+        self.assertEqual(self.rollups.day(date.today())["focus_seconds"], 900)
+
+    def test_persisted_rollups_are_reused(self):
+        """Test saved rollups load without a rebuild when history is unchanged."""
+        self.store.append(make_session_record("WORK", self.now, 1500, 1500, True))
+
+        reloaded = Rollups(self.store)
+        self.assertFalse(reloaded._stale)
+        self.assertEqual(reloaded.day(date.today())["pomodoros"], 1)
+
+        # A write the rollups did not see invalidates the saved file
+        other = HistoryStore(Path(self._tmp.name))
+        other.append(make_session_record("WORK", self.now, 1500, 1500, True))
+        self.assertTrue(Rollups(self.store)._stale)
+
+    def test_totals(self):
+        """Test totals over a range of days."""
+        yesterday = self.now - 86400
+        self.store.append(make_session_record("WORK", yesterday, 1500, 1500, True))
+        self.store.append(make_session_record("WORK", self.now, 1500, 1500, True))
+
+        today = date.today()
+        totals = self.rollups.totals(today - timedelta(days=6), today)
+        self.assertEqual(totals["pomodoros"], 2)
+        self.assertEqual(totals["focus_seconds"], 3000)
+
+    def test_streaks(self):
+        """Test streaks advance incrementally and rebuild after edits."""
+        rollups = self._attach(Rollups(self.store, daily_goal=2))
+        rollups.ensure_fresh()
+        self.rollups.ensure_fresh()
+        today = date.today()
+        records = []
+        with mock.patch.object(self.store, "iter_sessions", side_effect=AssertionError("rescan")):
+            for days_ago in (2, 1, 0):
+                midnight = datetime.combine(today - timedelta(days=days_ago), datetime.min.time())
+                start = midnight.timestamp() + 12 * 3600
+                for offset in range(2):
+                    record = make_session_record("WORK", start + offset * 1800, 1500, 1500, True)
+                    records.append(self.store.append(record))
+
+            self.assertEqual(rollups.streaks(today), {"current": 3, "longest": 3})
+            self.assertEqual(rollups.streaks(today + timedelta(days=2))["current"], 0)
+
+        self.store.delete(records[2])
+        self.assertEqual(rollups.streaks(today), {"current": 1, "longest": 1})
+    def test_quantiles_merge_days_and_weeks(self):
+        """Test sketch quantiles over ranges and after a reload."""
+        today = date.today()
+        midnight = datetime.combine(today, datetime.min.time()).timestamp()
+        for days_ago in range(20):
+            start = midnight - days_ago * 86400 + 10 * 3600
+            duration = 1200 if days_ago % 2 else 1500
+            self.store.append(make_session_record("WORK", start, duration, 1500, True))
+
+        first = today - timedelta(days=19)
+        quantiles = self.rollups.quantiles("focus_length", first, today, qs=(0.1, 0.9))
+        self.assertAlmostEqual(quantiles[0.1], 1200, delta=1200 * 0.02)
+        self.assertAlmostEqual(quantiles[0.9], 1500, delta=1500 * 0.02)
+        self.assertEqual(self.rollups.sketch("focus_length", first, today).count, 20)
+
+        reloaded = Rollups(self.store)
+        self.assertEqual(reloaded.sketch("start_minute", first, today).count, 20)
+        self.assertIsNone(reloaded.quantiles("pause_seconds", first, today)[0.5])
+
+    def test_global_rollups_use_validated_goal(self):
+        """Test an invalid daily goal in the config falls back to the default."""
+        settings, _ = parse_settings({"goals": {"daily_pomodoros": 0}})
+        config = mock.Mock(settings=settings)
+        with mock.patch.object(stats, "_rollups", None), \
+                mock.patch("src.stats.get_config", return_value=config), \
+                mock.patch("src.stats.get_history_store", return_value=self.store):
+            self.assertEqual(stats.get_rollups().daily_goal, settings.goals.daily_pomodoros)
+        self.assertEqual(settings.goals.daily_pomodoros, 8)
+        config.get.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
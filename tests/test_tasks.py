@@ -0,0 +1,111 @@
+"""
+Unit tests for the task list and its fuzzy search index.
+"""
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.task_index import TaskIndex
+from src.tasks import TaskStore
+
+
+class TestTaskIndex(unittest.TestCase):
+    """Test cases for the TaskIndex class."""
+
+    def setUp(self):
+        """Index a few titles."""
+        self.index = TaskIndex()
+        self.index.add("a", "Fix login bug")
+        self.index.add("b", "Write release notes")
+        self.index.add("c", "Refactor logging")
+
+    def test_fuzzy_match(self):
+        """Test words match as subsequences, best matches first."""
+        self.assertEqual(self.index.search("lgn"), ["a", "c"])
+        self.assertEqual(self.index.search("log fix"), ["a"])
+        self.assertEqual(self.index.search("logging"), ["c"])
+        self.assertEqual(self.index.search("rel nts"), ["b"])
+        self.assertEqual(self.index.search("xyz"), [])
+
+    def test_edits_update_cached_queries(self):
+        """Test adds, renames and removals show up in repeated queries."""
+        self.assertEqual(self.index.search("log"), ["a", "c"])
+        self.index.add("d", "Blog post")
+        self.index.add("a", "Fix signup bug")
+        self.index.remove("c")
+        self.assertEqual(self.index.search("log"), ["d"])
+        self.assertEqual(self.index.search("sgnup"), ["a"])
+        self.assertEqual(len(self.index), 3)
+
+
+class TestTaskStore(unittest.TestCase):
+    """Test cases for the TaskStore class."""
+
+    def setUp(self):
+        """Set up a store in a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "tasks.jsonl"
+        self.store = TaskStore(self.path)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self._tmp.cleanup()
+
+    def test_changes_survive_reload(self):
+        """Test tasks, pomodoro counts and deletions are persisted."""
+        report = self.store.add("Quarterly report")
+        review = self.store.add("Code review")
+        gone = self.store.add("Old task")
+        self.store.add_pomodoro(report["id"])
+        self.store.set_done(review["id"])
+        self.store.delete(gone["id"])
+
+        reloaded = TaskStore(self.path)
+        self.assertEqual(reloaded.get(report["id"])["pomodoros"], 1)
+        self.assertIsNone(reloaded.get(gone["id"]))
+        self.assertEqual([task["title"] for task in reloaded.search("")], ["Quarterly report"])
+        self.assertEqual(reloaded.search("code"), [])
+
+    def test_log_is_compacted(self):
+        """Test superseded lines are dropped once they pile up."""
+        task = self.store.add("Counted task")
+        with mock.patch("src.tasks.COMPACT_AFTER", 5):
+            for _ in range(10):
+                self.store.add_pomodoro(task["id"])
+        with open(self.path, encoding="utf-8") as f:
+            self.assertLess(len(f.readlines()), 6)
+        self.assertEqual(TaskStore(self.path).get(task["id"])["pomodoros"], 10)
+
+    def test_search_waits_for_background_load(self):
+        """Test searches during a background load see the whole list, not part of it."""
+        for number in range(20):
+            self.store.add(f"Fix bug {number}")
+        store = TaskStore(self.path)
+        halfway, resume = threading.Event(), threading.Event()
+        add = store.index.add
+
+        def slow_add(key, title):
+            if title == "Fix bug 10":
+                halfway.set()
+                resume.wait(5)
+            add(key, title)
+
+        results = []
+        with mock.patch.object(store.index, "add", side_effect=slow_add):
+            loader = threading.Thread(target=store.load)
+            loader.start()
+            self.assertTrue(halfway.wait(5))
+            searcher = threading.Thread(target=lambda: results.append(store.search("fix")))
+            searcher.start()
+            searcher.join(0.2)
+            self.assertEqual(results, [])
+            resume.set()
+            loader.join()
+            searcher.join()
+        self.assertEqual(len(results[0]), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,11 @@ Integration tests for UI components and timer integration.
 """
 import unittest
 import sys
+from datetime import date, timedelta
 from pathlib import Path
+from unittest import mock
+
+from rich.text import Text
 
 # Add src to path
 src_path = Path(__file__).parent.parent / "src"
@@ -12,6 +16,9 @@ sys.path.insert(0, str(src_path))
 from src.timer import PomodoroTimer, TimerState
 from src.components.timer_display import TimerDisplay
 from src.components.progress_bar import PomodoroProgressBar
+from src.components.heatmap import focus_level, render_heatmap, HEATMAP_WEEKS
+from src.components.history_browser import HistoryBrowser
+from src.components.stats_screen import StatsScreen
 
 
 class TestTimerDisplay(unittest.TestCase):
@@ -69,6 +76,88 @@ class TestProgressBar(unittest.TestCase):
         self.assertEqual(bar.get_progress_percentage(), 75)
 
 
+class TestFocusHeatmap(unittest.TestCase):
+    """Test FocusHeatmap rendering."""
+
+    class _Rollups:
+        """Minimal rollups stand-in with a fixed focus time per day."""
+
+        def iter_days(self, start, end):
+            current = start
+            while current <= end:
+                yield current, {"focus_seconds": 3000}
+                current += timedelta(days=1)
+
+    def test_focus_levels(self):
+        """Test focus minutes map to increasing levels."""
+        self.assertEqual(focus_level(0), 0)
+        self.assertEqual(focus_level(25 * 60), 2)
+        self.assertEqual(focus_level(300 * 60), 4)
+
+    def test_render_dimensions(self):
+        """Test the heatmap has a label row plus one row per weekday."""
+        lines = render_heatmap(self._Rollups(), date(2024, 6, 2), "#000000", "#00ff00")
+        self.assertEqual(len(lines), 8)
+        # 2024-06-02 is a Sunday, so every row is a full year of weeks
+        self.assertEqual(lines[7].text, "Sun " + "■" * HEATMAP_WEEKS)
+
+
+class TestTagMarkup(unittest.TestCase):
+    """Test user tags are shown literally, not read as markup."""
+
+    TAGS = ["[/x]", "[bold]"]
+
+    def test_stats_top_tags(self):
+        """Test bracketed tags in the top tags list render as typed."""
+        rollups = mock.Mock()
+        rollups.store.tag_totals.return_value = {tag: {"sessions": 1, "seconds": 1500} for tag in self.TAGS}
+        text = Text.from_markup(StatsScreen(rollups)._tag_summary()).plain
+        for tag in self.TAGS:
+            self.assertIn(tag, text)
+
+    def test_history_tag_filter(self):
+        """Test a bracketed tag filter renders as typed in the status line."""
+        browser = HistoryBrowser(mock.Mock())
+        browser.tags = [None, "[/x]"]
+        browser.tag_index = 1
+        status = mock.Mock()
+        with mock.patch.object(HistoryBrowser, "query_one", side_effect=[mock.Mock(total=3), status]):
+            browser._reload()
+        self.assertIn("#[/x]", Text.from_markup(status.update.call_args.args[0]).plain)
+
+
+class TestStatsSuggestions(unittest.TestCase):
+    """Test the suggestions placeholder is always replaced."""
+
+    def test_worker_error_replaces_placeholder(self):
+        """Test a failing recommendation fit shows a message instead of hanging."""
+        screen = StatsScreen(mock.Mock())
+        app = mock.Mock()
+        app.call_from_thread.side_effect = lambda callback, *args: callback(*args)
+        suggestions = mock.Mock()
+        with mock.patch("src.recommendations.Recommendations") as recommendations, \
+                mock.patch.object(StatsScreen, "app", new_callable=mock.PropertyMock, return_value=app), \
+                mock.patch.object(StatsScreen, "is_mounted", new_callable=mock.PropertyMock, return_value=True), \
+                mock.patch.object(StatsScreen, "query_one", return_value=suggestions), \
+                mock.patch("builtins.print") as printed:
+            recommendations.return_value.get.side_effect = ValueError("SVD did not converge")
+            screen._load_suggestions()
+        text = Text.from_markup(suggestions.update.call_args.args[0]).plain
+        self.assertIn("could not be computed", text)
+        self.assertNotIn("Analyzing", text)
+        self.assertIn("SVD did not converge", app.notify.call_args.args[0])
+        printed.assert_not_called()
+
+    def test_worker_bug_is_not_hidden(self):
+        """Test programming errors in the fit are not reported as missing data."""
+        screen = StatsScreen(mock.Mock())
+        with mock.patch("src.recommendations.Recommendations") as recommendations, \
+                mock.patch.object(StatsScreen, "app", new_callable=mock.PropertyMock, return_value=mock.Mock()):
+            recommendations.return_value.get.side_effect = KeyError("work_duration")
+            with self.assertRaises(KeyError):
+                screen._load_suggestions()
+
+
 class TestTimerIntegration(unittest.TestCase):
     """Test timer integration with UI components."""
 